@@ -118,6 +118,7 @@ from gensim.parsing.preprocessing import STOPWORDS
 from gensim.models import LdaModel
 from gensim import corpora
 from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
 from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 import nltk
@@ -142,7 +143,7 @@ import matplotlib.pyplot as plt
 import sqlite3
 import requests
 from bs4 import BeautifulSoup
-from urllib.parse import urljoin, quote_plus
+from urllib.parse import urljoin, quote_plus, urlparse
 import logging
 import csv
 import json
@@ -150,11 +151,17 @@ import yaml
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Dict
+from typing import Any, Dict, Final, List, Optional, Tuple
 from abc import ABC, abstractmethod
+import asyncio
 import functools
+import gzip
+import itertools
+import operator
+import os
 import secrets
-import shutil
+import sys
+import threading
 import bcrypt
 
 # APScheduler imports for scheduling functionality
@@ -247,6 +254,8 @@ GEMINI_API_URL_TEMPLATE = (
 GEMINI_API_KEY = env_vars.get("GEMINI_API_KEY", "")
 OPENAI_API_KEY = env_vars.get("OPENAI_API_KEY", "")
 CLAUDE_API_KEY = env_vars.get("CLAUDE_API_KEY", "")
+# Canonical sentiment labels (shared by AI providers and the sentiment filter)
+_VALID_SENTIMENTS = frozenset({"Positive", "Negative", "Neutral"})
 
 logging.basicConfig(
     level=env_vars.get("LOG_LEVEL", "DEBUG"),
@@ -286,14 +295,30 @@ def parse_db_datetime(iso_string: Optional[str]) -> Optional[datetime]:
 
 
 # --- Database Utilities ---
+# WAL lets exports/reads overlap scrape inserts; the rest trims fsyncs and syscalls
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+)
+_wal_enabled_paths: set = set()
+
+
 def get_db_connection():
     try:
         # Python 3.12+ compatible: no automatic datetime conversion
         # Datetime values stored as ISO strings, no adapters needed
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, cached_statements=256)
         conn.row_factory = sqlite3.Row
         # Enable foreign key constraints (required for v2.0.0 multi-user support)
         conn.execute("PRAGMA foreign_keys = ON")
+        # journal_mode=WAL persists in the file; only switch it once per path
+        if str(DB_PATH) not in _wal_enabled_paths:
+            conn.execute("PRAGMA journal_mode = WAL")
+            _wal_enabled_paths.add(str(DB_PATH))
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
     except sqlite3.Error as e:
         logger.critical(f"DB connection error: {e}", exc_info=True)
@@ -531,7 +556,13 @@ def migrate_database_to_v2() -> bool:
                 db_path = Path(DB_PATH) if isinstance(DB_PATH, str) else DB_PATH
                 if db_path != Path(":memory:"):
                     backup_path = db_path.with_suffix('.db.backup-v1')
-                    shutil.copy2(db_path, backup_path)
+                    # Snapshot through SQLite so pages still in the WAL are
+                    # included (a raw file copy would miss them)
+                    backup_conn = sqlite3.connect(str(backup_path))
+                    try:
+                        conn.backup(backup_conn)
+                    finally:
+                        backup_conn.close()
                     logger.info(f"Database backed up to {backup_path}")
 
             # Create new tables for v2.0
@@ -1232,6 +1263,14 @@ def init_db():
                 "CREATE INDEX IF NOT EXISTS idx_title ON scraped_data (title);",
                 "CREATE INDEX IF NOT EXISTS idx_sentiment "
                 "ON scraped_data (sentiment);",
+                # Match the NOCASE / composite ORDER BYs in SORT_OPTIONS so
+                # sorted listings and exports avoid a temp b-tree sort
+                "CREATE INDEX IF NOT EXISTS idx_title_nocase "
+                "ON scraped_data (title COLLATE NOCASE);",
+                "CREATE INDEX IF NOT EXISTS idx_url_nocase "
+                "ON scraped_data (url COLLATE NOCASE);",
+                "CREATE INDEX IF NOT EXISTS idx_sentiment_timestamp "
+                "ON scraped_data (sentiment, timestamp DESC);",
                 "CREATE INDEX IF NOT EXISTS idx_tag_name ON tags (name);",
                 "CREATE INDEX IF NOT EXISTS idx_article_tags_article "
                 "ON article_tags (article_id);",
@@ -1266,16 +1305,9 @@ def init_db():
             ]
             for idx_sql in index_statements:
                 conn.execute(idx_sql)
-            for ps in PREINSTALLED_SCRAPERS:
-                conn.execute("""
-                    INSERT OR IGNORE INTO saved_scrapers (
-                        name, url, selector, default_limit,
-                        default_tags_csv, description, is_preinstalled
-                    )
-                    VALUES (?, ?, ?, ?, ?, ?, 1)
-                """, (ps["name"], ps["url"], ps["selector"],
-                      ps["default_limit"], ps["default_tags_csv"],
-                      ps["description"]))
+            _bulk_upsert_scrapers(
+                conn, [{**ps, "is_preinstalled": 1} for ps in PREINSTALLED_SCRAPERS],
+                overwrite=False)
 
             # Insert built-in summarization templates
             builtin_templates = [
@@ -1314,6 +1346,39 @@ def init_db():
         return False
 
 
+_SCRAPER_UPSERT_SQL = (
+    "INSERT INTO saved_scrapers (name, url, selector, default_limit, "
+    "default_tags_csv, description, is_preinstalled) "
+    "VALUES (:name, :url, :selector, :default_limit, :default_tags_csv, "
+    ":description, :is_preinstalled) ON CONFLICT(name) DO "
+)
+_SCRAPER_UPSERT_UPDATE = (
+    "UPDATE SET url = excluded.url, selector = excluded.selector, "
+    "default_limit = excluded.default_limit, "
+    "default_tags_csv = excluded.default_tags_csv, "
+    "description = excluded.description"
+)
+
+
+def _bulk_upsert_scrapers(conn: sqlite3.Connection, rows: List[Dict[str, Any]],
+                          overwrite: bool = True) -> None:
+    """
+    Insert many saved scrapers with a single executemany.
+
+    Runs inside the caller's transaction. Existing rows are matched on the
+    unique name and updated in place (keeping their id, so scheduled scrapes
+    referencing them survive), or left untouched when overwrite is False.
+    """
+    conn.executemany(_SCRAPER_UPSERT_SQL + (_SCRAPER_UPSERT_UPDATE if overwrite else "NOTHING"), rows)
+
+
+def _bulk_upsert_scrapers_blocking(rows: List[Dict[str, Any]]) -> None:
+    """Upsert many saved scrapers in one transaction (one commit for N rows)."""
+    with get_db_connection() as conn:
+        _bulk_upsert_scrapers(conn, [{"is_preinstalled": 0, **row} for row in rows])
+        conn.commit()
+
+
 def get_tags_for_article(conn: sqlite3.Connection, article_id: int) -> List[str]:
     cursor = conn.execute(
         "SELECT t.name FROM tags t "
@@ -1324,6 +1389,115 @@ def get_tags_for_article(conn: sqlite3.Connection, article_id: int) -> List[str]
     return [row['name'] for row in cursor.fetchall()]
 
 
+def build_tag_filter_condition(tag_names: List[str], match_all: bool = True) -> Tuple[str, Dict[str, str]]:
+    """
+    Build a single ``sd.id IN (...)`` condition for a tag filter.
+
+    All tags are matched in one grouped subquery over article_tags/tags,
+    with the tag list bound as one JSON array and expanded by json_each(),
+    so the SQL text is the same for any number of tags.
+
+    Args:
+        tag_names: Normalized (lowercase) tag names
+        match_all: True for AND logic (article has every tag), False for OR
+
+    Returns:
+        Tuple of (SQL condition, named parameters)
+    """
+    params = {"tags": json.dumps(list(dict.fromkeys(tag_names)))}
+    return (_TAG_FILTER_ALL_SQL if match_all else _TAG_FILTER_ANY_SQL), params
+
+
+# Tag filter conditions; :tags is a JSON array of distinct, normalized tag names
+_TAG_FILTER_ANY_SQL = (
+    "sd.id IN (SELECT at_s.article_id FROM article_tags at_s "
+    "JOIN tags t_s ON at_s.tag_id = t_s.id "
+    "JOIN json_each(:tags) je ON je.value = t_s.name)"
+)
+_TAG_FILTER_ALL_SQL = (
+    _TAG_FILTER_ANY_SQL[:-1]
+    + " GROUP BY at_s.article_id HAVING COUNT(*) = json_array_length(:tags))"
+)
+
+
+# Tags are aggregated per row by a correlated subquery on the article_tags
+# primary key, so rows stream in sort order without a join, GROUP BY or temp
+# b-tree. (article_id, tag_id) is that primary key, so no DISTINCT is needed.
+_TAGS_COLUMN_SQL = (
+    "(SELECT GROUP_CONCAT(t.name) FROM article_tags at "
+    "JOIN tags t ON at.tag_id = t.id WHERE at.article_id = sd.id) AS tags_c"
+)
+_EXPORT_BASE_SQL = (
+    "SELECT sd.id, sd.title, sd.url, sd.link, sd.timestamp, "
+    "sd.summary, sd.sentiment, {content_col}" + _TAGS_COLUMN_SQL
+    + " FROM scraped_data sd"
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _export_where_for(has_title: bool, has_url: bool, has_date: bool, has_tags: bool,
+                      has_sentiment: bool) -> str:
+    """WHERE clause (or "") shared by the export queries for one filter shape."""
+    conds = []
+    if has_title:
+        conds.append("sd.title LIKE :tf")
+    if has_url:
+        conds.append("sd.url LIKE :uf")
+    if has_date:
+        conds.append("date(sd.timestamp) = :df")
+    if has_tags:
+        conds.append(_TAG_FILTER_ALL_SQL)
+    if has_sentiment:
+        conds.append("sd.sentiment LIKE :sf")
+    return " WHERE " + " AND ".join(conds) if conds else ""
+
+
+@functools.lru_cache(maxsize=64)
+def _export_sql_for(filter_shape: Tuple[bool, bool, bool, bool, bool], sort_col: str,
+                    include_content: bool = False) -> str:
+    """Assemble (once per filter shape) the SQL used by the export paths."""
+    sql = _EXPORT_BASE_SQL.format(content_col="sd.content, " if include_content else "")
+    return sql + _export_where_for(*filter_shape) + " ORDER BY " + sort_col
+
+
+# Export parameter name and value builder for each filter, in filter-shape order
+_EXPORT_PARAM_BUILDERS: Tuple[Tuple[str, Any], ...] = (
+    ("tf", lambda v: f"%{v}%"),
+    ("uf", lambda v: f"%{v}%"),
+    ("df", lambda v: v),
+    ("tags", json.dumps),
+    ("sf", lambda v: f"%{v.strip().capitalize()}%"),
+)
+
+
+def _export_filter_params(title_filter: str, url_filter: str, date_filter: str, tags_filter: str,
+                          sentiment_filter: str) -> Tuple[Tuple[bool, bool, bool, bool, bool], Dict[str, Any]]:
+    """Named parameters for the export filters plus the shape key used for SQL caching."""
+    tag_names = list(dict.fromkeys(
+        t.strip().lower() for t in tags_filter.split(',') if t.strip())) if tags_filter else []
+    shape = (bool(title_filter), bool(url_filter), bool(date_filter), bool(tag_names), bool(sentiment_filter))
+    values = (title_filter, url_filter, date_filter, tag_names, sentiment_filter)
+    params = {key: build(value)
+              for is_set, (key, build), value in zip(shape, _EXPORT_PARAM_BUILDERS, values) if is_set}
+    return shape, params
+
+
+def build_export_query(title_filter: str, url_filter: str, date_filter: str, tags_filter: str,
+                       sentiment_filter: str, sort_col: str,
+                       include_content: bool = False) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build the filtered export query and its parameters.
+
+    The SQL text is memoized per filter shape (which filters are set, sort
+    column), so repeat exports only rebuild the parameter dict.
+
+    Returns:
+        Tuple of (SQL, named parameters)
+    """
+    shape, params = _export_filter_params(title_filter, url_filter, date_filter, tags_filter, sentiment_filter)
+    return _export_sql_for(shape, sort_col, include_content), params
+
+
 def _update_tags_for_article_blocking(article_id: int, new_tags_str: str):
     with get_db_connection() as conn:
         current_tags = set(get_tags_for_article(conn, article_id))
@@ -1490,7 +1664,7 @@ class GeminiProvider(AIProvider):
             if (result.get("candidates")
                     and result["candidates"][0]["content"]["parts"][0].get("text")):
                 s_text = result["candidates"][0]["content"]["parts"][0]["text"].strip().capitalize()
-                if s_text in ["Positive", "Negative", "Neutral"]:
+                if s_text in _VALID_SENTIMENTS:
                     logger.info(f"Sentiment: {s_text}.")
                     return s_text
                 else:
@@ -1594,7 +1768,7 @@ class OpenAIProvider(AIProvider):
             result = response.json()
             if result.get("choices") and len(result["choices"]) > 0:
                 s_text = result["choices"][0]["message"]["content"].strip().capitalize()
-                if s_text in ["Positive", "Negative", "Neutral"]:
+                if s_text in _VALID_SENTIMENTS:
                     logger.info(f"Sentiment: {s_text}.")
                     return s_text
                 else:
@@ -1700,7 +1874,7 @@ class ClaudeProvider(AIProvider):
             result = response.json()
             if result.get("content") and len(result["content"]) > 0:
                 s_text = result["content"][0]["text"].strip().capitalize()
-                if s_text in ["Positive", "Negative", "Neutral"]:
+                if s_text in _VALID_SENTIMENTS:
                     logger.info(f"Sentiment: {s_text}.")
                     return s_text
                 else:
@@ -3449,6 +3623,20 @@ class KeywordExtractionManager:
     - Trending keyword analysis
     """
 
+    @staticmethod
+    def _top_terms(tfidf_matrix, feature_names, n: int) -> List[Tuple[str, float]]:
+        """Top-n (term, score) pairs of a single-row TF-IDF matrix."""
+        if n <= 0:
+            return []
+        # Only the row's stored entries; partition before sorting the winners
+        row = tfidf_matrix.getrow(0)
+        scores, indices = row.data, row.indices
+        if len(scores) > n:
+            top = np.argpartition(scores, -n)[-n:]
+            scores, indices = scores[top], indices[top]
+        order = np.lexsort((indices, -scores))  # ties in vocabulary order
+        return list(zip(feature_names[indices[order]].tolist(), scores[order].tolist()))
+
     @staticmethod
     def extract_keywords(
         text: str,
@@ -3479,16 +3667,8 @@ class KeywordExtractionManager:
 
             tfidf_matrix = vectorizer.fit_transform([text])
             feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-
-            # Sort by score
-            keywords = sorted(
-                [(feature_names[i], float(scores[i])) for i in range(len(scores))],
-                key=lambda x: x[1],
-                reverse=True
-            )
 
-            return keywords[:num_keywords]
+            return KeywordExtractionManager._top_terms(tfidf_matrix, feature_names, num_keywords)
 
         except Exception as e:
             logger.error(f"Error extracting keywords: {e}")
@@ -3522,16 +3702,8 @@ class KeywordExtractionManager:
 
             tfidf_matrix = vectorizer.fit_transform([text])
             feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-
-            # Sort by score
-            phrases = sorted(
-                [(feature_names[i], float(scores[i])) for i in range(len(scores))],
-                key=lambda x: x[1],
-                reverse=True
-            )
 
-            return phrases[:num_phrases]
+            return KeywordExtractionManager._top_terms(tfidf_matrix, feature_names, num_phrases)
 
         except Exception as e:
             logger.error(f"Error extracting key phrases: {e}")
@@ -5844,6 +6016,74 @@ class ScrapeURLModal(ModalScreen[tuple[str, str, int] | None]):
             self.dismiss(None)
 
 
+class BulkScrapeModal(ModalScreen[tuple[List[str], str, int] | None]):
+    """Dialog for scraping several URLs (one per line) with one selector."""
+    DEFAULT_CSS = """
+    BulkScrapeModal {
+        align: center middle;
+        background: $surface-darken-1;
+    }
+    BulkScrapeModal > Vertical {
+        width: 80;
+        height: auto;
+        border: thick $primary-lighten-1;
+        padding: 1 2;
+        background: $surface;
+    }
+    BulkScrapeModal TextArea {
+        height: 10;
+        margin-bottom: 1;
+    }
+    BulkScrapeModal Input {
+        margin-bottom: 1;
+    }
+    BulkScrapeModal Label.dialog-title {
+        text-style: bold;
+        width: 100%;
+        text-align: center;
+        margin-bottom: 1;
+    }
+    """
+
+    def __init__(self, ls: str = "h2 a", ll: int = 0):
+        super().__init__()
+        self.ls, self.ll = ls, ll
+
+    def compose(self) -> ComposeResult:
+        with Vertical():
+            yield Label("Bulk Scrape URLs", classes="dialog-title")
+            yield TextArea(id="bs_urls_in")
+            yield Input(value=self.ls, placeholder="CSS Selector", id="bs_sel_in")
+            yield Input(value=str(self.ll), placeholder="Limit per URL (0=all)", id="bs_lim_in", type="integer")
+            yield Horizontal(
+                Button("Scrape All", variant="primary", id="bs_b"),
+                Button("Cancel", id="bsc_b"),
+                classes="modal-buttons"
+            )
+
+    def on_button_pressed(self, e: Button.Pressed) -> None:
+        if e.button.id == "bs_b":
+            urls = [line.strip() for line in self.query_one("#bs_urls_in", TextArea).text.splitlines()]
+            urls = list(dict.fromkeys(u for u in urls if u))
+            s = self.query_one("#bs_sel_in", Input).value
+            l_s = self.query_one("#bs_lim_in", Input).value
+            try:
+                limit = int(l_s) if l_s.strip() else 0
+            except ValueError:
+                self.app.notify("Invalid limit.", title="Error", severity="error")
+                return
+            if not urls or not s:
+                self.app.notify("At least one URL & a selector required.", title="Error", severity="error")
+                return
+            invalid = [u for u in urls if urlparse(u).scheme not in ("http", "https") or not urlparse(u).netloc]
+            if invalid:
+                self.app.notify(f"Invalid URL: {invalid[0]}", title="Error", severity="error")
+                return
+            self.dismiss((urls, s, limit))
+        else:
+            self.dismiss(None)
+
+
 class ArticleDetailModal(ModalScreen):
     DEFAULT_CSS = """
     ArticleDetailModal {
@@ -5952,15 +6192,17 @@ class SavedScraperItem(ListItem):
         if scraper_data.get('is_shared'):
             prefix_parts.append("[S]")
         self.prefix = " ".join(prefix_parts) + " " if prefix_parts else ""
-
-    def compose(self) -> ComposeResult:
-        display_name = f"{self.prefix}{self.scraper_data['name']}"
-        sub_text = self.scraper_data['description'] or self.scraper_data['url']
+        # Label text is computed once; compose() may run again on re-layout
+        self._display_name = f"{self.prefix}{scraper_data['name']}"
+        sub_text = scraper_data['description'] or scraper_data['url']
         if len(sub_text) > 60:
             sub_text = sub_text[:57] + "..."
+        self._sub_text = f"  ({sub_text})"
+
+    def compose(self) -> ComposeResult:
         with Vertical():
-            yield Label(display_name, classes="scraper-item-name")
-            yield Label(f"  ({sub_text})", classes="scraper-item-subtext")
+            yield Label(self._display_name, classes="scraper-item-name")
+            yield Label(self._sub_text, classes="scraper-item-subtext")
 
 
 class ManageScrapersModal(ModalScreen[Optional[Tuple[str, Any]]]):
@@ -7329,6 +7571,7 @@ class HelpModal(ModalScreen):
 | Key           | Action              | Description                                        |
 |---------------|---------------------|----------------------------------------------------|
 | `ctrl+n`      | New Scrape          | Open dialog to scrape new URL (generic).           |
+| `ctrl+alt+n`  | Bulk Scrape         | Scrape several URLs (one per line) concurrently.   |
 | `ctrl+m`      | Scraper Profiles    | Manage & execute saved/pre-installed scrapers.     |
 | `ctrl+shift+a`| Manage Schedules    | Create/edit scheduled scraping automation.         |
 
@@ -7468,6 +7711,7 @@ class WebScraperApp(App[None]):
         Binding("ctrl+s", "cycle_sort_order", "Sort"),
         Binding("ctrl+m", "manage_saved_scrapers", "Profiles"),
         Binding("ctrl+n", "scrape_new", "New Scrape"),
+        Binding("ctrl+alt+n", "bulk_scrape", "Bulk Scrape"),
         Binding("ctrl+e", "export_csv", "Export CSV"),
         Binding("ctrl+j", "export_json", "Export JSON"),
         Binding("ctrl+shift+x", "export_excel", "Export Excel"),
@@ -7541,6 +7785,12 @@ class WebScraperApp(App[None]):
         self.db_init_ok = init_db()
         self.row_metadata = {}
         self._summarize_context = {}
+        # Filter/sort state of the last successful table query (see refresh_article_table)
+        self._last_filter_key: Optional[tuple] = None
+        # Set to stop a superseded CSV export's streaming thread
+        self._current_export_cancel: Optional[threading.Event] = None
+        # Default tags handed from a scraper profile to _handle_scrape_new_result
+        self._pending_default_tags: Optional[str] = None
         self.config = ConfigManager.load_config()
         # Initialize background scheduler (v1.5.0)
         self.scheduler = BackgroundScheduler()
@@ -7698,18 +7948,36 @@ class WebScraperApp(App[None]):
         except Exception as e:
             logger.error(f"Error stopping scheduler: {e}")
 
-    async def refresh_article_table(self) -> None:
+    def _current_filter_key(self) -> tuple:
+        """Snapshot of every reactive that shapes the article table query."""
+        return (self.title_filter, self.url_filter, self.date_filter,
+                self.date_filter_from, self.date_filter_to, self.tags_filter,
+                self.tags_logic, self.sentiment_filter, self.use_regex,
+                self.current_sort_index, self.current_user_id)
+
+    async def refresh_article_table(self, force: bool = True) -> None:
+        """
+        Re-query the database and repopulate the article table.
+
+        Args:
+            force: When False, skip the query if the filter/sort state is
+                identical to the last successful refresh. Filter-only callers
+                pass False; data mutations keep the default so changes show up.
+        """
+        filter_key = self._current_filter_key()
+        if not force and filter_key == self._last_filter_key:
+            logger.debug("Filters unchanged, skipping article table refresh")
+            return
         tbl = self.query_one(DataTable)
         cur_row = tbl.cursor_row
         tbl.clear()
         s_col, s_disp = self.SORT_OPTIONS[self.current_sort_index]
         self.query_one(StatusBar).sort_status = s_disp
+        # Tags come from a correlated subquery per row, so the sort can walk
+        # an index instead of grouping the whole join in a temp b-tree
         bq = ("SELECT sd.id, sd.title, sd.url, sd.timestamp, "
               "sd.summary IS NOT NULL as has_s, sd.link, sd.sentiment, "
-              "GROUP_CONCAT(DISTINCT t.name) as tags_c "
-              "FROM scraped_data sd "
-              "LEFT JOIN article_tags at ON sd.id = at.article_id "
-              "LEFT JOIN tags t ON at.tag_id = t.id")
+              + _TAGS_COLUMN_SQL + " FROM scraped_data sd")
         conds, params, fdesc = [], {}, []
 
         # Title filter with optional regex support
@@ -7765,27 +8033,20 @@ class WebScraperApp(App[None]):
         if self.tags_filter:
             tfs = [t.strip().lower() for t in self.tags_filter.split(',') if t.strip()]
             if tfs:
-                if self.tags_logic == "OR":
-                    # OR logic: article must have at least one of the tags
-                    tag_placeholders = ", ".join([f":tgf_{i}" for i in range(len(tfs))])
-                    conds.append(
-                        f"sd.id IN (SELECT at_s.article_id FROM article_tags at_s JOIN tags t_s ON at_s.tag_id = t_s.id WHERE t_s.name IN ({tag_placeholders}))")
-                    for i, tn in enumerate(tfs):
-                        params[f"tgf_{i}"] = tn
-                    fdesc.append(f"Tags(OR)='{', '.join(tfs)}'")
-                else:
-                    # AND logic: article must have all tags (original behavior)
-                    for i, tn in enumerate(tfs):
-                        pn = f"tgf_{i}"
-                        conds.append(
-                            f"sd.id IN (SELECT at_s.article_id FROM article_tags at_s JOIN tags t_s ON at_s.tag_id = t_s.id WHERE t_s.name = :{pn})")
-                        params[pn] = tn
-                    fdesc.append(f"Tags(AND)='{', '.join(tfs)}'")
+                # OR logic: article must have at least one of the tags
+                # AND logic: article must have all tags (original behavior)
+                match_all = self.tags_logic != "OR"
+                tag_cond, tag_params = build_tag_filter_condition(tfs, match_all=match_all)
+                conds.append(tag_cond)
+                params.update(tag_params)
+                fdesc.append(f"Tags({'AND' if match_all else 'OR'})='{', '.join(tfs)}'")
 
         # Sentiment filter
         if self.sentiment_filter:
-            sval = self.sentiment_filter.strip().capitalize()
-            if sval in ["Positive", "Negative", "Neutral"]:
+            sval = self.sentiment_filter.strip()
+            if sval not in _VALID_SENTIMENTS:
+                sval = sval.capitalize()
+            if sval in _VALID_SENTIMENTS:
                 conds.append("sd.sentiment LIKE :sf")
                 params["sf"] = f"%{sval}%"
                 fdesc.append(f"Sentiment='{sval}'")
@@ -7800,7 +8061,7 @@ class WebScraperApp(App[None]):
 
         if conds:
             bq += " WHERE " + " AND ".join(conds)
-        bq += " GROUP BY sd.id ORDER BY " + s_col
+        bq += " ORDER BY " + s_col
         self.query_one(StatusBar).filter_status = ", ".join(fdesc) if fdesc else "None"
         try:
             with get_db_connection() as conn:
@@ -7848,6 +8109,7 @@ class WebScraperApp(App[None]):
                     'link': r_d['link'], 'has_s': bool(
                         r_d['has_s']), 'tags': r_d["tags_c"] or ""}
             self.query_one(StatusBar).total_articles = len(rows)
+            self._last_filter_key = filter_key
             logger.debug(f"Added {len(rows)} rows to table, table now has {tbl.row_count} rows")
             if cur_row is not None and cur_row < len(rows):
                 tbl.move_cursor(row=cur_row)
@@ -7862,11 +8124,12 @@ class WebScraperApp(App[None]):
             logger.error(f"Refresh err: {e}", exc_info=True)
             self.notify(f"Refresh err: {e}", title="DB Error", severity="error")
             self.query_one(StatusBar).total_articles = 0
+            self._last_filter_key = None
 
     async def action_open_filters(self) -> None:
         def handle_filter_result(result):
             if result:  # If filters were applied
-                self.call_later(self.refresh_article_table)
+                self.call_later(self.refresh_article_table, force=False)
         self.push_screen(FilterScreen(self), handle_filter_result)
 
     async def action_select_row(self) -> None:
@@ -7974,7 +8237,7 @@ class WebScraperApp(App[None]):
 
     async def action_refresh_data(self) -> None:
         self.notify("Refreshing...", title="Data Update", severity="info", timeout=2)
-        await self.refresh_article_table()
+        await self.refresh_article_table(force=True)
 
     # ═══════════════════════════════════════════════════════════════════════════
     # v2.0.0 Multi-User Methods (Phase 2)
@@ -8272,8 +8535,8 @@ class WebScraperApp(App[None]):
         self.notify(f"Scraping {url}...", title="Scraping", severity="info", timeout=3)
         try:
             # v2.0.0: Pass current user_id
-            inserted, skipped, scraped_url, inserted_ids = scrape_url_action(
-                url, selector, limit, user_id=self.current_user_id
+            inserted, skipped, scraped_url, inserted_ids = await asyncio.to_thread(
+                scrape_url_action, url, selector, limit, user_id=self.current_user_id
             )
             self.last_scrape_url = scraped_url
             if inserted_ids and default_tags_csv:
@@ -8282,7 +8545,7 @@ class WebScraperApp(App[None]):
                 def _apply_tags_blocking():
                     for aid in inserted_ids:
                         _update_tags_for_article_blocking(aid, default_tags_csv)
-                _apply_tags_blocking()
+                await asyncio.to_thread(_apply_tags_blocking)
                 self.notify(
                     f"Applied default tags to {len(inserted_ids)} new articles.",
                     title="Tags Applied",
@@ -8298,16 +8561,74 @@ class WebScraperApp(App[None]):
         finally:
             self._toggle_loading(False)
 
-    async def _handle_scrape_new_result(
-            self, result: tuple[str, str, int] | None, default_tags_csv: Optional[str] = None) -> None:
+    async def _scrape_many(self, urls: List[str], selector: str, limit: int) -> list:
+        """Scrape several URLs concurrently; failures are returned in place of results."""
+        user_id = self.current_user_id
+        tasks = [asyncio.to_thread(scrape_url_action, u, selector, limit, user_id=user_id) for u in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape_many_worker(self, urls: List[str], selector: str, limit: int,
+                                  default_tags_csv: Optional[str] = None) -> None:
+        self._toggle_loading(True)
+        self.notify(f"Scraping {len(urls)} URLs...", title="Scraping", severity="info", timeout=3)
+        try:
+            results = await self._scrape_many(urls, selector, limit)
+            total_inserted = total_skipped = failed = 0
+            new_ids: List[int] = []
+            for url, res in zip(urls, results):
+                if isinstance(res, Exception):
+                    failed += 1
+                    logger.error(f"Err scrape worker {url}: {res}", exc_info=res)
+                    continue
+                inserted, skipped, scraped_url, inserted_ids = res
+                total_inserted += inserted
+                total_skipped += skipped
+                self.last_scrape_url = scraped_url
+                if inserted_ids:
+                    new_ids.extend(inserted_ids)
+            if new_ids and default_tags_csv:
+                logger.info(f"Applying default tags '{default_tags_csv}' to {len(new_ids)} new articles.")
+
+                def _apply_tags_blocking():
+                    for aid in new_ids:
+                        _update_tags_for_article_blocking(aid, default_tags_csv)
+                await asyncio.to_thread(_apply_tags_blocking)
+            self.notify(
+                f"Scraped {len(urls) - failed}/{len(urls)} URLs. New: {total_inserted}, Skipped: {total_skipped}.",
+                title="Scrape Finished",
+                severity="warning" if failed else "info")
+            await self.refresh_article_table()
+        except Exception as e:
+            logger.error(f"Err batch scrape worker: {e}", exc_info=True)
+            self.notify(f"Err batch scraping: {e}", title="Scrape Error", severity="error")
+        finally:
+            self._toggle_loading(False)
+
+    async def _handle_scrape_new_result(self, result: tuple[str, str, int] | None) -> None:
+        # Default tags of the profile that opened the modal (None for manual entry)
+        default_tags_csv, self._pending_default_tags = self._pending_default_tags, None
         if result:
             url, selector, limit = result
             worker_with_args = functools.partial(self._scrape_url_worker, url, selector, limit, default_tags_csv)
             self.run_worker(worker_with_args, group="scraping", exclusive=True)
 
+    async def _handle_bulk_scrape_result(self, result: tuple[List[str], str, int] | None) -> None:
+        if result:
+            urls, selector, limit = result
+            self.last_scrape_selector, self.last_scrape_limit = selector, limit
+            worker_with_args = functools.partial(self._scrape_many_worker, urls, selector, limit)
+            self.run_worker(worker_with_args, group="scraping", exclusive=True)
+
+    async def action_bulk_scrape(self) -> None:
+        self.current_scraper_profile = "Bulk Entry"
+        self.query_one(StatusBar).scraper_profile = self.current_scraper_profile
+        await self.app.push_screen(
+            BulkScrapeModal(self.last_scrape_selector, self.last_scrape_limit), self._handle_bulk_scrape_result)
+
     async def action_scrape_new(self) -> None:
         self.current_scraper_profile = "Manual Entry"
         self.query_one(StatusBar).scraper_profile = self.current_scraper_profile
+        self._pending_default_tags = None
         await self.app.push_screen(ScrapeURLModal(self.last_scrape_url, self.last_scrape_selector, self.last_scrape_limit), self._handle_scrape_new_result)
 
     async def action_delete_selected(self) -> None:
@@ -8484,9 +8805,31 @@ class WebScraperApp(App[None]):
                 try:
                     def _clear_db_blocking():
                         with get_db_connection() as conn_blocking:
-                            conn_blocking.executescript(
-                                "DELETE FROM article_tags;DELETE FROM tags;DELETE FROM scraped_data;DELETE FROM saved_scrapers WHERE is_preinstalled=0;DELETE FROM sqlite_sequence WHERE name IN ('scraped_data','tags','saved_scrapers');")
-                            conn_blocking.commit()
+                            # Per-row FK checks/cascades dominate large clears, so
+                            # disable enforcement and replay the ON DELETE CASCADE
+                            # rules as one set-based DELETE per child table.
+                            conn_blocking.execute("PRAGMA foreign_keys=OFF")
+                            try:
+                                cascades = conn_blocking.execute(
+                                    "SELECT m.name, fk.\"from\", fk.\"table\" FROM sqlite_master m "
+                                    "JOIN pragma_foreign_key_list(m.name) fk "
+                                    "WHERE m.type='table' AND fk.on_delete='CASCADE' "
+                                    "AND fk.\"table\" IN ('scraped_data','tags','saved_scrapers')").fetchall()
+                                cascade_sql = "".join(
+                                    f'DELETE FROM "{child}" WHERE "{col}" NOT IN (SELECT id FROM "{parent}");'
+                                    for child, col, parent in cascades)
+                                conn_blocking.executescript(
+                                    "BEGIN;DELETE FROM article_tags;DELETE FROM tags;"
+                                    "DELETE FROM scraped_data;"
+                                    "DELETE FROM saved_scrapers WHERE is_preinstalled=0;"
+                                    + cascade_sql
+                                    + "DELETE FROM sqlite_sequence "
+                                    "WHERE name IN ('scraped_data','tags','saved_scrapers');COMMIT;")
+                            except sqlite3.Error:
+                                conn_blocking.rollback()
+                                raise
+                            finally:
+                                conn_blocking.execute("PRAGMA foreign_keys=ON")
                     _clear_db_blocking()
                     self.notify("User data cleared (pre-installed scrapers kept).", title="DB Cleared", severity="info")
                     logger.info("DB cleared.")
@@ -8549,7 +8892,7 @@ class WebScraperApp(App[None]):
                     self.tags_logic = preset_data['tags_logic']
                     self.notify(f"Loaded preset: {preset_name}", title="Preset Loaded", severity="info")
                     # Refresh table with new filters
-                    self.run_worker(self.refresh_article_table())
+                    self.run_worker(self.refresh_article_table(force=False))
                 else:
                     self.notify("Failed to load preset", title="Error", severity="error")
         self.push_screen(FilterPresetModal(), handle_preset_selection)
@@ -8828,7 +9171,7 @@ class WebScraperApp(App[None]):
         if nts is not None:
             self._toggle_loading(True)
             try:
-                _update_tags_for_article_blocking(aid, nts)
+                await asyncio.to_thread(_update_tags_for_article_blocking, aid, nts)
                 self.notify(f"Tags updated for ID {aid}.", title="Tags Updated", severity="info")
                 await self.refresh_article_table()
             except Exception as e:
@@ -8844,10 +9187,12 @@ class WebScraperApp(App[None]):
             return
         self.selected_row_id = current_id
         try:
+            article_id = self.selected_row_id
+
             def _get_tags_blocking():
                 with get_db_connection() as conn_blocking:
-                    return get_tags_for_article(conn_blocking, self.selected_row_id)  # type: ignore
-            ct = _get_tags_blocking()
+                    return get_tags_for_article(conn_blocking, article_id)  # type: ignore
+            ct = await asyncio.to_thread(_get_tags_blocking)
             # type: ignore
             await self.app.push_screen(ManageTagsModal(self.selected_row_id, ct), lambda ts: self._handle_manage_tags_result(self.selected_row_id, ts))
         except Exception as e:
@@ -8857,69 +9202,98 @@ class WebScraperApp(App[None]):
     async def _export_csv_worker(self, filename: str) -> None:
         self._toggle_loading(True)
         self.notify(f"Exporting to {filename}...", title="Exporting CSV", severity="info")
+        # An exclusive worker cancels the previous coroutine, but its thread keeps
+        # streaming rows until told to stop
+        if self._current_export_cancel is not None:
+            self._current_export_cancel.set()
+            self.notify("Previous CSV export cancelled.", title="Export Cancelled", severity="warning")
+        cancel_evt = threading.Event()
+        self._current_export_cancel = cancel_evt
         try:
             s_col, _ = self.SORT_OPTIONS[self.current_sort_index]
 
-            def _fetch_for_export_blocking():
-                bq_export = "SELECT sd.id,sd.title,sd.url,sd.link,sd.timestamp,sd.summary,sd.sentiment,GROUP_CONCAT(DISTINCT t.name) as tags_c FROM scraped_data sd LEFT JOIN article_tags at ON sd.id=at.article_id LEFT JOIN tags t ON at.tag_id=t.id"
-                conds_export, params_export = [], {}
-                if self.title_filter:
-                    conds_export.append("sd.title LIKE :tf")
-                    params_export["tf"] = f"%{self.title_filter}%"
-                if self.url_filter:
-                    conds_export.append("sd.url LIKE :uf")
-                    params_export["uf"] = f"%{self.url_filter}%"
-                if self.date_filter:
-                    conds_export.append("date(sd.timestamp)=:df")
-                    params_export["df"] = self.date_filter
-                if self.tags_filter:
-                    tfs_export = [t.strip().lower() for t in self.tags_filter.split(',') if t.strip()]
-                    for i, tn_export in enumerate(tfs_export):
-                        pn_export = f"tgf_{i}"
-                        conds_export.append(
-                            f"sd.id IN (SELECT at_s.article_id FROM article_tags at_s JOIN tags t_s ON at_s.tag_id=t_s.id WHERE t_s.name=:{pn_export})")
-                        params_export[pn_export] = tn_export
-                if self.sentiment_filter:
-                    sval_export = self.sentiment_filter.strip().capitalize()
-                    conds_export.append("sd.sentiment LIKE :sf")
-                    params_export["sf"] = f"%{sval_export}%"
-                if conds_export:
-                    bq_export += " WHERE " + " AND ".join(conds_export)
-                bq_export += " GROUP BY sd.id ORDER BY " + s_col
+            def _write_csv_blocking():
+                # Stream rows straight from the cursor so peak memory stays flat
+                # regardless of export size. Rows go to a temp file in the target
+                # directory that replaces the target only once complete, so a
+                # cancelled or superseded export never leaves a partial file or
+                # interleaves with a newer export to the same path.
+                fp = Path(filename)
+                num_rows = 0
+                cancelled = False
                 with get_db_connection() as conn_blocking:
-                    return conn_blocking.execute(bq_export, params_export).fetchall()
-            rows_to_export = _fetch_for_export_blocking()
-            if not rows_to_export:
+                    cursor = conn_blocking.execute(bq_export, params_export)
+                    first_row = cursor.fetchone()
+                    if first_row is None:
+                        return None, 0, False
+                    # Timestamps share one type across a result set, so pick the
+                    # formatter once instead of type-checking every row
+                    if isinstance(first_row[4], datetime):
+                        fmt_ts = operator.methodcaller('strftime', '%Y-%m-%d %H:%M:%S')
+                    else:
+                        fmt_ts = str
+                    # Created like open() would create the target (0o666 less the
+                    # umask, unlike mkstemp's 0600); an existing target's mode is
+                    # carried over so re-exporting keeps its permissions
+                    tmp_path = fp.with_name(f".{fp.name}.{secrets.token_hex(4)}.tmp")
+                    os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+                    try:
+                        if fp.exists():
+                            tmp_path.chmod(fp.stat().st_mode & 0o7777)
+                        # A .gz filename gets a streaming gzip file; level 1 keeps the
+                        # compression cost well below the disk write it saves
+                        if fp.suffix == '.gz':
+                            csvf_cm = gzip.open(tmp_path, 'wt', newline='', encoding='utf-8', compresslevel=1)
+                        else:
+                            csvf_cm = open(tmp_path, 'w', newline='', encoding='utf-8')
+                        with csvf_cm as csvf:
+                            fn = ['ID', 'Title', 'Source URL', 'Article Link', 'Timestamp', 'Summary',
+                                  'Sentiment', 'Tags']
+                            w = csv.writer(csvf)
+                            w.writerow(fn)
+
+                            def row_iter():
+                                nonlocal num_rows, cancelled
+                                # Positional unpacking follows _EXPORT_BASE_SQL's column order and
+                                # skips sqlite3.Row's per-access column-name lookup
+                                for aid, title, url, link, ts, summary, sentiment, tags in itertools.chain(
+                                        (first_row,), cursor):
+                                    if num_rows & 1023 == 0 and cancel_evt.is_set():
+                                        cancelled = True
+                                        return
+                                    yield (aid, title, url, link, fmt_ts(ts), summary, sentiment, tags)
+                                    num_rows += 1
+                            # writerows drives the generator from C, no per-row writerow call
+                            w.writerows(row_iter())
+                        if cancelled:
+                            tmp_path.unlink()
+                            logger.info(f"CSV export to {fp} cancelled after {num_rows} rows")
+                            return None, num_rows, True
+                        os.replace(tmp_path, fp)
+                    except BaseException:
+                        tmp_path.unlink(missing_ok=True)
+                        raise
+                return fp.resolve(), num_rows, False
+            # Filters are read on the event loop; only sqlite/file I/O runs in the thread
+            bq_export, params_export = build_export_query(
+                self.title_filter, self.url_filter, self.date_filter,
+                self.tags_filter, self.sentiment_filter, s_col)
+            resolved_path, num_rows, cancelled = await asyncio.to_thread(_write_csv_blocking)
+            if cancelled:
+                self.notify(f"CSV export to {filename} cancelled; no file written.",
+                            title="Export Cancelled", severity="warning")
+                return
+            if not num_rows:
                 self.notify("No data to export.", title="Export Info", severity="info")
-                self._toggle_loading(False)
                 return
-
-            def _write_csv_blocking():
-                fp = Path(filename)
-                with open(fp, 'w', newline='', encoding='utf-8') as csvf:
-                    fn = ['ID', 'Title', 'Source URL', 'Article Link', 'Timestamp', 'Summary', 'Sentiment', 'Tags']
-                    w = csv.DictWriter(csvf, fieldnames=fn)
-                    w.writeheader()
-                    for r_data in rows_to_export:
-                        timestamp_val = r_data['timestamp']
-                        timestamp_str = timestamp_val.strftime(
-                            '%Y-%m-%d %H:%M:%S') if isinstance(timestamp_val, datetime) else str(timestamp_val)
-                        w.writerow({'ID': r_data['id'],
-                                    'Title': r_data['title'],
-                                    'Source URL': r_data['url'],
-                                    'Article Link': r_data['link'],
-                                    'Timestamp': timestamp_str,
-                                    'Summary': r_data['summary'],
-                                    'Sentiment': r_data['sentiment'],
-                                    'Tags': r_data['tags_c']})
-                return fp.resolve(), len(rows_to_export)
-            resolved_path, num_rows = _write_csv_blocking()
             self.notify(f"Data exported to {resolved_path}", title="CSV Exported", severity="info")
             logger.info(f"Exported {num_rows} rows to {resolved_path}")
         except Exception as e:
             logger.error(f"Err export CSV '{filename}': {e}", exc_info=True)
             self.notify(f"Err export CSV: {e}", title="Export Error", severity="error")
         finally:
+            if self._current_export_cancel is cancel_evt:
+                self._current_export_cancel = None
             self._toggle_loading(False)
 
     async def action_export_csv(self) -> None:
@@ -8939,40 +9313,9 @@ class WebScraperApp(App[None]):
             s_col, _ = self.SORT_OPTIONS[self.current_sort_index]
 
             def _fetch_for_export_blocking():
-                bq_export = (
-                    "SELECT sd.id, sd.title, sd.url, sd.link, sd.timestamp, "
-                    "sd.summary, sd.sentiment, sd.content, "
-                    "GROUP_CONCAT(DISTINCT t.name) as tags_c "
-                    "FROM scraped_data sd "
-                    "LEFT JOIN article_tags at ON sd.id = at.article_id "
-                    "LEFT JOIN tags t ON at.tag_id = t.id"
-                )
-                conds_export, params_export = [], {}
-                if self.title_filter:
-                    conds_export.append("sd.title LIKE :tf")
-                    params_export["tf"] = f"%{self.title_filter}%"
-                if self.url_filter:
-                    conds_export.append("sd.url LIKE :uf")
-                    params_export["uf"] = f"%{self.url_filter}%"
-                if self.date_filter:
-                    conds_export.append("date(sd.timestamp) = :df")
-                    params_export["df"] = self.date_filter
-                if self.tags_filter:
-                    tfs_export = [t.strip().lower() for t in self.tags_filter.split(',') if t.strip()]
-                    for i, tn_export in enumerate(tfs_export):
-                        pn_export = f"tgf_{i}"
-                        conds_export.append(
-                            f"sd.id IN (SELECT at_s.article_id FROM article_tags at_s "
-                            f"JOIN tags t_s ON at_s.tag_id = t_s.id WHERE t_s.name = :{pn_export})"
-                        )
-                        params_export[pn_export] = tn_export
-                if self.sentiment_filter:
-                    sval_export = self.sentiment_filter.strip().capitalize()
-                    conds_export.append("sd.sentiment LIKE :sf")
-                    params_export["sf"] = f"%{sval_export}%"
-                if conds_export:
-                    bq_export += " WHERE " + " AND ".join(conds_export)
-                bq_export += " GROUP BY sd.id ORDER BY " + s_col
+                bq_export, params_export = build_export_query(
+                    self.title_filter, self.url_filter, self.date_filter,
+                    self.tags_filter, self.sentiment_filter, s_col, include_content=True)
                 with get_db_connection() as conn_blocking:
                     return conn_blocking.execute(bq_export, params_export).fetchall()
 
@@ -9655,40 +9998,9 @@ class WebScraperApp(App[None]):
         """Fetch articles for export (blocking function for worker thread)."""
         s_col, _ = self.SORT_OPTIONS[self.current_sort_index]
 
-        bq_export = (
-            "SELECT sd.id, sd.title, sd.url, sd.link, sd.timestamp, "
-            "sd.summary, sd.sentiment, sd.content, "
-            "GROUP_CONCAT(DISTINCT t.name) as tags_c "
-            "FROM scraped_data sd "
-            "LEFT JOIN article_tags at ON sd.id = at.article_id "
-            "LEFT JOIN tags t ON at.tag_id = t.id"
-        )
-        conds_export, params_export = [], {}
-        if self.title_filter:
-            conds_export.append("sd.title LIKE :tf")
-            params_export["tf"] = f"%{self.title_filter}%"
-        if self.url_filter:
-            conds_export.append("sd.url LIKE :uf")
-            params_export["uf"] = f"%{self.url_filter}%"
-        if self.date_filter:
-            conds_export.append("date(sd.timestamp) = :df")
-            params_export["df"] = self.date_filter
-        if self.tags_filter:
-            tfs_export = [t.strip().lower() for t in self.tags_filter.split(',') if t.strip()]
-            for i, tn_export in enumerate(tfs_export):
-                pn_export = f"tgf_{i}"
-                conds_export.append(
-                    f"sd.id IN (SELECT at_s.article_id FROM article_tags at_s "
-                    f"JOIN tags t_s ON at_s.tag_id = t_s.id WHERE t_s.name = :{pn_export})"
-                )
-                params_export[pn_export] = tn_export
-        if self.sentiment_filter:
-            sval_export = self.sentiment_filter.strip().capitalize()
-            conds_export.append("sd.sentiment LIKE :sf")
-            params_export["sf"] = f"%{sval_export}%"
-        if conds_export:
-            bq_export += " WHERE " + " AND ".join(conds_export)
-        bq_export += " GROUP BY sd.id ORDER BY " + s_col
+        bq_export, params_export = build_export_query(
+            self.title_filter, self.url_filter, self.date_filter,
+            self.tags_filter, self.sentiment_filter, s_col, include_content=True)
 
         with get_db_connection() as conn_blocking:
             rows_to_export = conn_blocking.execute(bq_export, params_export).fetchall()
@@ -9744,13 +10056,15 @@ class WebScraperApp(App[None]):
             return
         self.selected_row_id = current_id
         try:
+            article_id = self.selected_row_id
+
             def _get_article_data_blocking():
                 with get_db_connection() as conn_blocking:
                     return conn_blocking.execute(
                         "SELECT title,link FROM scraped_data WHERE id=?",
-                        (self.selected_row_id,
+                        (article_id,
                          )).fetchone()  # type: ignore
-            ad = _get_article_data_blocking()
+            ad = await asyncio.to_thread(_get_article_data_blocking)
             if not ad:
                 self.notify(f"Article ID {self.selected_row_id} not found.", title="Error", severity="error")
                 return
@@ -9769,18 +10083,19 @@ class WebScraperApp(App[None]):
             return
         action, data = result
         if action == "add":
-            def handle_add_scraper_result(sd):
+            async def handle_add_scraper_result(sd):
                 if sd:
                     try:
+                        # v2.0.0: Add user_id tracking and is_shared
+                        sd['user_id'] = self.current_user_id
+
                         def _add_scraper_blocking():
-                            # v2.0.0: Add user_id tracking and is_shared
-                            sd['user_id'] = self.current_user_id
                             with get_db_connection() as conn_blocking:
                                 conn_blocking.execute(
                                     "INSERT INTO saved_scrapers (name,url,selector,default_limit,default_tags_csv,description,is_preinstalled,user_id,is_shared) VALUES (:name,:url,:selector,:default_limit,:default_tags_csv,:description,0,:user_id,:is_shared)",
                                     sd)
                                 conn_blocking.commit()
-                        _add_scraper_blocking()
+                        await asyncio.to_thread(_add_scraper_blocking)
                         self.notify(f"Scraper '{sd['name']}' added.", title="Success", severity="info")
                     except sqlite3.IntegrityError:
                         self.notify(f"Scraper name '{sd['name']}' already exists.", title="Error", severity="error")
@@ -9794,9 +10109,13 @@ class WebScraperApp(App[None]):
                 self.notify("Permission denied: You can only edit your own scrapers.", severity="error")
                 return
 
-            def handle_edit_scraper_result(sd):
+            async def handle_edit_scraper_result(sd):
                 if sd:
                     try:
+                        if 'id' not in sd:
+                            # v2.0.0: Add user_id tracking and is_shared
+                            sd['user_id'] = self.current_user_id
+
                         def _edit_scraper_blocking():
                             with get_db_connection() as conn_blocking:
                                 if 'id' in sd:
@@ -9805,13 +10124,11 @@ class WebScraperApp(App[None]):
                                         "UPDATE saved_scrapers SET name=:name,url=:url,selector=:selector,default_limit=:default_limit,default_tags_csv=:default_tags_csv,description=:description,is_preinstalled=:is_preinstalled,is_shared=:is_shared WHERE id=:id",
                                         sd)
                                 else:
-                                    # v2.0.0: Add user_id tracking and is_shared
-                                    sd['user_id'] = self.current_user_id
                                     conn_blocking.execute(
                                         "INSERT INTO saved_scrapers (name,url,selector,default_limit,default_tags_csv,description,is_preinstalled,user_id,is_shared) VALUES (:name,:url,:selector,:default_limit,:default_tags_csv,:description,0,:user_id,:is_shared)",
                                         sd)
                                 conn_blocking.commit()
-                        _edit_scraper_blocking()
+                        await asyncio.to_thread(_edit_scraper_blocking)
                         self.notify(f"Scraper '{sd['name']}' saved.", title="Success", severity="info")
                     except sqlite3.IntegrityError:
                         self.notify(f"Scraper name '{sd['name']}' conflict.", title="Error", severity="error")
@@ -9826,7 +10143,7 @@ class WebScraperApp(App[None]):
                     with get_db_connection() as conn_blocking:
                         return conn_blocking.execute(
                             "SELECT name,is_preinstalled,user_id FROM saved_scrapers WHERE id=?", (sid_to_del,)).fetchone()
-                s_to_del = _get_scraper_name_blocking()
+                s_to_del = await asyncio.to_thread(_get_scraper_name_blocking)
                 if not s_to_del:
                     self.notify("Scraper not found.", severity="error")
                     return
@@ -9840,13 +10157,13 @@ class WebScraperApp(App[None]):
                     self.notify("Permission denied: You can only delete your own scrapers.", severity="error")
                     return
 
-                def handle_delete_scraper_confirmation(confirmed):
+                async def handle_delete_scraper_confirmation(confirmed):
                     if confirmed:
                         def _delete_scraper_blocking():
                             with get_db_connection() as conn_blocking:
                                 conn_blocking.execute("DELETE FROM saved_scrapers WHERE id=?", (sid_to_del,))
                                 conn_blocking.commit()
-                        _delete_scraper_blocking()
+                        await asyncio.to_thread(_delete_scraper_blocking)
                         self.notify(f"Scraper '{s_to_del['name']}' deleted.", title="Success", severity="info")
                 self.push_screen(
                     ConfirmModal(
@@ -9889,10 +10206,9 @@ class WebScraperApp(App[None]):
                     f"Profile '{data['name']}' loaded. Please provide target URL.",
                     title="Scraper Profile",
                     severity="information")
-                callback_with_tags = functools.partial(
-                    self._handle_scrape_new_result,
-                    default_tags_csv=data['default_tags_csv'])
-                await self.app.push_screen(ScrapeURLModal("", data['selector'], data['default_limit']), callback_with_tags)
+                self._pending_default_tags = data['default_tags_csv']
+                await self.app.push_screen(ScrapeURLModal("", data['selector'], data['default_limit']),
+                                           self._handle_scrape_new_result)
                 return
             self.last_scrape_url = final_url_to_scrape
             self.last_scrape_selector = data['selector']
@@ -9904,16 +10220,15 @@ class WebScraperApp(App[None]):
                 f"Executing scraper profile '{data['name']}'. Parameters loaded.",
                 title="Scraper Profile",
                 severity="information")
-            callback_with_tags = functools.partial(self._handle_scrape_new_result, default_tags_csv=default_tags)
-            await self.app.push_screen(ScrapeURLModal(final_url_to_scrape, data['selector'], data['default_limit']), callback_with_tags)
+            self._pending_default_tags = default_tags
+            await self.app.push_screen(ScrapeURLModal(final_url_to_scrape, data['selector'], data['default_limit']),
+                                       self._handle_scrape_new_result)
 
     async def action_manage_saved_scrapers(self) -> None:
         await self.app.push_screen(ManageScrapersModal(), self._handle_manage_scrapers_result)
 
 
-def print_startup_banner():
-    """Display welcome banner when starting the application."""
-    banner = """
+_STARTUP_BANNER: Final[str] = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                                                                              ║
 ║  ██╗    ██╗███████╗██████╗ ███████╗ ██████╗██████╗  █████╗ ██████╗ ███████╗  ║
@@ -9944,12 +10259,8 @@ def print_startup_banner():
 ║                                                                              ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
     """
-    print(banner)
 
-
-def print_shutdown_banner():
-    """Display farewell banner when exiting the application."""
-    banner = """
+_SHUTDOWN_BANNER: Final[str] = """
 ╔═══════════════════════════════════════════════════════════════════╗
 ║                                                                   ║
 ║                Thank you for using WebScrape-TUI!                 ║
@@ -9969,15 +10280,20 @@ def print_shutdown_banner():
 ║                                                                   ║
 ╚═══════════════════════════════════════════════════════════════════╝
     """
-    print(banner)
 
 
-if __name__ == "__main__":
-    import time
+def print_startup_banner():
+    """Display welcome banner when starting the application."""
+    print(_STARTUP_BANNER)
+
+
+def print_shutdown_banner():
+    """Display farewell banner when exiting the application."""
+    print(_SHUTDOWN_BANNER)
 
-    print_startup_banner()
-    time.sleep(2)  # 2-second pause before starting the application
 
+def _write_default_css(css_file: Path) -> None:
+    """Write the fallback stylesheet; only called when the .tcss file is missing."""
     css_file_content = """
 Screen{layout:vertical;overflow:hidden}Header{dock:top}Footer{dock:bottom}
 #app-grid{layout:vertical;overflow:hidden;height:1fr}
@@ -10008,11 +10324,20 @@ AddEditScraperModal Static.warning-text { color: $warning; padding: 0 1; text-al
 .scraper-item-name{text-style:bold;}
 .scraper-item-subtext{color:$text-muted;text-style:italic;}
     """
+    with open(css_file, "w", encoding="utf-8") as f:
+        f.write(css_file_content)
+    logger.info(f"Created CSS file: {css_file.resolve()}")
+
+
+if __name__ == "__main__":
+    print_startup_banner()
+    if "--splash" in sys.argv:
+        import time
+        time.sleep(2)  # Optional pause so the banner can be read before the TUI starts
+
     css_file = Path("web_scraper_tui_v2.tcss")
     if not css_file.exists():
-        with open(css_file, "w", encoding="utf-8") as f:
-            f.write(css_file_content)
-        logger.info(f"Created CSS file: {css_file.resolve()}")
+        _write_default_css(css_file)
     try:
         app = WebScraperApp()
         app.run()
@@ -6,25 +6,9 @@ and a REST API for web scraping, article management, and AI-powered analysis.
 Version: 2.1.0
 """
 
-# NOTE: Legacy imports commented out to prevent loading monolithic TUI application
-# The full TUI (scrapetui.py) should only be loaded when explicitly run as main
-# New modular code in scrapetui/ package operates independently
-
-# Import from legacy single-file application (backward compatibility)
-# These imports ensure that existing tests continue to work while we
-# gradually migrate to the new modular structure.
-# TEMPORARILY DISABLED: Loading causes test hangs due to Textual initialization
-#
-# import sys
-# import importlib.util
-# from pathlib import Path
-#
-# # Load the root-level scrapetui.py module directly
-# _root_file = Path(__file__).parent.parent / "scrapetui.py"
-# _spec = importlib.util.spec_from_file_location("_scrapetui_legacy", _root_file)
-# _legacy = importlib.util.module_from_spec(_spec)
-# sys.modules["_scrapetui_legacy"] = _legacy
-# _spec.loader.exec_module(_legacy)  # THIS HANGS TESTS - executes entire TUI app
+# Importing this package never executes the monolithic TUI (scrapetui.py); it
+# loads Textual, scikit-learn, spaCy and friends. Names that still live only
+# there (_LEGACY_NAMES) load it on first access via scrapetui.legacy.
 
 # Provide imports from new modular structure where available
 # For backward compatibility, tests should migrate to import from scrapetui.core.* directly
@@ -42,12 +26,60 @@ from .core.auth import (
     db_datetime_future
 )
 from .database.migrations import run_migrations
-from .config import Config, get_config, reset_config
-from .ai.topic_modeling import TopicModelingManager
-from .ai.question_answering import QuestionAnsweringManager
-from .ai.entity_relationships import EntityRelationshipManager
-from .ai.summary_quality import SummaryQualityManager
-from .ai.content_similarity import ContentSimilarityManager
+from .config import Config, get_config, reset_config, load_env_file
+
+# AI managers pull in heavy optional dependencies (scikit-learn, spaCy,
+# sentence-transformers/torch), so they are imported on first access
+_LAZY_IMPORTS = {
+    "TopicModelingManager": ("scrapetui.ai.topic_modeling", "TopicModelingManager"),
+    "QuestionAnsweringManager": ("scrapetui.ai.question_answering", "QuestionAnsweringManager"),
+    "EntityRelationshipManager": ("scrapetui.ai.entity_relationships", "EntityRelationshipManager"),
+    "SummaryQualityManager": ("scrapetui.ai.summary_quality", "SummaryQualityManager"),
+    "ContentSimilarityManager": ("scrapetui.ai.content_similarity", "ContentSimilarityManager"),
+}
+
+# Not yet migrated out of scrapetui.py; accessing one executes the monolith
+_LEGACY_NAMES = frozenset({
+    "ConfigManager",
+    "AIProvider",
+    "GeminiProvider",
+    "OpenAIProvider",
+    "ClaudeProvider",
+    "get_ai_provider",
+    "set_ai_provider",
+    "TemplateManager",
+    "FilterPresetManager",
+    "ScheduleManager",
+    "AnalyticsManager",
+    "ExcelExportManager",
+    "PDFExportManager",
+    "EnhancedVisualizationManager",
+    "AITaggingManager",
+    "EntityRecognitionManager",
+    "KeywordExtractionManager",
+    "MultiLevelSummarizationManager",
+    "DuplicateDetectionManager",
+    "PREINSTALLED_SCRAPERS",
+})
+
+
+def __getattr__(name):
+    """Resolve lazily imported AI managers and legacy-only names (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module_name, attr = _LAZY_IMPORTS[name]
+        value = getattr(importlib.import_module(module_name), attr)
+    elif name in _LEGACY_NAMES:
+        from .legacy import load_legacy
+        value = getattr(load_legacy(), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 
 # Backward-compatible wrapper for migrate_database_to_v2()
@@ -68,38 +100,6 @@ def migrate_database_to_v2() -> bool:
         logging.getLogger(__name__).error(f"Migration failed: {e}")
         return False
 
-# Placeholder exports for items not yet migrated - tests may need updates
-# These will return None/empty to avoid breaking imports while we complete migration
-
-
-def load_env_file(): pass
-
-
-ConfigManager = None
-AIProvider = None
-GeminiProvider = None
-OpenAIProvider = None
-ClaudeProvider = None
-get_ai_provider = None
-set_ai_provider = None
-TemplateManager = None
-FilterPresetManager = None
-ScheduleManager = None
-AnalyticsManager = None
-ExcelExportManager = None
-PDFExportManager = None
-EnhancedVisualizationManager = None
-AITaggingManager = None
-EntityRecognitionManager = None
-# ContentSimilarityManager now imported from ai.content_similarity
-KeywordExtractionManager = None
-MultiLevelSummarizationManager = None
-# TopicModelingManager imported from ai.topic_modeling
-# EntityRelationshipManager now imported from ai.entity_relationships
-DuplicateDetectionManager = None
-# SummaryQualityManager now imported from ai.summary_quality
-# QuestionAnsweringManager now imported from ai.question_answering
-PREINSTALLED_SCRAPERS = []
 
 # Note: DB_PATH is initialized from config - tests should override via get_config()
 # To avoid hangs, we set a safe default here
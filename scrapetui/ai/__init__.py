@@ -1,9 +1,13 @@
 """AI-powered features for WebScrape-TUI."""
 
-from .topic_modeling import TopicModelingManager
-from .question_answering import QuestionAnsweringManager
-from .entity_relationships import EntityRelationshipManager
-from .summary_quality import SummaryQualityManager
+# Each manager pulls in heavy dependencies (scikit-learn, spaCy), so they are
+# imported on first access instead of with the package
+_LAZY_IMPORTS = {
+    'TopicModelingManager': ('.topic_modeling', 'TopicModelingManager'),
+    'QuestionAnsweringManager': ('.question_answering', 'QuestionAnsweringManager'),
+    'EntityRelationshipManager': ('.entity_relationships', 'EntityRelationshipManager'),
+    'SummaryQualityManager': ('.summary_quality', 'SummaryQualityManager'),
+}
 
 __all__ = [
     'TopicModelingManager',
@@ -11,3 +15,18 @@ __all__ = [
     'EntityRelationshipManager',
     'SummaryQualityManager',
 ]
+
+
+def __getattr__(name):
+    """Resolve lazily imported AI managers (PEP 562)."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    module_name, attr = _LAZY_IMPORTS[name]
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
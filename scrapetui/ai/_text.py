@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Word analyzer shared by the scikit-learn vectorizers of the AI modules.
+
+Passing a prebuilt callable as ``analyzer`` produces the same terms as
+sklearn's word analyzer with ``stop_words='english'``, but spares every fit
+from rebuilding the analyzer and re-validating the stop list.
+"""
+
+import re
+from typing import FrozenSet, List, Optional, Tuple
+
+# sklearn's default token pattern, compiled once
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+# Fetched on first use, so importing this module does not import sklearn
+_stop_words: Optional[FrozenSet[str]] = None
+
+
+def _english_stop_words() -> FrozenSet[str]:
+    """sklearn's English stop list."""
+    global _stop_words
+    if _stop_words is None:
+        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+        _stop_words = ENGLISH_STOP_WORDS
+    return _stop_words
+
+
+def tokenize_words(text: str) -> List[str]:
+    """Lowercase, tokenize and drop English stop words."""
+    stop_words = _english_stop_words()
+    return [token for token in _TOKEN_RE.findall(text.lower()) if token not in stop_words]
+
+
+def analyze_words(text: str, ngram_range: Tuple[int, int] = (1, 2)) -> List[str]:
+    """
+    Stop-word-filtered tokens of text plus their word n-grams.
+
+    Module-level (not a closure), so vectorizers using it through
+    functools.partial stay picklable.
+    """
+    tokens = tokenize_words(text)
+    min_n, max_n = ngram_range
+    if max_n == 1:
+        return tokens
+
+    terms = list(tokens) if min_n == 1 else []
+    for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+        terms.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return terms
@@ -5,6 +5,7 @@ This module provides content similarity search using sentence embeddings
 and cosine similarity to find related articles.
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Any, Tuple
 import numpy as np
 
@@ -15,22 +16,18 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
-# Import SentenceTransformer at module level for mocking
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    # If sentence-transformers not installed, create a dummy class
-    class SentenceTransformer:
-        def __init__(self, *args, **kwargs):
-            pass
-
-        def encode(self, texts):
-            raise ImportError("sentence-transformers library not installed")
-
+# sentence-transformers (and torch) are imported on first model load.
+# Tests may patch this name with a stand-in class; None means "import it".
+SentenceTransformer = None
 
 # Lazy loading of heavy dependencies
 _sentence_transformer_model = None
 
+# Article embeddings keyed by (article id, hash of encoded text), LRU-bounded.
+# Stored as float16 (half the memory); upcast to float32 for the math.
+_EMBEDDING_CACHE_SIZE = 10_000
+_embedding_cache: "OrderedDict[Tuple[Any, int], np.ndarray]" = OrderedDict()
+
 
 def _get_sentence_transformer():
     """Lazy load SentenceTransformer model."""
@@ -38,7 +35,11 @@ def _get_sentence_transformer():
 
     if _sentence_transformer_model is None:
         try:
-            _sentence_transformer_model = SentenceTransformer('all-MiniLM-L6-v2')
+            model_cls = SentenceTransformer
+            if model_cls is None:
+                from sentence_transformers import SentenceTransformer as model_cls
+            _sentence_transformer_model = model_cls('all-MiniLM-L6-v2')
+            _embedding_cache.clear()
             logger.info("Loaded SentenceTransformer model: all-MiniLM-L6-v2")
         except Exception as e:
             logger.error(f"Failed to load SentenceTransformer: {e}")
@@ -47,6 +48,42 @@ def _get_sentence_transformer():
     return _sentence_transformer_model
 
 
+def _encode_articles(model, articles: List[Dict[str, Any]],
+                     extra_texts: List[str] = ()) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode articles, reusing cached embeddings.
+
+    Only articles missing from the cache are encoded, in one batch together
+    with extra_texts (e.g. the similarity target).
+
+    Returns:
+        Tuple of (extra_texts embeddings, float16 article embedding matrix)
+    """
+    texts_by_key: Dict[Tuple[Any, int], str] = {}
+    keys = []
+    for a in articles:
+        text = a.get('full_text') or a.get('title', '')
+        key = (a.get('id'), hash(text))
+        texts_by_key.setdefault(key, text)
+        keys.append(key)
+    missing = [k for k in texts_by_key if k not in _embedding_cache]
+
+    extra = np.empty((0, 0))
+    if extra_texts or missing:
+        encoded = np.asarray(model.encode(
+            [*extra_texts, *(texts_by_key[k] for k in missing)],
+            batch_size=64, show_progress_bar=False, convert_to_numpy=True))
+        extra = encoded[:len(extra_texts)]
+        _embedding_cache.update(zip(missing, encoded[len(extra_texts):].astype(np.float16)))
+
+    matrix = np.vstack([_embedding_cache[k] for k in keys])
+    for k in texts_by_key:
+        _embedding_cache.move_to_end(k)
+    while len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
+    return extra, matrix
+
+
 class ContentSimilarityManager:
     """Manager for content similarity analysis."""
 
@@ -94,19 +131,10 @@ class ContentSimilarityManager:
         try:
             model = _get_sentence_transformer()
 
-            # Extract text from articles (prefer full_text, fallback to title)
-            article_texts = [
-                a.get('full_text') or a.get('title', '')
-                for a in articles
-            ]
-
-            # Encode all texts (target + articles)
-            all_texts = [target_text] + article_texts
-            embeddings = model.encode(all_texts)
-
-            # Separate target embedding from article embeddings
-            target_embedding = embeddings[0]
-            article_embeddings = embeddings[1:]
+            # Encode the target plus any articles not already cached
+            # (article text prefers full_text, falls back to title)
+            target_embeddings, article_embeddings = _encode_articles(model, articles, [target_text])
+            target_embedding = target_embeddings[0]
 
             # Calculate cosine similarity
             similarities = ContentSimilarityManager._cosine_similarity_batch(
@@ -114,16 +142,15 @@ class ContentSimilarityManager:
                 article_embeddings
             )
 
-            # Create (article, score) tuples
-            results = [
-                (articles[i], float(similarities[i]))
-                for i in range(len(articles))
-                if similarities[i] >= min_similarity
-            ]
+            # Keep scores above the threshold, select the top_k with
+            # argpartition (O(n)) and sort only those
+            idx = np.flatnonzero(similarities >= min_similarity)
+            if 0 < top_k < len(idx):
+                idx = np.sort(idx[np.argpartition(-similarities[idx], top_k - 1)[:top_k]])
+            # Stable sort keeps article order for equal scores
+            idx = idx[np.argsort(-similarities[idx], kind='stable')][:top_k]
 
-            # Sort by similarity (descending) and take top_k
-            results.sort(key=lambda x: x[1], reverse=True)
-            return results[:top_k]
+            return [(articles[i], float(similarities[i])) for i in idx]
 
         except Exception as e:
             logger.error(f"Content similarity error: {e}", exc_info=True)
@@ -141,14 +168,15 @@ class ContentSimilarityManager:
         Returns:
             Array of cosine similarities (shape: (n,))
         """
-        # Normalize vectors
-        vec_norm = vec / (np.linalg.norm(vec) + 1e-10)
-        matrix_norms = matrix / (np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-10)
-
-        # Compute cosine similarity
-        similarities = np.dot(matrix_norms, vec_norm)
+        # One float32 mat-vec pass (float16 cached embeddings are upcast
+        # here), then scale by the norms, instead of materializing a
+        # normalized copy of the whole matrix
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        vec = np.asarray(vec, dtype=np.float32)
+        vec_norm = np.linalg.norm(vec) + 1e-10
+        matrix_norms = np.linalg.norm(matrix, axis=1) + 1e-10
 
-        return similarities
+        return (matrix @ vec) / (matrix_norms * vec_norm)
 
     @staticmethod
     def cluster_articles(
@@ -173,18 +201,21 @@ class ContentSimilarityManager:
 
             model = _get_sentence_transformer()
 
-            # Extract text and encode
-            article_texts = [a.get('full_text') or a.get('title', '') for a in articles]
-            embeddings = model.encode(article_texts)
+            # Encode (reusing cached article embeddings)
+            _, embeddings = _encode_articles(model, articles)
+            embeddings = embeddings.astype(np.float32)
 
             # Perform K-means clustering
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10)
+            kmeans = KMeans(n_clusters=n_clusters, random_state=42, n_init=10,
+                            algorithm='elkan' if n_clusters < 50 else 'lloyd')
             cluster_labels = kmeans.fit_predict(embeddings)
 
-            # Group articles by cluster
-            clusters = [[] for _ in range(n_clusters)]
-            for i, label in enumerate(cluster_labels):
-                clusters[label].append(articles[i]['id'])
+            # Group article ids by cluster with one stable sort over the labels
+            ids = np.array([a['id'] for a in articles])
+            order = np.argsort(cluster_labels, kind='stable')
+            bounds = np.searchsorted(cluster_labels[order], np.arange(n_clusters + 1))
+            sorted_ids = ids[order]
+            clusters = [sorted_ids[bounds[c]:bounds[c + 1]].tolist() for c in range(n_clusters)]
 
             return {
                 'clusters': clusters,
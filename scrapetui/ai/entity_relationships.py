@@ -5,8 +5,10 @@ This module provides entity recognition, relationship extraction, and
 knowledge graph construction capabilities using spaCy NLP.
 """
 
-from typing import List, Dict, Any
-from collections import defaultdict
+import sqlite3
+import sys
+from pathlib import Path
+from typing import List, Dict, Any, NamedTuple
 
 try:
     import spacy
@@ -21,26 +23,123 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+# Resolved once here rather than on every store/get call
+try:
+    from ..core.database import get_db_connection as _get_db_conn, _db_file_identity
+except ImportError:
+    def _get_db_conn():
+        import scrapetui
+        return scrapetui.get_db_connection()
+
+    def _db_file_identity(db_path):
+        # No inode available: readiness is then never cached
+        return str(db_path), None
+
+
+class Relationship(NamedTuple):
+    """Subject-verb-object relationship extracted from an article."""
+    subject: str
+    predicate: str
+    object: str
+    article_id: int
+
+
+# Longest article prefix handed to spaCy
+_MAX_TEXT_CHARS = 100000
+
+# spaCy model, loaded once per process on first use
+_nlp_model = None
+
+
+def _get_spacy_nlp():
+    """Get or load the spaCy NLP model."""
+    global _nlp_model
+    if not SPACY_AVAILABLE:
+        raise ImportError("spaCy is not installed. Install with: pip install spacy")
+
+    if _nlp_model is None:
+        try:
+            _nlp_model = spacy.load('en_core_web_sm')
+        except OSError:
+            logger.error(
+                "spaCy model 'en_core_web_sm' not found. "
+                "Download with: python -m spacy download en_core_web_sm"
+            )
+            raise
+    return _nlp_model
+
+
+# Database files (path, inode) whose entity tables were ensured this process,
+# mapped to the schema_version seen right after the DDL ran
+_tables_ready: Dict[Any, int] = {}
+
+
+def _schema_version(conn) -> int:
+    """SQLite's schema cookie: bumped by every CREATE/DROP/ALTER."""
+    return conn.execute("PRAGMA schema_version").fetchone()[0]
+
+
+def _ensure_tables(conn) -> None:
+    """
+    Create the entity tables once per database file.
+
+    Tracked by file identity (path plus inode) rather than per connection:
+    sqlite3.Connection supports neither weak references nor extra attributes,
+    and id() values are reused once a connection is closed. A database
+    deleted and re-created at the same path (db restore, test fixtures) gets
+    a new inode, and since filesystems may reuse inodes (and a restore copies
+    over the same one) the schema cookie must also match. In-memory
+    databases have no path and always run the (idempotent) DDL.
+    """
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    identity = _db_file_identity(Path(db_file)) if db_file else None
+    if identity is not None and identity[1] is not None:
+        ready_version = _tables_ready.get(identity)
+        if ready_version is not None and ready_version == _schema_version(conn):
+            return
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entities (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            entity_text TEXT NOT NULL,
+            entity_type TEXT NOT NULL,
+            article_id INTEGER NOT NULL,
+            FOREIGN KEY (article_id) REFERENCES scraped_data(id) ON DELETE CASCADE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entity_relationships (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            subject TEXT NOT NULL,
+            predicate TEXT NOT NULL,
+            object TEXT NOT NULL,
+            article_id INTEGER NOT NULL,
+            FOREIGN KEY (article_id) REFERENCES scraped_data(id) ON DELETE CASCADE
+        )
+    """)
+    # Expression indexes for get_related_entities' LOWER(subject)/LOWER(object)
+    # lookups; the trailing columns make them covering for its projections
+    try:
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entrel_subject_lc
+            ON entity_relationships (LOWER(subject), object, predicate, article_id)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_entrel_object_lc
+            ON entity_relationships (LOWER(object), subject, predicate, article_id)
+        """)
+    except sqlite3.OperationalError as e:
+        # entity_relationships predates this layout (entity1_id/entity2_id schema)
+        logger.debug(f"Skipping entity relationship indexes: {e}")
+    if identity is not None and identity[1] is not None:
+        _tables_ready[identity] = _schema_version(conn)
+
 
 class EntityRelationshipManager:
     """Manager for entity relationships and knowledge graphs."""
 
-    def __init__(self):
-        """Initialize the Entity Relationship Manager."""
-        self._nlp = None
-
     def _get_nlp(self):
-        """Lazy load spaCy model."""
-        if not SPACY_AVAILABLE:
-            raise ImportError("spaCy is not installed. Install with: pip install spacy")
-
-        if self._nlp is None:
-            try:
-                self._nlp = spacy.load('en_core_web_sm')
-            except OSError:
-                logger.error("spaCy model 'en_core_web_sm' not found. Download with: python -m spacy download en_core_web_sm")
-                raise
-        return self._nlp
+        """Lazy load spaCy model (shared across all managers)."""
+        return _get_spacy_nlp()
 
     @staticmethod
     def extract_entity_relationships(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -51,83 +150,84 @@ class EntityRelationshipManager:
             articles: List of article dicts with 'id', 'content', 'title' keys
 
         Returns:
-            Dict with 'entities' (dict of entity text -> entity info) and 'relationships' keys
+            Dict with 'entities' (dict of entity text -> entity info) and
+            'relationships' (list of Relationship tuples; use ._asdict() for JSON) keys
         """
         if not articles:
             return {'entities': {}, 'relationships': []}
 
-        manager = EntityRelationshipManager()
-
         try:
-            nlp = manager._get_nlp()
+            nlp = _get_spacy_nlp()
         except (ImportError, OSError) as e:
             logger.error(f"Failed to load spaCy: {e}")
             return {'entities': {}, 'relationships': []}
 
         # Extract entities across all articles
-        entities_dict = defaultdict(lambda: {
-            'text': '',
-            'type': '',
-            'count': 0,
-            'articles': set()
-        })
+        entities_dict: Dict[str, Dict[str, Any]] = {}
 
         relationships = []
+        # Case-insensitive dedup: casefolded text -> entity info. The first-seen
+        # surface form stays the (interned) key so graph nodes keep readable names
+        entity_by_folded: Dict[str, Dict[str, Any]] = {}
 
+        ids = []
+        texts = []
         for article in articles:
-            article_id = article.get('id', 0)
             text = article.get('content') or article.get('title', '')
 
             if not text or not text.strip():
                 continue
 
+            ids.append(article.get('id', 0))
             # Limit text length for performance
-            text = text[:100000]
+            if len(text) > _MAX_TEXT_CHARS:
+                text = text[:_MAX_TEXT_CHARS]
+            texts.append(text)
 
+        # Batch all articles through the pipeline; lemmas are never used here
+        disabled = [name for name in ('lemmatizer', 'textcat') if name in nlp.pipe_names]
+        for article_id, doc in zip(ids, nlp.pipe(texts, batch_size=32, disable=disabled)):
             try:
-                doc = nlp(text)
-
                 # Extract entities
                 for ent in doc.ents:
-                    entity_key = ent.text
-                    if entity_key not in entities_dict:
-                        entities_dict[entity_key] = {
+                    folded = ent.text.casefold()
+                    info = entity_by_folded.get(folded)
+                    if info is None:
+                        info = entity_by_folded[folded] = entities_dict[sys.intern(ent.text)] = {
                             'text': ent.text,
                             'type': ent.label_,
                             'count': 0,
                             'articles': set()
                         }
-
-                    entities_dict[entity_key]['count'] += 1
-                    entities_dict[entity_key]['articles'].add(article_id)
-
-                # Extract simple subject-verb-object relationships
-                for sent in doc.sents:
-                    # Find subjects and objects
-                    subjects = [token for token in sent if token.dep_ in ('nsubj', 'nsubjpass')]
-                    objects = [token for token in sent if token.dep_ in ('dobj', 'pobj')]
-                    verbs = [token for token in sent if token.pos_ == 'VERB']
-
-                    for subj in subjects:
-                        for verb in verbs:
-                            for obj in objects:
-                                # Check if they're connected in dependency tree
-                                if (verb in subj.ancestors or verb in subj.descendants
-                                        or verb in obj.ancestors or verb in obj.descendants):
-                                    relationships.append({
-                                        'subject': subj.text,
-                                        'predicate': verb.text,
-                                        'object': obj.text,
-                                        'article_id': article_id
-                                    })
+                    info['count'] += 1
+                    info['articles'].add(article_id)
+
+                # Extract simple subject-verb-object relationships from each
+                # verb's direct dependents (objects of a prepositional child
+                # count too), one pass over the tokens
+                for verb in doc:
+                    if verb.pos_ != 'VERB':
+                        continue
+                    subj = dobj = pobj = None
+                    for child in verb.children:
+                        dep = child.dep_
+                        if subj is None and dep in ('nsubj', 'nsubjpass'):
+                            subj = child
+                        elif dobj is None and dep == 'dobj':
+                            dobj = child
+                        elif pobj is None and dep == 'prep':
+                            pobj = next((c for c in child.children if c.dep_ == 'pobj'), None)
+                    obj = dobj if dobj is not None else pobj
+                    if subj is not None and obj is not None:
+                        relationships.append(Relationship(subj.text, verb.text, obj.text, article_id))
 
             except Exception as e:
                 logger.error(f"Error processing article {article_id}: {e}")
                 continue
 
-        # Convert sets to lists for JSON serialization
+        # Convert sets to sorted lists for deterministic JSON serialization
         for entity in entities_dict.values():
-            entity['articles'] = list(entity['articles'])
+            entity['articles'] = sorted(entity['articles'])
 
         return {
             'entities': dict(entities_dict),
@@ -173,16 +273,17 @@ class EntityRelationshipManager:
         # Add relationship edges
         relationships = entity_data.get('relationships', [])
         for rel in relationships:
-            subject = rel.get('subject')
-            obj = rel.get('object')
-            predicate = rel.get('predicate')
+            # Relationship tuples from extraction, or dicts from serialized data
+            if isinstance(rel, dict):
+                rel = Relationship(rel.get('subject'), rel.get('predicate'),
+                                   rel.get('object'), rel.get('article_id'))
 
-            if subject and obj:
+            if rel.subject and rel.object:
                 graph.add_edge(
-                    subject,
-                    obj,
-                    relation=predicate,
-                    article_id=rel.get('article_id')
+                    rel.subject,
+                    rel.object,
+                    relation=rel.predicate,
+                    article_id=rel.article_id
                 )
 
         return graph
@@ -206,16 +307,16 @@ class EntityRelationshipManager:
         entity_lower = entity.lower()
 
         for rel in relationships:
-            if rel['subject'].lower() == entity_lower:
+            if rel.subject.lower() == entity_lower:
                 connections.append({
-                    'entity': rel['object'],
-                    'relation': rel['predicate'],
+                    'entity': rel.object,
+                    'relation': rel.predicate,
                     'direction': 'outgoing'
                 })
-            elif rel['object'].lower() == entity_lower:
+            elif rel.object.lower() == entity_lower:
                 connections.append({
-                    'entity': rel['subject'],
-                    'relation': rel['predicate'],
+                    'entity': rel.subject,
+                    'relation': rel.predicate,
                     'direction': 'incoming'
                 })
 
@@ -233,12 +334,6 @@ class EntityRelationshipManager:
         Returns:
             True if successful, False otherwise
         """
-        try:
-            from ..core.database import get_db_connection as _get_db_conn
-        except ImportError:
-            import scrapetui
-            _get_db_conn = scrapetui.get_db_connection
-
         try:
             # Handle context manager if needed
             if conn is not None:
@@ -251,27 +346,7 @@ class EntityRelationshipManager:
                 db_conn = db_conn_mgr.__enter__()
                 own_conn = True
 
-            # Ensure tables exist
-            db_conn.execute("""
-                CREATE TABLE IF NOT EXISTS entities (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    entity_text TEXT NOT NULL,
-                    entity_type TEXT NOT NULL,
-                    article_id INTEGER NOT NULL,
-                    FOREIGN KEY (article_id) REFERENCES scraped_data(id) ON DELETE CASCADE
-                )
-            """)
-
-            db_conn.execute("""
-                CREATE TABLE IF NOT EXISTS entity_relationships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    subject TEXT NOT NULL,
-                    predicate TEXT NOT NULL,
-                    object TEXT NOT NULL,
-                    article_id INTEGER NOT NULL,
-                    FOREIGN KEY (article_id) REFERENCES scraped_data(id) ON DELETE CASCADE
-                )
-            """)
+            _ensure_tables(db_conn)
 
             # Get article content
             row = db_conn.execute(
@@ -288,21 +363,21 @@ class EntityRelationshipManager:
             article = {'id': article_id, 'content': content}
             result = EntityRelationshipManager.extract_entity_relationships([article])
 
-            # Store entities
-            for entity_text, entity_info in result['entities'].items():
-                db_conn.execute("""
+            ent_rows = [(entity_text, entity_info['type'], article_id)
+                        for entity_text, entity_info in result['entities'].items()]
+            rel_rows = [(rel.subject, rel.predicate, rel.object, article_id)
+                        for rel in result['relationships']]
+
+            # Store entities and relationships in one transaction
+            with db_conn:
+                db_conn.executemany("""
                     INSERT INTO entities (entity_text, entity_type, article_id)
                     VALUES (?, ?, ?)
-                """, (entity_text, entity_info['type'], article_id))
-
-            # Store relationships
-            for rel in result['relationships']:
-                db_conn.execute("""
+                """, ent_rows)
+                db_conn.executemany("""
                     INSERT INTO entity_relationships (subject, predicate, object, article_id)
                     VALUES (?, ?, ?, ?)
-                """, (rel['subject'], rel['predicate'], rel['object'], article_id))
-
-            db_conn.commit()
+                """, rel_rows)
 
             if own_conn:
                 db_conn_mgr.__exit__(None, None, None)
@@ -326,12 +401,6 @@ class EntityRelationshipManager:
         Returns:
             List of related entity dicts
         """
-        try:
-            from ..core.database import get_db_connection as _get_db_conn
-        except ImportError:
-            import scrapetui
-            _get_db_conn = scrapetui.get_db_connection
-
         try:
             # Handle context manager if needed
             if conn is not None:
@@ -344,56 +413,31 @@ class EntityRelationshipManager:
                 db_conn = db_conn_mgr.__enter__()
                 own_conn = True
 
-            # Ensure table exists
-            db_conn.execute("""
-                CREATE TABLE IF NOT EXISTS entity_relationships (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    subject TEXT NOT NULL,
-                    predicate TEXT NOT NULL,
-                    object TEXT NOT NULL,
-                    article_id INTEGER NOT NULL
-                )
-            """)
+            _ensure_tables(db_conn)
 
             entity_lower = entity.lower()
-            related = []
 
-            # Find outgoing relationships
+            # Outgoing then incoming relationships in one statement
             rows = db_conn.execute("""
-                SELECT DISTINCT object, predicate, article_id
+                SELECT DISTINCT object, predicate, article_id, 'outgoing'
                 FROM entity_relationships
                 WHERE LOWER(subject) = ?
-                LIMIT ?
-            """, (entity_lower, limit)).fetchall()
-
-            for row in rows:
-                related.append({
-                    'entity': row[0],
-                    'relation': row[1],
-                    'direction': 'outgoing',
-                    'article_id': row[2]
-                })
-
-            # Find incoming relationships
-            rows = db_conn.execute("""
-                SELECT DISTINCT subject, predicate, article_id
+                UNION ALL
+                SELECT DISTINCT subject, predicate, article_id, 'incoming'
                 FROM entity_relationships
                 WHERE LOWER(object) = ?
                 LIMIT ?
-            """, (entity_lower, limit)).fetchall()
-
-            for row in rows:
-                related.append({
-                    'entity': row[0],
-                    'relation': row[1],
-                    'direction': 'incoming',
-                    'article_id': row[2]
-                })
+            """, (entity_lower, entity_lower, limit)).fetchall()
+
+            related = [
+                {'entity': row[0], 'relation': row[1], 'direction': row[3], 'article_id': row[2]}
+                for row in rows
+            ]
 
             if own_conn:
                 db_conn_mgr.__exit__(None, None, None)
 
-            return related[:limit]
+            return related
 
         except Exception as e:
             logger.error(f"Failed to get related entities: {e}")
@@ -1,30 +1,115 @@
 #!/usr/bin/env python3
 """AI processing functions for article analysis."""
 
+import hashlib
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from threading import Lock
+import joblib
+import numpy as np
 import spacy
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from difflib import SequenceMatcher
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.feature_extraction.text import (
+    HashingVectorizer, TfidfTransformer, TfidfVectorizer
+)
+from ._text import analyze_words
 from ..utils.logging import get_logger
 
+try:
+    # Installed with python-Levenshtein; compiled ratio, same 0-100 scale
+    from rapidfuzz import fuzz as _rapidfuzz
+    from rapidfuzz import process as _rapidfuzz_process
+except ImportError:
+    _rapidfuzz = None
+    _rapidfuzz_process = None
+
 logger = get_logger(__name__)
 
+
+def _length_bound(len1: int, len2: int) -> float:
+    """Upper bound on the similarity ratio of strings of these lengths."""
+    total = len1 + len2
+    return 2.0 * min(len1, len2) / total if total else 1.0
+
+
+def _text_ratio(a: str, b: str, cutoff: float = 0.0) -> float:
+    """Similarity ratio (0.0-1.0) of two strings, or 0.0 if below cutoff."""
+    # Callers derive cutoffs arithmetically; allow for rounding
+    cutoff -= 1e-9
+    if _rapidfuzz is not None:
+        return _rapidfuzz.ratio(a, b, score_cutoff=max(cutoff, 0.0) * 100.0) / 100.0
+    matcher = SequenceMatcher(None, a, b)
+    # Progressively tighter upper bounds before the full O(n*m) ratio
+    if cutoff > 0.0 and (
+        matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff
+    ):
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= cutoff else 0.0
+
+
+# Per-text NLP results keyed by content hash; scraped text rarely changes,
+# so repeat runs over the same articles skip spaCy and TF-IDF entirely
+_NLP_CACHE_SIZE = 10000
+_nlp_cache: "OrderedDict[Tuple[Any, ...], List[Dict[str, Any]]]" = OrderedDict()
+# Worker threads share the cache; get-then-move_to_end and put-then-evict
+# must not interleave
+_nlp_cache_lock = Lock()
+
+
+def _text_digest(text: str) -> str:
+    """Stable content hash used as the NLP cache key."""
+    return hashlib.sha256(text.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[List[Dict[str, Any]]]:
+    """Return a copy of a cached NLP result, or None on a miss."""
+    with _nlp_cache_lock:
+        cached = _nlp_cache.get(key)
+        if cached is None:
+            return None
+        _nlp_cache.move_to_end(key)
+    return [dict(item) for item in cached]
+
+
+def _cache_put(key: Tuple[Any, ...], value: List[Dict[str, Any]]) -> None:
+    """Store a copy of an NLP result, evicting the least recently used."""
+    copied = [dict(item) for item in value]
+    with _nlp_cache_lock:
+        _nlp_cache[key] = copied
+        _nlp_cache.move_to_end(key)
+        if len(_nlp_cache) > _NLP_CACHE_SIZE:
+            _nlp_cache.popitem(last=False)
+
+
 # Load spaCy model (lazy loading)
 _nlp_model = None
+_nlp_lock = Lock()
+
+# Only doc.ents is used here, so skip the components NER does not need
+_NLP_DISABLED_PIPES = ['tagger', 'parser', 'attribute_ruler', 'lemmatizer']
 
 
 def _get_nlp_model():
-    """Get or load spaCy NLP model."""
+    """Get or load spaCy NLP model (NER only)."""
     global _nlp_model
     if _nlp_model is None:
-        try:
-            _nlp_model = spacy.load('en_core_web_sm')
-        except OSError:
-            logger.error(
-                "spaCy model 'en_core_web_sm' not found. "
-                "Run: python -m spacy download en_core_web_sm"
-            )
-            raise
+        with _nlp_lock:
+            if _nlp_model is None:  # Double-check locking
+                try:
+                    _nlp_model = spacy.load('en_core_web_sm', disable=_NLP_DISABLED_PIPES)
+                except OSError:
+                    logger.error(
+                        "spaCy model 'en_core_web_sm' not found. "
+                        "Run: python -m spacy download en_core_web_sm"
+                    )
+                    raise
     return _nlp_model
 
 
@@ -48,66 +133,179 @@ def extract_named_entities(
         >>> entities[0]
         {'text': 'Apple', 'label': 'ORG', 'start': 0, 'end': 5}
     """
-    if not text or not text.strip():
+    if not _has_word_chars(text):
         return []
 
     try:
         nlp = _get_nlp_model()
-        # Limit to 1M chars for performance
-        doc = nlp(text[:1000000])
-
         entities = []
-        for ent in doc.ents:
-            if entity_types is None or ent.label_ in entity_types:
-                entities.append({
-                    'text': ent.text,
-                    'label': ent.label_,
-                    'start': ent.start_char,
-                    'end': ent.end_char
-                })
-
+        for doc, offset in nlp.pipe(_ner_chunks(text, nlp.max_length), as_tuples=True):
+            entities.extend(_doc_entities(doc, entity_types, offset))
         return entities
     except Exception as e:
         logger.error(f"Entity extraction failed: {e}")
         return []
 
 
+def _has_word_chars(text: Optional[str]) -> bool:
+    """True if text has any letter or digit; without one there is no entity to find."""
+    return bool(text) and any(char.isalnum() for char in text)
+
+
+def _doc_entities(
+    doc,
+    entity_types: Optional[List[str]] = None,
+    offset: int = 0
+) -> List[Dict[str, Any]]:
+    """Convert a spaCy doc's entities to dicts, optionally filtered by label."""
+    return [
+        {
+            'text': ent.text,
+            'label': ent.label_,
+            'start': ent.start_char + offset,
+            'end': ent.end_char + offset
+        }
+        for ent in doc.ents
+        if entity_types is None or ent.label_ in entity_types
+    ]
+
+
+# Characters of each text run through NER; the rest is never read
+MAX_NER_CHARS = int(os.getenv("SCRAPETUI_MAX_NER_CHARS", "200000"))
+
+# Target size of each NER chunk, so no single spaCy Doc grows huge
+_NER_CHUNK_CHARS = 10000
+
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+
+def _ner_chunks(text: str, max_length: int = 1000000) -> List[Tuple[str, int]]:
+    """
+    Split text into (chunk, offset) pairs at sentence boundaries.
+
+    Coverage stops at MAX_NER_CHARS (and the model's max_length), cut back
+    to the last sentence boundary so no entity is split. A sentence longer
+    than a chunk is kept whole.
+    """
+    limit = min(MAX_NER_CHARS, max_length)
+    if len(text) <= limit:
+        end = len(text)
+    else:
+        boundaries = [m.end() for m in _SENTENCE_BREAK.finditer(text, 0, limit)]
+        end = boundaries[-1] if boundaries else limit
+
+    chunks = []
+    start = last = 0
+    for match in _SENTENCE_BREAK.finditer(text, 0, end):
+        if match.end() - start > _NER_CHUNK_CHARS and last > start:
+            chunks.append((text[start:last], start))
+            start = last
+        last = match.end()
+    if end - start > _NER_CHUNK_CHARS and start < last < end:
+        chunks.append((text[start:last], start))
+        start = last
+    if start < end:
+        chunks.append((text[start:end], start))
+    return chunks
+
+
+# Stay below SQLite's default limit of 999 bound variables per statement
+_SQL_IN_CHUNK = 900
+
+# Analysis text of an article: content, else summary, else title
+_ARTICLE_TEXT_SQL = "COALESCE(NULLIF(content, ''), NULLIF(summary, ''), title, '')"
+
+
+def _fetch_article_texts(conn, article_ids: List[int]) -> Dict[int, str]:
+    """
+    Fetch the analysis text of several articles with chunked IN queries.
+
+    The text is the content, falling back to summary, then title (empty
+    strings count as missing). Missing article IDs are absent from the result.
+    """
+    unique_ids = list(dict.fromkeys(article_ids))
+    texts = {}
+    for start in range(0, len(unique_ids), _SQL_IN_CHUNK):
+        chunk = unique_ids[start:start + _SQL_IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(
+            f"SELECT id, {_ARTICLE_TEXT_SQL} AS text FROM scraped_data WHERE id IN ({placeholders})",
+            chunk
+        ).fetchall()
+        texts.update((row['id'], row['text']) for row in rows)
+    return texts
+
+
 def extract_entities_from_articles(
-    article_ids: List[int]
+    article_ids: List[int],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None
 ) -> Dict[int, List[Dict[str, Any]]]:
     """
     Extract named entities from multiple articles.
 
+    All article texts are streamed through one nlp.pipe() call.
+
     Args:
         article_ids: List of article IDs to process
+        batch_size: Docs per spaCy batch (default: SCRAPETUI_SPACY_BATCH_SIZE or 64)
+        n_process: spaCy worker processes (default: SCRAPETUI_SPACY_N_PROCESS or 1)
 
     Returns:
         Dict mapping article_id -> list of entities
     """
     from ..core.database import get_db_connection
 
-    results = {}
+    if batch_size is None:
+        batch_size = int(os.getenv("SCRAPETUI_SPACY_BATCH_SIZE", "64"))
+    if n_process is None:
+        n_process = int(os.getenv("SCRAPETUI_SPACY_N_PROCESS", "1"))
+
+    results = {article_id: [] for article_id in article_ids}
 
     with get_db_connection() as conn:
-        for article_id in article_ids:
-            # Get article content
-            row = conn.execute(
-                "SELECT content, summary, title FROM scraped_data WHERE id = ?",
-                (article_id,)
-            ).fetchone()
+        texts_by_id = _fetch_article_texts(conn, article_ids)
+
+    # Only uncached texts reach spaCy
+    pending = {}
+    for article_id, text in texts_by_id.items():
+        if not _has_word_chars(text):
+            continue
+        key = ('entities', _text_digest(text))
+        cached = _cache_get(key)
+        if cached is not None:
+            results[article_id] = cached
+        else:
+            pending[article_id] = (key, text)
+
+    if not pending:
+        return results
 
-            if not row:
-                results[article_id] = []
-                continue
+    try:
+        nlp = _get_nlp_model()
+        # Sentence-aligned chunks of every article share one pipe
+        chunks = [
+            (chunk, (article_id, offset))
+            for article_id, (_, text) in pending.items()
+            for chunk, offset in _ner_chunks(text, nlp.max_length)
+        ]
+        entities = {article_id: [] for article_id in pending}
+        for doc, (article_id, offset) in nlp.pipe(
+            chunks, as_tuples=True, batch_size=batch_size, n_process=n_process
+        ):
+            entities[article_id].extend(_doc_entities(doc, offset=offset))
+        for article_id, (key, _) in pending.items():
+            results[article_id] = entities[article_id]
+            _cache_put(key, entities[article_id])
+    except Exception as e:
+        logger.error(f"Entity extraction failed: {e}")
 
-            # Try content first, fall back to summary, then title
-            text = row[0] or row[1] or row[2] or ""
+    return results
 
-            # Extract entities
-            entities = extract_named_entities(text)
-            results[article_id] = entities
 
-    return results
+def _word_analyzer(ngram_range: Tuple[int, int] = (1, 2)):
+    """Analyzer callable for the vectorizers in this module (picklable)."""
+    return partial(analyze_words, ngram_range=tuple(ngram_range))
 
 
 def extract_keywords(
@@ -137,30 +335,277 @@ def extract_keywords(
     try:
         vectorizer = TfidfVectorizer(
             max_features=top_n * 2,
-            ngram_range=ngram_range,
-            stop_words='english'
+            analyzer=_word_analyzer(ngram_range),
+            dtype=np.float32
         )
 
         tfidf_matrix = vectorizer.fit_transform([text])
         feature_names = vectorizer.get_feature_names_out()
-        scores = tfidf_matrix.toarray()[0]
+        return _top_keywords(tfidf_matrix.getrow(0), feature_names, top_n)
+    except Exception as e:
+        logger.error(f"Keyword extraction failed: {e}")
+        return []
+
 
-        # Get top N keywords
-        top_indices = scores.argsort()[-top_n:][::-1]
+def _top_keywords(row, feature_names, top_n: int) -> List[Dict[str, float]]:
+    """Top-n keywords of one TF-IDF CSR row, highest score first."""
+    if top_n <= 0:
+        return []
+    # Rank only the stored (nonzero) entries of the row
+    scores = row.data
+    indices = row.indices
+    if len(scores) > top_n:
+        top = np.argpartition(scores, -top_n)[-top_n:]
+        scores, indices = scores[top], indices[top]
+
+    # Highest score first; ties in vocabulary order
+    order = np.lexsort((indices, -scores))
+    names = feature_names[indices[order]]
+
+    return [
+        {'keyword': name, 'score': score}
+        for name, score in zip(names.tolist(), scores[order].tolist())
+    ]
+
+
+def extract_keywords_corpus(
+    texts: List[str],
+    top_n: int = 10,
+    ngram_range: tuple = (1, 2)
+) -> List[List[Dict[str, float]]]:
+    """
+    Extract keywords for each text using TF-IDF fitted over all of them.
 
-        keywords = []
-        for idx in top_indices:
-            if scores[idx] > 0:
-                keywords.append({
-                    'keyword': feature_names[idx],
-                    'score': float(scores[idx])
-                })
+    Unlike calling extract_keywords per text, the vectorizer is fitted once
+    and IDF weights reflect the whole corpus, so terms common to every text
+    rank below terms distinctive to one.
 
-        return keywords
+    Args:
+        texts: Input texts
+        top_n: Number of top keywords per text
+        ngram_range: Range of n-grams (default: unigrams and bigrams)
+
+    Returns:
+        List of keyword lists, parallel to texts
+    """
+    if not texts:
+        return []
+
+    try:
+        vectorizer = TfidfVectorizer(
+            max_features=50000,
+            analyzer=_word_analyzer(ngram_range),
+            dtype=np.float32
+        )
+
+        tfidf_matrix = vectorizer.fit_transform(texts).tocsr()
+        feature_names = vectorizer.get_feature_names_out()
+        return [
+            _top_keywords(tfidf_matrix.getrow(i), feature_names, top_n)
+            for i in range(tfidf_matrix.shape[0])
+        ]
     except Exception as e:
         logger.error(f"Keyword extraction failed: {e}")
+        return [[] for _ in texts]
+
+
+# Hashed feature space for extract_keywords_streaming
+_HASHED_FEATURES = 2 ** 18
+
+
+def extract_keywords_streaming(
+    texts: Iterable[str],
+    top_n: int = 10,
+    batch_size: int = 1000,
+    ngram_range: tuple = (1, 2)
+) -> List[List[Dict[str, float]]]:
+    """
+    Extract keywords with hashed TF-IDF, without building a vocabulary.
+
+    Texts are hashed in batches into a fixed 2^18 feature space, so memory
+    does not grow with the number of distinct terms. A first pass only
+    accumulates document frequencies; a second pass re-hashes each batch to
+    score it, so neither the texts nor their counts are held across batches.
+    Keyword strings are recovered by hashing only each text's own terms.
+
+    Args:
+        texts: Input texts; read twice, so a re-iterable such as a list
+            (not a one-shot iterator or generator)
+        top_n: Number of top keywords per text
+        batch_size: Texts hashed per batch
+        ngram_range: Range of n-grams (default: unigrams and bigrams)
+
+    Returns:
+        List of keyword lists, in input order
+
+    Raises:
+        TypeError: If texts is a one-shot iterator
+    """
+    if iter(texts) is texts:
+        raise TypeError("texts must be re-iterable (e.g. a list); it is read twice")
+
+    vectorizer = HashingVectorizer(
+        n_features=_HASHED_FEATURES,
+        analyzer=_word_analyzer(ngram_range),
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32
+    )
+    hasher = FeatureHasher(
+        n_features=_HASHED_FEATURES,
+        input_type='string',
+        alternate_sign=False
+    )
+    analyzer = vectorizer.analyzer
+
+    def iter_batches():
+        batch = []
+        for text in texts:
+            batch.append(text or '')
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    # Pass 1: document frequencies. Each CSR row stores a feature at most
+    # once, so counting indices counts documents.
+    doc_freq = np.zeros(_HASHED_FEATURES, dtype=np.int64)
+    n_docs = 0
+    for batch in iter_batches():
+        doc_freq += np.bincount(vectorizer.transform(batch).indices, minlength=_HASHED_FEATURES)
+        n_docs += len(batch)
+    if not n_docs:
         return []
 
+    try:
+        # Same smoothed IDF as TfidfTransformer(smooth_idf=True).fit()
+        transformer = TfidfTransformer(sublinear_tf=True)
+        transformer.idf_ = (np.log((1 + n_docs) / (1 + doc_freq)) + 1).astype(np.float32)
+        results = []
+        # Pass 2: score and name one batch at a time
+        for batch in iter_batches():
+            tfidf_matrix = transformer.transform(vectorizer.transform(batch)).tocsr()
+            for i, text in enumerate(batch):
+                row = tfidf_matrix.getrow(i)
+                if not row.nnz:
+                    results.append([])
+                    continue
+                # Name only this text's hashed features, renumbering the row
+                # into that small vocabulary; on a collision the first term in
+                # sorted order wins
+                terms = sorted(set(analyzer(text)))
+                hashed = hasher.transform([[t] for t in terms]).indices
+                keys, first = np.unique(hashed, return_index=True)
+                names = np.array(terms, dtype=object)[first]
+                row.indices = np.searchsorted(keys, row.indices).astype(row.indices.dtype)
+                results.append(_top_keywords(row, names, top_n))
+        return results
+    except Exception as e:
+        logger.error(f"Keyword extraction failed: {e}")
+        return [[] for _ in range(n_docs)]
+
+
+# Fitted corpus vectorizers, persisted across runs (one file per database)
+_TFIDF_CACHE_DIR = Path(
+    os.getenv("SCRAPETUI_CACHE_DIR", "~/.cache/scrapetui")
+).expanduser()
+
+
+def _tfidf_cache_path(db_file: str) -> Path:
+    """Cache file for a database's corpus vectorizer, keyed by its path."""
+    digest = hashlib.sha256(db_file.encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+    return _TFIDF_CACHE_DIR / f"tfidf_vec-{digest}.joblib"
+
+
+def _dump_atomic(value: Any, path: Path) -> None:
+    """
+    joblib.dump to a temp file beside path, then rename it into place.
+
+    Other processes memory-map the cache file, so it must never be truncated
+    or rewritten in place; os.replace swaps in a complete file atomically.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix='.tmp')
+    os.close(fd)
+    try:
+        joblib.dump(value, tmp_name)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# (signature, vectorizer) of the corpus vectorizer loaded in this process
+_corpus_vectorizer: Optional[Tuple[Tuple[Any, ...], TfidfVectorizer]] = None
+_corpus_vectorizer_lock = Lock()
+
+
+def _corpus_signature(conn) -> Tuple[Any, ...]:
+    """Cheap staleness key for the corpus: database file, row count, max rowid."""
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    count, max_rowid = conn.execute(
+        "SELECT COUNT(*), COALESCE(MAX(rowid), 0) FROM scraped_data"
+    ).fetchone()
+    return (db_file, count, max_rowid)
+
+
+def _get_corpus_vectorizer(conn, signature: Tuple[Any, ...]) -> TfidfVectorizer:
+    """
+    Get a TfidfVectorizer fitted on every article in the database.
+
+    The fitted vectorizer is kept in memory and dumped to a per-database file
+    under _TFIDF_CACHE_DIR; a new process memory-maps it back instead of
+    refitting. It is refitted whenever the corpus signature changes.
+    """
+    global _corpus_vectorizer
+    current = _corpus_vectorizer
+    if current is not None and current[0] == signature:
+        return current[1]
+
+    with _corpus_vectorizer_lock:
+        current = _corpus_vectorizer
+        if current is not None and current[0] == signature:  # Double-check locking
+            return current[1]
+        vectorizer = _load_corpus_vectorizer(conn, signature)
+        _corpus_vectorizer = (signature, vectorizer)
+        return vectorizer
+
+
+def _load_corpus_vectorizer(conn, signature: Tuple[Any, ...]) -> TfidfVectorizer:
+    """Load the persisted corpus vectorizer if current, else fit and persist one."""
+    vectorizer = None
+    # In-memory databases (no file) are not persisted
+    cache_path = _tfidf_cache_path(signature[0]) if signature[0] else None
+    try:
+        cached = joblib.load(cache_path, mmap_mode='r') if cache_path else {}
+        if cached.get('signature') == signature:
+            vectorizer = cached['vectorizer']
+    except Exception:
+        pass
+
+    if vectorizer is None:
+        texts = [
+            row[0] for row in
+            conn.execute(f"SELECT {_ARTICLE_TEXT_SQL} FROM scraped_data")
+        ]
+        vectorizer = TfidfVectorizer(
+            max_features=50000,
+            analyzer=_word_analyzer((1, 2)),
+            dtype=np.float32
+        ).fit(texts)
+        if cache_path is not None:
+            try:
+                # Uncompressed, so the IDF array can be memory-mapped on load
+                _dump_atomic({'signature': signature, 'vectorizer': vectorizer}, cache_path)
+            except OSError as e:
+                logger.warning(f"Could not persist TF-IDF vectorizer: {e}")
+
+    return vectorizer
+
 
 def extract_keywords_from_articles(
     article_ids: List[int],
@@ -169,6 +614,10 @@ def extract_keywords_from_articles(
     """
     Extract keywords from multiple articles.
 
+    Articles are scored with a vectorizer fitted on the whole database, so
+    IDF weights reflect every stored article. The fitted vectorizer is
+    persisted and only refitted when articles are added or removed.
+
     Args:
         article_ids: List of article IDs to process
         top_n: Number of top keywords per article
@@ -178,33 +627,202 @@ def extract_keywords_from_articles(
     """
     from ..core.database import get_db_connection
 
-    results = {}
+    results = {article_id: [] for article_id in article_ids}
 
     with get_db_connection() as conn:
-        for article_id in article_ids:
-            # Get article content
-            row = conn.execute(
-                "SELECT content, summary, title FROM scraped_data WHERE id = ?",
-                (article_id,)
-            ).fetchone()
-
-            if not row:
-                results[article_id] = []
-                continue
-
-            # Try content first, fall back to summary, then title
-            text = row[0] or row[1] or row[2] or ""
-
-            # Extract keywords
-            keywords = extract_keywords(text, top_n=top_n)
+        texts_by_id = _fetch_article_texts(conn, article_ids)
+        if not texts_by_id:
+            return results
+
+        # Scores depend on the corpus, so cache entries are keyed by it too
+        signature = _corpus_signature(conn)
+        pending = {}
+        for article_id, text in texts_by_id.items():
+            key = ('keywords', signature, _text_digest(text), top_n)
+            keywords = _cache_get(key)
+            if keywords is None:
+                pending[article_id] = key
+            else:
+                results[article_id] = keywords
+
+        if not pending:
+            return results
+
+        try:
+            vectorizer = _get_corpus_vectorizer(conn, signature)
+        except Exception as e:
+            logger.error(f"Keyword extraction failed: {e}")
+            return results
+
+    try:
+        tfidf_matrix = vectorizer.transform(
+            [texts_by_id[article_id] for article_id in pending]
+        ).tocsr()
+        feature_names = vectorizer.get_feature_names_out()
+        for row_index, (article_id, key) in enumerate(pending.items()):
+            keywords = _top_keywords(tfidf_matrix.getrow(row_index), feature_names, top_n)
+            if keywords:
+                _cache_put(key, keywords)
             results[article_id] = keywords
+    except Exception as e:
+        logger.error(f"Keyword extraction failed: {e}")
 
     return results
 
 
+# Rows of X per block when multiplying X @ X.T for TF-IDF duplicates
+_TFIDF_BLOCK_ROWS = 1024
+
+
+def _tfidf_duplicate_pairs(
+    articles: List[Dict[str, Any]],
+    threshold: float
+) -> List[Dict[str, Any]]:
+    """Find duplicate pairs by TF-IDF cosine similarity over title + content."""
+    indexed = []
+    for article in articles:
+        text = f"{article.get('title', '') or ''} {article.get('content', '') or ''}".strip()
+        if text:
+            indexed.append((article['id'], text))
+    if len(indexed) < 2:
+        return []
+
+    vectorizer = TfidfVectorizer(
+        analyzer=_word_analyzer((1, 2)),
+        max_features=50000,
+        dtype=np.float32,
+        sublinear_tf=True
+    )
+    try:
+        # Rows are L2-normalized, so X @ X.T is the cosine similarity
+        matrix = vectorizer.fit_transform([text for _, text in indexed]).tocsr()
+    except ValueError:
+        # Empty vocabulary (e.g. only stop words)
+        return []
+
+    # Multiply in row blocks so the similarity matrix is never held whole
+    duplicates = []
+    for start in range(0, matrix.shape[0], _TFIDF_BLOCK_ROWS):
+        block = (matrix[start:start + _TFIDF_BLOCK_ROWS] @ matrix.T).tocoo()
+        rows = block.row + start
+        keep = (rows < block.col) & (block.data >= threshold - 1e-6)
+        pairs = sorted(zip(rows[keep].tolist(), block.col[keep].tolist(),
+                           block.data[keep].tolist()))
+        for i, j, similarity in pairs:
+            duplicates.append({
+                'article1_id': indexed[i][0],
+                'article2_id': indexed[j][0],
+                'similarity': min(float(similarity), 1.0)
+            })
+    return duplicates
+
+
+# Score-matrix cells computed per rapidfuzz cdist call (~32 MB of float64)
+_CDIST_BLOCK_CELLS = 1 << 22
+
+
+def _sweep_duplicate_pairs(prepared: List[Tuple], threshold: float) -> List[Tuple]:
+    """Pairwise duplicate scan, one ratio call per surviving pair."""
+    # Sweep in title-length order. A title ratio (difflib or InDel) is at most
+    # 2*min(len)/(len1 + len2), and content adds at most 0.4, so once that
+    # bound drops below the threshold no longer title can match either.
+    prepared.sort(key=lambda p: p[0])
+    found = []
+    for pos, first in enumerate(prepared):
+        len1 = first[0]
+        for second in prepared[pos + 1:]:
+            title_bound = _length_bound(len1, second[0])
+            if 0.6 * title_bound + 0.4 < threshold - 1e-9:
+                break
+
+            # difflib's ratio is not symmetric; compare in input order
+            article1, article2 = (first, second) if first[1] < second[1] else (second, first)
+            _, index1, id1, title1, content1 = article1
+            _, index2, id2, title2, content2 = article2
+
+            # Weighted average (title more important than content)
+            # If no content, use title only. Each ratio is computed with
+            # the lowest score that could still reach the threshold, so
+            # hopeless pairs are rejected before the full comparison.
+            if content1 and content2:
+                content_bound = _length_bound(len(content1), len(content2))
+                if 0.6 * title_bound + 0.4 * content_bound < threshold - 1e-9:
+                    continue
+                title_sim = _text_ratio(
+                    title1, title2, (threshold - 0.4 * content_bound) / 0.6
+                )
+                if 0.6 * title_sim + 0.4 * content_bound < threshold - 1e-9:
+                    continue
+                content_sim = _text_ratio(
+                    content1, content2, (threshold - 0.6 * title_sim) / 0.4
+                )
+                similarity = 0.6 * title_sim + 0.4 * content_sim
+            else:
+                if title_bound < threshold - 1e-9:
+                    continue
+                similarity = _text_ratio(title1, title2, threshold)
+
+            # Check threshold
+            if similarity >= threshold:
+                found.append((index1, index2, id1, id2, similarity))
+
+    return found
+
+
+def _matrix_duplicate_pairs(prepared: List[Tuple], threshold: float) -> List[Tuple]:
+    """Duplicate scan scoring titles as rapidfuzz cdist matrix blocks."""
+    titles = [p[3] for p in prepared]
+    content_lens = np.array([len(p[4]) for p in prepared], dtype=np.float64)
+    has_content = content_lens > 0
+    count = len(prepared)
+    if count < 2:
+        return []
+
+    # Lowest title ratio that could still reach the threshold (content at most
+    # adds 0.4); cdist reports anything below it as 0
+    title_cutoff = max((threshold - 0.4) / 0.6 - 1e-9, 0.0)
+
+    found = []
+    block_rows = max(1, _CDIST_BLOCK_CELLS // count)
+    for start in range(0, count, block_rows):
+        stop = min(count, start + block_rows)
+        title_sims = _rapidfuzz_process.cdist(
+            titles[start:stop], titles[start:],
+            scorer=_rapidfuzz.ratio, score_cutoff=title_cutoff * 100.0,
+            dtype=np.float64, workers=-1
+        ) / 100.0
+
+        rows = np.arange(start, stop)[:, None]
+        cols = np.arange(start, count)[None, :]
+        both = has_content[rows] & has_content[cols]
+        len1, len2 = content_lens[rows], content_lens[cols]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            content_bound = np.where(both, 2.0 * np.minimum(len1, len2) / (len1 + len2), 0.0)
+        best = np.where(both, 0.6 * title_sims + 0.4 * content_bound, title_sims)
+        candidates = (cols > rows) & (best >= threshold - 1e-9)
+
+        for row, col in zip(*np.nonzero(candidates)):
+            i, j = start + int(row), start + int(col)
+            _, index1, id1, _, content1 = prepared[i]
+            _, index2, id2, _, content2 = prepared[j]
+            title_sim = float(title_sims[row, col])
+            if both[row, col]:
+                content_sim = _text_ratio(
+                    content1, content2, (threshold - 0.6 * title_sim) / 0.4
+                )
+                similarity = 0.6 * title_sim + 0.4 * content_sim
+            else:
+                similarity = title_sim
+            if similarity >= threshold:
+                found.append((index1, index2, id1, id2, similarity))
+    return found
+
+
 def detect_duplicates(
     articles: List[Dict[str, Any]],
-    threshold: float = 0.85
+    threshold: float = 0.85,
+    method: str = 'fuzzy',
+    min_length: int = 0
 ) -> List[Dict[str, Any]]:
     """
     Detect duplicate articles using fuzzy text matching.
@@ -212,6 +830,11 @@ def detect_duplicates(
     Args:
         articles: List of article dicts with 'id', 'title', 'content' keys
         threshold: Similarity threshold (0.0-1.0), default 0.85
+        method: 'fuzzy' for weighted character-level title/content ratios,
+            or 'tfidf' for word n-gram TF-IDF cosine similarity (one sparse
+            matrix product over the whole corpus; scales to large sets)
+        min_length: Skip articles whose title plus content is shorter than
+            this many characters (default 0: compare every non-empty article)
 
     Returns:
         List of duplicate pairs with similarity scores
@@ -225,59 +848,51 @@ def detect_duplicates(
         >>> duplicates[0]
         {'article1_id': 1, 'article2_id': 2, 'similarity': 0.95}
     """
+    if min_length > 0:
+        articles = [
+            article for article in articles
+            if len(article.get('title', '') or '') + len(article.get('content', '') or '') >= min_length
+        ]
     if not articles:
         return []
 
-    duplicates = []
-    n = len(articles)
-
     try:
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Get article data
-                article1 = articles[i]
-                article2 = articles[j]
-
-                # Extract fields with fallbacks
-                title1 = article1.get('title', '') or ''
-                title2 = article2.get('title', '') or ''
-                content1 = article1.get('content', '') or ''
-                content2 = article2.get('content', '') or ''
-
-                # Skip if both articles have no content
-                if not (title1 or content1) or not (title2 or content2):
-                    continue
-
-                # Calculate similarity for titles
-                title_sim = SequenceMatcher(None, title1, title2).ratio()
-
-                # Calculate similarity for content
-                content_sim = SequenceMatcher(None, content1, content2).ratio()
-
-                # Weighted average (title more important than content)
-                # If no content, use title only
-                if content1 and content2:
-                    similarity = 0.6 * title_sim + 0.4 * content_sim
-                else:
-                    similarity = title_sim
-
-                # Check threshold
-                if similarity >= threshold:
-                    duplicates.append({
-                        'article1_id': article1['id'],
-                        'article2_id': article2['id'],
-                        'similarity': similarity
-                    })
-
-        return duplicates
+        if method == 'tfidf':
+            return _tfidf_duplicate_pairs(articles, threshold)
+
+        # Articles with neither title nor content are never compared
+        prepared = []
+        for index, article in enumerate(articles):
+            title = article.get('title', '') or ''
+            content = article.get('content', '') or ''
+            if title or content:
+                prepared.append((len(title), index, article['id'], title, content))
+
+        if _rapidfuzz_process is not None:
+            found = _matrix_duplicate_pairs(prepared, threshold)
+        else:
+            found = _sweep_duplicate_pairs(prepared, threshold)
+
+        # Report pairs in input order, as a plain pairwise scan would
+        found.sort(key=lambda f: (f[0], f[1]))
+        return [
+            {'article1_id': id1, 'article2_id': id2, 'similarity': similarity}
+            for _, _, id1, id2, similarity in found
+        ]
     except Exception as e:
         logger.error(f"Duplicate detection failed: {e}")
         return []
 
 
+# Rows per fetchmany() page when reading articles for duplicate detection
+_DB_FETCH_ROWS = 10000
+
+
 def detect_duplicates_from_db(
     threshold: float = 0.85,
-    limit: Optional[int] = None
+    limit: Optional[int] = None,
+    method: str = 'fuzzy',
+    min_length: int = 0
 ) -> List[Dict[str, Any]]:
     """
     Detect duplicate articles in database.
@@ -285,6 +900,8 @@ def detect_duplicates_from_db(
     Args:
         threshold: Similarity threshold (0.0-1.0)
         limit: Optional limit on number of articles to check
+        method: 'fuzzy' or 'tfidf' (see detect_duplicates)
+        min_length: Minimum title plus content length (see detect_duplicates)
 
     Returns:
         List of duplicate pairs with article IDs and similarity scores
@@ -293,25 +910,33 @@ def detect_duplicates_from_db(
 
     try:
         with get_db_connection() as conn:
-            # Fetch articles
-            query = "SELECT id, title, content FROM scraped_data"
+            # Articles with neither title nor content can never match, so
+            # SQLite drops them and fills NULLs before Python sees a row
+            query = """
+                SELECT id, COALESCE(title, '') AS title, COALESCE(content, '') AS content
+                FROM scraped_data
+                WHERE length(title) > 0 OR length(content) > 0
+            """
+            params = ()
             if limit:
-                query += f" LIMIT {limit}"
-
-            rows = conn.execute(query).fetchall()
-
-            # Convert to list of dicts
-            articles = [
-                {
-                    'id': row['id'],
-                    'title': row['title'] or '',
-                    'content': row['content'] or ''
-                }
-                for row in rows
-            ]
+                query += " LIMIT ?"
+                params = (int(limit),)
+
+            cursor = conn.execute(query, params)
+            articles = []
+            while True:
+                rows = cursor.fetchmany(_DB_FETCH_ROWS)
+                if not rows:
+                    break
+                articles.extend(
+                    {'id': row['id'], 'title': row['title'], 'content': row['content']}
+                    for row in rows
+                )
 
         # Detect duplicates
-        return detect_duplicates(articles, threshold=threshold)
+        return detect_duplicates(
+            articles, threshold=threshold, method=method, min_length=min_length
+        )
     except Exception as e:
         logger.error(f"Database duplicate detection failed: {e}")
         return []
@@ -5,11 +5,24 @@ This module provides question answering capabilities using TF-IDF-based
 relevance scoring and optional AI provider integration for generating answers.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional, Tuple
+import asyncio
+import hashlib
+import io
 import json
+import sqlite3
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from pathlib import Path
+import numpy as np
+
+from ._text import tokenize_words
+
+# scikit-learn is imported where it is used, so loading this module (and the
+# TUI) does not pay for it until a question is asked
+if TYPE_CHECKING:
+    from sklearn.pipeline import Pipeline
 
 try:
     from ..utils.logging import get_logger
@@ -19,13 +32,291 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
+# Terms are hashed into a fixed feature space instead of a fitted vocabulary
+_VECTORIZER_KWARGS = {
+    'n_features': 2 ** 14,
+    'alternate_sign': False,
+    'norm': None,
+    'analyzer': tokenize_words,
+}
+
+# Leading characters of each article scored for relevance (the AI context
+# only ever uses the first 2000); the full text is kept for the prompt
+_MAX_RELEVANCE_CHARS = 4000
+
+# Rankings of recent (question, corpus, top_n), least recently used first:
+# key -> (similarities, ranked indices)
+_RETRIEVAL_CACHE_SIZE = 128
+_retrieval_cache: "OrderedDict[Tuple[str, str, int], Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_retrieval_lock = threading.Lock()
+
+# Articles last loaded by answer_from_database, per (user_id, limit), least
+# recently used first: (row fingerprint, articles). Reused while the
+# fingerprint is unchanged. Each entry holds full article texts, so only a
+# few users' sets are kept.
+_DB_ARTICLES_CACHE_SIZE = 8
+_db_articles_cache: "OrderedDict[Tuple[Optional[int], int], Tuple[str, List[Dict[str, Any]]]]" = OrderedDict()
+_db_articles_lock = threading.Lock()
+
+# Cheap per-row change signal: lengths plus the start of the content
+_ROW_FINGERPRINT_SQL = (
+    "id || '|' || IFNULL(length(title), -1) || '|' || IFNULL(length(summary), -1)"
+    " || '|' || IFNULL(length(url), -1) || '|' || IFNULL(length(content), -1)"
+    " || '|' || IFNULL(substr(content, 1, 64), '')"
+)
+
+
+_QA_HISTORY_DDL = """
+    CREATE TABLE IF NOT EXISTS qa_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        question TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        article_ids TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        created_at TEXT NOT NULL
+    )
+"""
+
+# Same index as the main schema, so ORDER BY created_at DESC LIMIT ? walks
+# the index backwards instead of sorting the whole table
+_QA_HISTORY_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS idx_qa_history_created ON qa_history (created_at)"
+)
+
+try:
+    from ..core.database import _db_file_identity
+except ImportError:
+    def _db_file_identity(db_path):
+        # No inode available: readiness is then never cached
+        return str(db_path), None
+
+# Database files (path, inode) whose qa_history table is known to exist,
+# mapped to the schema_version seen right after the DDL ran
+_qa_history_ready: Dict[Any, int] = {}
+
+
+def _ensure_qa_history(conn) -> None:
+    """
+    Create the qa_history table and its index once per database file.
+
+    Tracked by file identity and schema cookie like the entity tables, since
+    sqlite3.Connection cannot be weakly referenced and a database re-created
+    at the same path must not count as ready. In-memory databases always run
+    the (idempotent) DDL.
+    """
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    identity = _db_file_identity(Path(db_file)) if db_file else None
+    if identity is not None and identity[1] is not None:
+        ready_version = _qa_history_ready.get(identity)
+        if (ready_version is not None
+                and ready_version == conn.execute("PRAGMA schema_version").fetchone()[0]):
+            return
+    conn.execute(_QA_HISTORY_DDL)
+    conn.execute(_QA_HISTORY_INDEX_DDL)
+    if identity is not None and identity[1] is not None:
+        _qa_history_ready[identity] = conn.execute("PRAGMA schema_version").fetchone()[0]
+
+
+def _encode_article_ids(article_ids: List[int]) -> str:
+    """Serialize source article IDs as compact JSON ("[1,2,3]")."""
+    return '[' + ','.join(map(str, article_ids)) + ']'
+
+
+def _decode_article_ids(text: Optional[str]) -> List[int]:
+    """
+    Parse a stored article_ids value.
+
+    Integer lists are split directly instead of going through the JSON
+    parser; anything else (older rows, hand-written values) falls back to
+    json.loads.
+    """
+    if not text:
+        return []
+    inner = text.strip()[1:-1].replace(' ', '')
+    if not inner:
+        return []
+    try:
+        return [int(x) for x in inner.split(',')]
+    except ValueError:
+        return json.loads(text)
+
+
+def _insert_qa_rows(conn, rows: List[Tuple], commit: bool) -> None:
+    """Insert qa_history rows with one executemany, then optionally commit."""
+    # Ensure qa_history table exists
+    _ensure_qa_history(conn)
+
+    conn.executemany("""
+        INSERT INTO qa_history
+        (question, answer, article_ids, confidence, created_at)
+        VALUES (?, ?, ?, ?, ?)
+    """, rows)
+
+    if commit:
+        conn.commit()
+
+
+def _corpus_fingerprint(article_texts: List[str]) -> str:
+    """SHA-256 over the article texts, NUL-separated."""
+    digest = hashlib.sha256()
+    for text in article_texts:
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _top_indices(similarities: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest similarities, best first.
+
+    Partitions out the top k before sorting them, instead of sorting every
+    score. Within the selection, ties rank the later article first, as
+    argsort()[::-1] does.
+    """
+    n = similarities.size
+    if k >= n:
+        return similarities.argsort()[::-1]
+    part = np.argpartition(-similarities, k - 1)[:k]
+    return part[np.lexsort((-part, -similarities[part]))]
+
+
+def _iter_qa_rows(conn, limit: int) -> Iterator[Dict[str, Any]]:
+    """Yield qa_history rows as dicts, newest first, straight off the cursor."""
+    # Ensure table exists
+    _ensure_qa_history(conn)
+
+    # Row factory on the cursor only, so a caller's connection is untouched
+    cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
+    cursor.execute("""
+        SELECT question, answer, article_ids, confidence, created_at
+        FROM qa_history
+        ORDER BY created_at DESC
+        LIMIT ?
+    """, (limit,))
+
+    for row in cursor:
+        item = dict(row)
+        item['article_ids'] = _decode_article_ids(item['article_ids'])
+        yield item
+
+
 class QuestionAnsweringManager:
     """Manager for question answering from article content."""
 
+    # Vectorizer fitted on the last article corpus, shared by every call:
+    # (corpus fingerprint, vectorizer, article TF-IDF matrix)
+    _corpus_cache: Optional[Tuple[str, "Pipeline", Any]] = None
+
     def __init__(self):
         """Initialize the Question Answering Manager."""
         self._vectorizer = None
 
+    @classmethod
+    def _fit_corpus(
+        cls,
+        article_texts: List[str],
+        fingerprint: Optional[str] = None
+    ) -> Tuple["Pipeline", Any]:
+        """
+        Get a vectorizer and TF-IDF matrix for the article texts.
+
+        Repeated questions over the same articles reuse the previous fit, so
+        only the question itself has to be transformed.
+        """
+        if fingerprint is None:
+            fingerprint = _corpus_fingerprint(article_texts)
+
+        cached = cls._corpus_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1], cached[2]
+
+        from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+        from sklearn.pipeline import make_pipeline
+
+        # Hashed term counts need no vocabulary; only the IDF weights are fitted
+        hasher = HashingVectorizer(**_VECTORIZER_KWARGS)
+        vectorizer = make_pipeline(hasher, TfidfTransformer())
+        article_vecs = vectorizer.fit_transform(article_texts)
+        cls._corpus_cache = (fingerprint, vectorizer, article_vecs)
+        return vectorizer, article_vecs
+
+    @classmethod
+    def _retrieve(
+        cls,
+        question: str,
+        article_texts: List[str],
+        top_n: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank article texts by relevance to the question.
+
+        Deterministic for a given (question, corpus, top_n), so rankings are
+        kept in a small LRU cache; retries and repeated questions skip the
+        TF-IDF work and only redo generation.
+
+        Returns:
+            (similarities, indices best first); both arrays are read-only
+        """
+        fingerprint = _corpus_fingerprint(article_texts)
+        key = (question, fingerprint, top_n)
+        with _retrieval_lock:
+            cached = _retrieval_cache.get(key)
+            if cached is not None:
+                _retrieval_cache.move_to_end(key)
+                return cached
+
+        if len(article_texts) == 1:
+            # A single candidate is the answer source; nothing to rank
+            similarities = np.ones(1)
+            sorted_indices = np.zeros(1, dtype=int)
+        else:
+            # Use TF-IDF (fitted on the articles, reused across questions)
+            # to find most relevant articles
+            vectorizer, article_vecs = cls._fit_corpus(article_texts, fingerprint)
+            question_vec = vectorizer.transform([question])
+
+            if question_vec.nnz == 0:
+                # Hashed features need no vocabulary, so this only happens
+                # when the question has no tokens left after stop-word
+                # removal: all scores are zero, so keep the order an argsort
+                # of ties would give
+                similarities = np.zeros(len(article_texts))
+                sorted_indices = np.arange(len(article_texts))[::-1]
+            else:
+                # Rows are L2-normalized by the TfidfTransformer, so the
+                # sparse dot product is the cosine similarity (without
+                # cosine_similarity's validation and re-normalization)
+                similarities = (article_vecs @ question_vec.T).toarray().ravel()
+
+                # Rank articles by relevance (only the top_n are used)
+                sorted_indices = _top_indices(similarities, top_n)
+
+        # Shared through the cache, so callers must not modify them
+        similarities.setflags(write=False)
+        sorted_indices = np.ascontiguousarray(sorted_indices)
+        sorted_indices.setflags(write=False)
+
+        with _retrieval_lock:
+            _retrieval_cache[key] = (similarities, sorted_indices)
+            _retrieval_cache.move_to_end(key)
+            if len(_retrieval_cache) > _RETRIEVAL_CACHE_SIZE:
+                _retrieval_cache.popitem(last=False)
+        return similarities, sorted_indices
+
+    @staticmethod
+    def _generate(ai_provider, question: str, context: str) -> Optional[str]:
+        """Ask the AI provider to answer the question from the article context."""
+        # Create prompt for AI provider
+        prompt = f"""Based on the following articles, answer this question: {question}
+
+Articles:
+{context}
+
+Provide a concise, accurate answer based only on the information in the articles above."""
+
+        return ai_provider.get_summary(prompt, style='concise')
+
     @staticmethod
     def answer_question(
         question: str,
@@ -65,20 +356,24 @@ class QuestionAnsweringManager:
                 'confidence': 0.0
             }
 
-        # Extract text from articles
+        # Extract text from articles into parallel lists (one entry per
+        # candidate), stopping once top_n candidates are found
         article_texts = []
-        article_data = []
+        ids = []
+        titles = []
+        urls = []
+        contents = []
 
         for article in articles:
+            if len(article_texts) >= top_n:
+                break
             text = article.get('content') or article.get('summary') or article.get('title', '')
             if text and text.strip():
-                article_texts.append(text)
-                article_data.append({
-                    'id': article.get('id'),
-                    'title': article.get('title', ''),
-                    'url': article.get('url', ''),
-                    'content': text
-                })
+                article_texts.append(text[:_MAX_RELEVANCE_CHARS])
+                ids.append(article.get('id'))
+                titles.append(article.get('title', ''))
+                urls.append(article.get('url', ''))
+                contents.append(text)
 
         if not article_texts:
             # No valid content found
@@ -88,48 +383,33 @@ class QuestionAnsweringManager:
                 'confidence': 0.0
             }
 
-        # Limit number of articles to process
-        if len(article_texts) > top_n:
-            article_texts = article_texts[:top_n]
-            article_data = article_data[:top_n]
-
         try:
-            # Use TF-IDF to find most relevant articles
-            vectorizer = TfidfVectorizer(max_features=500, stop_words='english')
-
-            # Add question to corpus for similarity calculation
-            all_texts = article_texts + [question]
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
-
-            # Calculate similarity between question and each article
-            question_vec = tfidf_matrix[-1]
-            article_vecs = tfidf_matrix[:-1]
-            similarities = cosine_similarity(question_vec, article_vecs)[0]
-
-            # Sort articles by relevance
-            sorted_indices = similarities.argsort()[::-1]
-
-            # Build sources list with relevance scores
-            sources = []
-            for idx in sorted_indices:
-                if similarities[idx] > 0.01:  # Minimum relevance threshold (lowered from 0.05)
-                    article = article_data[idx]
-                    sources.append({
-                        'article_id': article['id'],
-                        'title': article['title'],
-                        'url': article['url'],
-                        'relevance': float(similarities[idx])
-                    })
+            similarities, sorted_indices = QuestionAnsweringManager._retrieve(
+                question, article_texts, top_n
+            )
+
+            # Build sources list with relevance scores: one mask over the
+            # ranking keeps articles above the minimum relevance threshold
+            # (lowered from 0.05), in ranked order
+            relevant = sorted_indices[similarities[sorted_indices] > 0.01]
+            sources = [
+                {
+                    'article_id': ids[idx],
+                    'title': titles[idx],
+                    'url': urls[idx],
+                    'relevance': relevance
+                }
+                for idx, relevance in zip(relevant.tolist(), similarities[relevant].tolist())
+            ]
 
             # If no highly relevant sources, still use the best match if we have articles
-            if not sources and len(article_data) > 0:
+            if not sources and len(ids) > 0:
                 # Use the top article even with low relevance
                 idx = sorted_indices[0]
-                article = article_data[idx]
                 sources.append({
-                    'article_id': article['id'],
-                    'title': article['title'],
-                    'url': article['url'],
+                    'article_id': ids[idx],
+                    'title': titles[idx],
+                    'url': urls[idx],
                     'relevance': float(similarities[idx])
                 })
 
@@ -143,7 +423,6 @@ class QuestionAnsweringManager:
 
             # Get top article for answer extraction
             top_idx = sorted_indices[0]
-            article_data[top_idx]
             confidence = float(similarities[top_idx])
 
             # Try to get AI provider for natural language answer
@@ -162,36 +441,32 @@ class QuestionAnsweringManager:
                     'confidence': 0.0
                 }
 
-            # Build context from top articles
-            context_parts = []
+            # Build context from top articles, measuring each part before
+            # writing it so nothing is sliced or copied just to be measured
+            buffer = io.StringIO()
             total_length = 0
 
             for i, idx in enumerate(sorted_indices[:top_n], 1):
                 if similarities[idx] > 0.05:
-                    article = article_data[idx]
-                    content = article['content'][:2000]  # Limit per article
-
-                    context_part = f"Article {i}: {article['title']}\n{content}\n"
+                    header = f"Article {i}: {titles[idx]}\n"
+                    content_length = min(2000, len(contents[idx]))  # Limit per article
+                    part_length = len(header) + content_length + 1
 
-                    if total_length + len(context_part) > max_context_length:
+                    if total_length + part_length > max_context_length:
                         break
 
-                    context_parts.append(context_part)
-                    total_length += len(context_part)
+                    if total_length:
+                        buffer.write("\n")
+                    buffer.write(header)
+                    buffer.write(contents[idx][:content_length])
+                    buffer.write("\n")
+                    total_length += part_length
 
-            context = "\n".join(context_parts)
-
-            # Create prompt for AI provider
-            prompt = f"""Based on the following articles, answer this question: {question}
-
-Articles:
-{context}
-
-Provide a concise, accurate answer based only on the information in the articles above."""
+            context = buffer.getvalue()
 
             # Generate answer using AI provider
             try:
-                answer = ai_provider.get_summary(prompt, style='concise')
+                answer = QuestionAnsweringManager._generate(ai_provider, question, context)
 
                 return {
                     'answer': answer,
@@ -216,6 +491,35 @@ Provide a concise, accurate answer based only on the information in the articles
                 'confidence': 0.0
             }
 
+    @staticmethod
+    async def answer_question_async(
+        question: str,
+        articles: List[Dict[str, Any]],
+        top_n: int = 5,
+        max_context_length: int = 10000
+    ) -> Dict[str, Any]:
+        """
+        Answer a question without blocking the event loop.
+
+        Runs answer_question (TF-IDF ranking and the AI provider call) in a
+        worker thread, so the TUI keeps rendering while the provider responds.
+        Cancelling the awaiting task abandons the result; the provider request
+        itself runs to completion in its thread.
+
+        Args:
+            question: The question to answer
+            articles: List of article dicts with 'content', 'title', 'id', 'url' keys
+            top_n: Number of top relevant articles to use (default: 5)
+            max_context_length: Maximum context length for AI provider (default: 10000)
+
+        Returns:
+            Dict with 'answer', 'sources', 'confidence' keys
+        """
+        return await asyncio.to_thread(
+            QuestionAnsweringManager.answer_question,
+            question, articles, top_n, max_context_length
+        )
+
     @staticmethod
     def answer_from_database(question: str, limit: int = 10, user_id: Optional[int] = None) -> Dict[str, Any]:
         """
@@ -236,28 +540,43 @@ Provide a concise, accurate answer based only on the information in the articles
             get_db_connection = scrapetui.get_db_connection
 
         articles = []
+        if user_id is not None:
+            where, params = " WHERE user_id = ?", (user_id, limit)
+        else:
+            where, params = "", (limit,)
 
         try:
             with get_db_connection() as conn:
-                if user_id is not None:
-                    rows = conn.execute(
-                        "SELECT id, title, content, summary, url FROM scraped_data WHERE user_id = ? LIMIT ?",
-                        (user_id, limit)
-                    ).fetchall()
+                # Fingerprint the selected rows first; full rows are only
+                # fetched again when one of them changed
+                fingerprint_rows = conn.execute(
+                    f"SELECT {_ROW_FINGERPRINT_SQL} FROM scraped_data{where} LIMIT ?",
+                    params
+                ).fetchall()
+                fingerprint = hashlib.sha256(
+                    "\n".join(row[0] for row in fingerprint_rows).encode('utf-8', 'surrogatepass')
+                ).hexdigest()
+
+                cache_key = (user_id, limit)
+                with _db_articles_lock:
+                    cached = _db_articles_cache.get(cache_key)
+                    if cached is not None:
+                        _db_articles_cache.move_to_end(cache_key)
+                if cached is not None and cached[0] == fingerprint:
+                    articles = cached[1]
                 else:
-                    rows = conn.execute(
-                        "SELECT id, title, content, summary, url FROM scraped_data LIMIT ?",
-                        (limit,)
-                    ).fetchall()
-
-                for row in rows:
-                    articles.append({
-                        'id': row[0],
-                        'title': row[1],
-                        'content': row[2],
-                        'summary': row[3],
-                        'url': row[4]
-                    })
+                    cursor = conn.cursor()
+                    cursor.row_factory = sqlite3.Row
+                    cursor.execute(
+                        f"SELECT id, title, content, summary, url FROM scraped_data{where} LIMIT ?",
+                        params
+                    )
+                    articles = [dict(row) for row in cursor]
+                    with _db_articles_lock:
+                        _db_articles_cache[cache_key] = (fingerprint, articles)
+                        _db_articles_cache.move_to_end(cache_key)
+                        if len(_db_articles_cache) > _DB_ARTICLES_CACHE_SIZE:
+                            _db_articles_cache.popitem(last=False)
         except Exception as e:
             logger.error(f"Database query failed: {e}")
             return {
@@ -274,7 +593,8 @@ Provide a concise, accurate answer based only on the information in the articles
         answer: str,
         article_ids: List[int],
         confidence: float,
-        conn=None
+        conn=None,
+        commit: bool = True
     ) -> bool:
         """
         Save a Q&A conversation to the database.
@@ -285,6 +605,32 @@ Provide a concise, accurate answer based only on the information in the articles
             article_ids: List of article IDs used as sources
             confidence: Confidence score (0.0 to 1.0)
             conn: Optional database connection (for testing)
+            commit: Commit immediately (default: True). Pass False only when
+                the caller commits: on its own connection, or inside an
+                enclosing get_db_connection() block (uncommitted work is
+                rolled back when the outermost block exits)
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        return QuestionAnsweringManager.save_qa_conversations(
+            [(question, answer, article_ids, confidence)], conn=conn, commit=commit
+        )
+
+    @staticmethod
+    def save_qa_conversations(
+        conversations: List[Tuple[str, str, List[int], float]],
+        conn=None,
+        commit: bool = True
+    ) -> bool:
+        """
+        Save several Q&A conversations in a single transaction.
+
+        Args:
+            conversations: (question, answer, article_ids, confidence) tuples
+            conn: Optional database connection (for testing)
+            commit: Commit once after all inserts (default: True); see
+                save_qa_conversation for when False is safe
 
         Returns:
             True if saved successfully, False otherwise
@@ -295,6 +641,12 @@ Provide a concise, accurate answer based only on the information in the articles
             import scrapetui
             _get_db_conn = scrapetui.get_db_connection
 
+        created_at = datetime.now().isoformat()
+        rows = [
+            (question, answer, _encode_article_ids(article_ids), confidence, created_at)
+            for question, answer, article_ids, confidence in conversations
+        ]
+
         try:
             # If connection provided (from tests), use it directly
             if conn is not None:
@@ -303,68 +655,51 @@ Provide a concise, accurate answer based only on the information in the articles
                     # It's a context manager, enter it
                     conn = conn.__enter__()
 
-                # Ensure qa_history table exists
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS qa_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        question TEXT NOT NULL,
-                        answer TEXT NOT NULL,
-                        article_ids TEXT NOT NULL,
-                        confidence REAL NOT NULL,
-                        created_at TEXT NOT NULL
-                    )
-                """)
-
-                # Insert conversation
-                conn.execute("""
-                    INSERT INTO qa_history
-                    (question, answer, article_ids, confidence, created_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    question,
-                    answer,
-                    json.dumps(article_ids),
-                    confidence,
-                    datetime.now().isoformat()
-                ))
-
-                conn.commit()
+                _insert_qa_rows(conn, rows, commit)
                 return True
             else:
                 # Use context manager for production code
                 with _get_db_conn() as conn:
-                    # Ensure qa_history table exists
-                    conn.execute("""
-                        CREATE TABLE IF NOT EXISTS qa_history (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            question TEXT NOT NULL,
-                            answer TEXT NOT NULL,
-                            article_ids TEXT NOT NULL,
-                            confidence REAL NOT NULL,
-                            created_at TEXT NOT NULL
-                        )
-                    """)
-
-                    # Insert conversation
-                    conn.execute("""
-                        INSERT INTO qa_history
-                        (question, answer, article_ids, confidence, created_at)
-                        VALUES (?, ?, ?, ?, ?)
-                    """, (
-                        question,
-                        answer,
-                        json.dumps(article_ids),
-                        confidence,
-                        datetime.now().isoformat()
-                    ))
-
-                    conn.commit()
+                    _insert_qa_rows(conn, rows, commit)
                     return True
 
         except Exception as e:
             logger.error(f"Failed to save Q&A conversation: {e}")
             return False
 
+    @staticmethod
+    def iter_qa_history(limit: int = 20, conn=None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream Q&A conversation history, newest first.
+
+        Rows are read from the cursor and converted one at a time, so callers
+        that stop early never fetch or parse the rest. Database errors are
+        raised to the caller.
+
+        Args:
+            limit: Maximum number of entries to retrieve (default: 20)
+            conn: Optional database connection (for testing)
+
+        Yields:
+            Conversation dicts with question, answer, article_ids, confidence, created_at
+        """
+        if conn is not None:
+            # Handle both actual connections and context managers
+            if hasattr(conn, '__enter__') and not hasattr(conn, 'execute'):
+                # It's a context manager, enter it
+                conn = conn.__enter__()
+            yield from _iter_qa_rows(conn, limit)
+        else:
+            try:
+                from ..core.database import get_db_connection as _get_db_conn
+            except ImportError:
+                import scrapetui
+                _get_db_conn = scrapetui.get_db_connection
+
+            # Use context manager for production code
+            with _get_db_conn() as conn:
+                yield from _iter_qa_rows(conn, limit)
+
     @staticmethod
     def get_qa_history(limit: int = 20, conn=None) -> List[Dict[str, Any]]:
         """
@@ -378,83 +713,7 @@ Provide a concise, accurate answer based only on the information in the articles
             List of conversation dicts with question, answer, article_ids, confidence, created_at
         """
         try:
-            from ..core.database import get_db_connection as _get_db_conn
-        except ImportError:
-            import scrapetui
-            _get_db_conn = scrapetui.get_db_connection
-
-        try:
-            # If connection provided (from tests), use it directly
-            if conn is not None:
-                # Handle both actual connections and context managers
-                if hasattr(conn, '__enter__') and not hasattr(conn, 'execute'):
-                    # It's a context manager, enter it
-                    conn = conn.__enter__()
-
-                # Ensure table exists
-                conn.execute("""
-                    CREATE TABLE IF NOT EXISTS qa_history (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        question TEXT NOT NULL,
-                        answer TEXT NOT NULL,
-                        article_ids TEXT NOT NULL,
-                        confidence REAL NOT NULL,
-                        created_at TEXT NOT NULL
-                    )
-                """)
-
-                rows = conn.execute("""
-                    SELECT question, answer, article_ids, confidence, created_at
-                    FROM qa_history
-                    ORDER BY created_at DESC
-                    LIMIT ?
-                """, (limit,)).fetchall()
-
-                history = []
-                for row in rows:
-                    history.append({
-                        'question': row[0],
-                        'answer': row[1],
-                        'article_ids': json.loads(row[2]),
-                        'confidence': row[3],
-                        'created_at': row[4]
-                    })
-
-                return history
-            else:
-                # Use context manager for production code
-                with _get_db_conn() as conn:
-                    # Ensure table exists
-                    conn.execute("""
-                        CREATE TABLE IF NOT EXISTS qa_history (
-                            id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            question TEXT NOT NULL,
-                            answer TEXT NOT NULL,
-                            article_ids TEXT NOT NULL,
-                            confidence REAL NOT NULL,
-                            created_at TEXT NOT NULL
-                        )
-                    """)
-
-                    rows = conn.execute("""
-                        SELECT question, answer, article_ids, confidence, created_at
-                        FROM qa_history
-                        ORDER BY created_at DESC
-                        LIMIT ?
-                    """, (limit,)).fetchall()
-
-                    history = []
-                    for row in rows:
-                        history.append({
-                            'question': row[0],
-                            'answer': row[1],
-                            'article_ids': json.loads(row[2]),
-                            'confidence': row[3],
-                            'created_at': row[4]
-                        })
-
-                    return history
-
+            return list(QuestionAnsweringManager.iter_qa_history(limit, conn=conn))
         except Exception as e:
             logger.error(f"Failed to retrieve Q&A history: {e}")
             return []
@@ -5,9 +5,21 @@ This module provides comprehensive summary quality evaluation including
 ROUGE-N scores, coherence analysis, and overall quality scoring.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
+import hashlib
 import re
-from collections import Counter
+from array import array
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from functools import wraps
+from threading import Lock
+import numpy as np
+
+# Optional: JIT-compiled LCS kernel
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 try:
     from ..utils.logging import get_logger
@@ -17,6 +29,160 @@ except ImportError:
     logger = logging.getLogger(__name__)
 
 
+# Memoized results per scoring function; the metrics are pure functions of
+# their text arguments, and batch evaluation re-scores unchanged articles.
+# Keys are digests of the texts, so an entry costs a few hundred bytes
+# however long the article is.
+_SCORE_CACHE_SIZE = 1024
+
+
+def _text_key(text: Optional[str]) -> bytes:
+    """Fixed-size cache key for a text argument."""
+    return hashlib.blake2b((text or '').encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _digest_lru_cache(maxsize: int) -> Callable:
+    """
+    LRU-memoize a function of text arguments, keyed by their digests.
+
+    Unlike functools.lru_cache the texts themselves are not retained. The
+    wrapper exposes cache_clear() like lru_cache.
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[tuple, Any]" = OrderedDict()
+        lock = Lock()
+
+        @wraps(func)
+        def wrapper(*texts):
+            key = tuple(map(_text_key, texts))
+            with lock:
+                if key in cache:
+                    cache.move_to_end(key)
+                    return cache[key]
+            result = func(*texts)
+            with lock:
+                cache[key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+# Word tokens and sentence terminators, compiled once
+_WORD_RE = re.compile(r'\w+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+
+
+def _lcs_dp_kernel(ids1: np.ndarray, ids2: np.ndarray) -> int:
+    """Two-row LCS DP over int32 token IDs (compiled with numba when available)."""
+    n = ids2.shape[0]
+    prev = np.zeros(n + 1, dtype=np.int32)
+    curr = np.zeros(n + 1, dtype=np.int32)
+    for i in range(ids1.shape[0]):
+        x = ids1[i]
+        for j in range(1, n + 1):
+            if x == ids2[j - 1]:
+                curr[j] = prev[j - 1] + 1
+            elif prev[j] >= curr[j - 1]:
+                curr[j] = prev[j]
+            else:
+                curr[j] = curr[j - 1]
+        prev, curr = curr, prev
+    return prev[n]
+
+
+if njit is not None:
+    _lcs_dp_kernel = njit(cache=True)(_lcs_dp_kernel)
+
+# Hunt-Szymanski pays a bisect per matching token pair; above roughly this
+# many DP cells per match, the DP is cheaper (far more so once compiled)
+_HS_MATCH_COST = 4 if njit is None else 256
+
+
+def _clipped_overlap(counts1: Counter, counts2: Counter) -> int:
+    """
+    Sum of min(count1, count2) over shared n-grams.
+
+    Same as sum((counts1 & counts2).values()), but iterates the smaller
+    Counter and probes the larger one without building the intersection.
+    """
+    if len(counts1) > len(counts2):
+        counts1, counts2 = counts2, counts1
+    overlap = 0
+    for gram, count in counts1.items():
+        other = counts2.get(gram)
+        if other:
+            overlap += count if count < other else other
+    return overlap
+
+
+def _lcs_dp(seq1: List[str], seq2: List[str]) -> int:
+    """
+    LCS length by dynamic programming over seq2 (the shorter sequence).
+
+    Only the previous DP row is kept, so memory is O(len(seq2)) instead of a
+    full (m+1) x (n+1) table. With numba installed, tokens are interned to
+    int32 IDs and the compiled kernel runs the same recurrence.
+    """
+    if njit is not None:
+        vocab: Dict[str, int] = {}
+        ids2 = np.fromiter(
+            (vocab.setdefault(token, len(vocab)) for token in seq2),
+            dtype=np.int32, count=len(seq2)
+        )
+        # Tokens absent from seq2 can never match; -1 is outside the vocab
+        ids1 = np.fromiter(
+            (vocab.get(token, -1) for token in seq1),
+            dtype=np.int32, count=len(seq1)
+        )
+        return int(_lcs_dp_kernel(ids1, ids2))
+
+    n = len(seq2)
+
+    # Rolling rows of the DP table
+    prev = array('i', bytes(4 * (n + 1)))
+    curr = array('i', bytes(4 * (n + 1)))
+
+    for x in seq1:
+        for j in range(1, n + 1):
+            if x == seq2[j - 1]:
+                curr[j] = prev[j - 1] + 1
+            elif prev[j] >= curr[j - 1]:
+                curr[j] = prev[j]
+            else:
+                curr[j] = curr[j - 1]
+        prev, curr = curr, prev
+
+    return prev[n]
+
+
+def _lcs_hunt_szymanski(seq1: List[str], positions: Dict[str, List[int]]) -> int:
+    """
+    LCS length by Hunt-Szymanski: O((r + m) log n) for r matching pairs.
+
+    Each token of seq1 contributes its match positions in the other sequence
+    (descending, so one token extends a subsequence at most once); the LCS is
+    the longest strictly increasing run of positions, found with patience
+    sorting on the smallest tail of each length.
+    """
+    tails: List[int] = []
+    for x in seq1:
+        for j in positions.get(x, ()):
+            k = bisect_left(tails, j)
+            if k == len(tails):
+                tails.append(j)
+            else:
+                tails[k] = j
+    return len(tails)
+
+
 class SummaryQualityManager:
     """Manager for assessing summary quality."""
 
@@ -26,7 +192,8 @@ class SummaryQualityManager:
         Calculate ROUGE scores for summary quality.
 
         ROUGE (Recall-Oriented Understudy for Gisting Evaluation) measures
-        n-gram overlap between summary and reference text.
+        n-gram overlap between summary and reference text. Results are
+        memoized per (summary, reference); each call gets its own copy.
 
         Args:
             summary: Generated summary text
@@ -36,6 +203,13 @@ class SummaryQualityManager:
             Dict with 'rouge1', 'rouge2', 'rougeL' keys, each containing
             'precision', 'recall', 'fmeasure' sub-keys
         """
+        scores = SummaryQualityManager._rouge_scores(summary, reference)
+        return {name: dict(values) for name, values in scores.items()}
+
+    @staticmethod
+    @_digest_lru_cache(maxsize=_SCORE_CACHE_SIZE)
+    def _rouge_scores(summary: str, reference: str) -> Dict[str, Dict[str, float]]:
+        """Compute ROUGE scores (cached; callers must not modify the result)."""
         if not summary or not reference:
             return {
                 'rouge1': {'precision': 0.0, 'recall': 0.0, 'fmeasure': 0.0},
@@ -44,8 +218,8 @@ class SummaryQualityManager:
             }
 
         # Tokenize (simple word-based tokenization)
-        summary_tokens = re.findall(r'\w+', summary.lower())
-        reference_tokens = re.findall(r'\w+', reference.lower())
+        summary_tokens = _WORD_RE.findall(summary.lower())
+        reference_tokens = _WORD_RE.findall(reference.lower())
 
         if not summary_tokens or not reference_tokens:
             return {
@@ -58,7 +232,7 @@ class SummaryQualityManager:
         summary_unigrams = Counter(summary_tokens)
         reference_unigrams = Counter(reference_tokens)
 
-        overlapping_unigrams = sum((summary_unigrams & reference_unigrams).values())
+        overlapping_unigrams = _clipped_overlap(summary_unigrams, reference_unigrams)
 
         if len(summary_tokens) > 0 and len(reference_tokens) > 0:
             rouge_1_precision = overlapping_unigrams / len(summary_tokens)
@@ -74,23 +248,18 @@ class SummaryQualityManager:
             rouge_1_fmeasure = 0.0
 
         # ROUGE-2: Bigram overlap
-        summary_bigrams = [
-            tuple(summary_tokens[i:i + 2])
-            for i in range(len(summary_tokens) - 1)
-        ]
-        reference_bigrams = [
-            tuple(reference_tokens[i:i + 2])
-            for i in range(len(reference_tokens) - 1)
-        ]
+        summary_bigram_total = len(summary_tokens) - 1
+        reference_bigram_total = len(reference_tokens) - 1
 
-        if summary_bigrams and reference_bigrams:
-            summary_bigrams_count = Counter(summary_bigrams)
-            reference_bigrams_count = Counter(reference_bigrams)
+        if summary_bigram_total > 0 and reference_bigram_total > 0:
+            # Bigrams are counted straight from zip, without a list of tuples
+            summary_bigrams_count = Counter(zip(summary_tokens, summary_tokens[1:]))
+            reference_bigrams_count = Counter(zip(reference_tokens, reference_tokens[1:]))
 
-            overlapping_bigrams = sum((summary_bigrams_count & reference_bigrams_count).values())
+            overlapping_bigrams = _clipped_overlap(summary_bigrams_count, reference_bigrams_count)
 
-            rouge_2_precision = overlapping_bigrams / len(summary_bigrams)
-            rouge_2_recall = overlapping_bigrams / len(reference_bigrams)
+            rouge_2_precision = overlapping_bigrams / summary_bigram_total
+            rouge_2_recall = overlapping_bigrams / reference_bigram_total
 
             if (rouge_2_precision + rouge_2_recall) > 0:
                 rouge_2_fmeasure = 2 * rouge_2_precision * rouge_2_recall / (rouge_2_precision + rouge_2_recall)
@@ -138,7 +307,11 @@ class SummaryQualityManager:
     @staticmethod
     def _lcs_length(seq1: List[str], seq2: List[str]) -> int:
         """
-        Calculate longest common subsequence length using dynamic programming.
+        Calculate longest common subsequence length.
+
+        Uses Hunt-Szymanski when matching token pairs are sparse (the usual
+        case for a summary against its article), falling back to dynamic
+        programming when they are dense.
 
         Args:
             seq1: First sequence (list of tokens)
@@ -147,20 +320,20 @@ class SummaryQualityManager:
         Returns:
             Length of LCS
         """
-        m, n = len(seq1), len(seq2)
+        if len(seq2) > len(seq1):
+            seq1, seq2 = seq2, seq1
 
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
+        # Positions of each token in the shorter sequence, descending
+        positions: Dict[str, List[int]] = {}
+        for j in range(len(seq2) - 1, -1, -1):
+            positions.setdefault(seq2[j], []).append(j)
 
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if seq1[i - 1] == seq2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1] + 1
-                else:
-                    dp[i][j] = max(dp[i - 1][j], dp[i][j - 1])
-
-        return dp[m][n]
+        matches = sum(len(positions.get(x, ())) for x in seq1)
+        if matches == 0:
+            return 0
+        if matches * _HS_MATCH_COST > len(seq1) * len(seq2):
+            return _lcs_dp(seq1, seq2)
+        return _lcs_hunt_szymanski(seq1, positions)
 
     @staticmethod
     def assess_coherence(text: str) -> float:
@@ -168,7 +341,8 @@ class SummaryQualityManager:
         Assess text coherence using simple heuristic metrics.
 
         Coherence measures how well sentences flow together. This implementation
-        uses sentence length consistency as a proxy for coherence.
+        uses sentence length consistency as a proxy for coherence. Results are
+        memoized per text.
 
         Args:
             text: Input text to assess
@@ -176,11 +350,17 @@ class SummaryQualityManager:
         Returns:
             Coherence score (0.0 to 1.0), where higher is better
         """
+        return SummaryQualityManager._coherence(text)
+
+    @staticmethod
+    @_digest_lru_cache(maxsize=_SCORE_CACHE_SIZE)
+    def _coherence(text: str) -> float:
+        """Compute the coherence score (cached)."""
         if not text or not text.strip():
             return 0.0
 
         # Split into sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = [s.strip() for s in _SENTENCE_END_RE.split(text) if s.strip()]
 
         if len(sentences) < 2:
             return 0.5  # Single sentence has moderate coherence
@@ -244,21 +424,29 @@ class SummaryQualityManager:
         """
         Calculate readability metrics (Flesch Reading Ease, etc.).
 
+        Results are memoized per text; each call gets its own copy.
+
         Args:
             text: Input text
 
         Returns:
             Dict with readability metrics
         """
+        return dict(SummaryQualityManager._readability(text))
+
+    @staticmethod
+    @_digest_lru_cache(maxsize=_SCORE_CACHE_SIZE)
+    def _readability(text: str) -> Dict[str, float]:
+        """Compute readability metrics (cached; callers must not modify the result)."""
         if not text or not text.strip():
             return {'flesch_reading_ease': 0.0, 'avg_sentence_length': 0.0, 'avg_word_length': 0.0}
 
         # Count sentences
-        sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        sentences = [s.strip() for s in _SENTENCE_END_RE.split(text) if s.strip()]
         num_sentences = len(sentences)
 
         # Count words
-        words = re.findall(r'\w+', text)
+        words = _WORD_RE.findall(text)
         num_words = len(words)
 
         # Count syllables (rough approximation)
@@ -311,6 +499,13 @@ class SummaryQualityManager:
         # Ensure at least 1 syllable
         return max(1, syllable_count)
 
+    @staticmethod
+    def clear_caches() -> None:
+        """Drop memoized ROUGE, coherence and readability results."""
+        SummaryQualityManager._rouge_scores.cache_clear()
+        SummaryQualityManager._coherence.cache_clear()
+        SummaryQualityManager._readability.cache_clear()
+
     @staticmethod
     def save_quality_metrics(article_id: int, metrics: Dict[str, Any], conn=None) -> bool:
         """
@@ -6,10 +6,18 @@ from sklearn.decomposition import LatentDirichletAllocation, NMF
 from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 import numpy as np
 
+from ._text import tokenize_words
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Document-term settings shared by LDA (counts) and NMF (TF-IDF)
+_VECTORIZER_KWARGS = {
+    'max_features': 1000,
+    'analyzer': tokenize_words,
+    'min_df': 1,
+}
+
 
 class TopicModelingManager:
     """Manager class for topic modeling operations."""
@@ -76,11 +84,7 @@ class TopicModelingManager:
                 texts.append(text)
 
             # Create document-term matrix
-            vectorizer = CountVectorizer(
-                max_features=1000,
-                stop_words='english',
-                min_df=1
-            )
+            vectorizer = CountVectorizer(**_VECTORIZER_KWARGS)
             doc_term_matrix = vectorizer.fit_transform(texts)
             feature_names = vectorizer.get_feature_names_out()
 
@@ -205,11 +209,7 @@ class TopicModelingManager:
                 texts.append(text)
 
             # Create TF-IDF matrix
-            vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words='english',
-                min_df=1
-            )
+            vectorizer = TfidfVectorizer(**_VECTORIZER_KWARGS)
             tfidf_matrix = vectorizer.fit_transform(texts)
             feature_names = vectorizer.get_feature_names_out()
 
@@ -7,7 +7,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from ..config import get_config
-from ..core.database import init_db, check_database_exists
+from ..core.database import init_db, check_database_exists, close_thread_connection
 from ..core.auth import cleanup_expired_sessions
 from ..utils.logging import get_logger
 from .middleware import RateLimitMiddleware, RequestLoggingMiddleware, ErrorHandlingMiddleware
@@ -48,6 +48,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down WebScrape-TUI API server...")
     cleanup_expired_sessions()
+    close_thread_connection()
     logger.info("API server shutdown complete")
 
 
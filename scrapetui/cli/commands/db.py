@@ -3,9 +3,11 @@
 
 import click
 import sys
-import shutil
+from pathlib import Path
 
-from ...core.database import init_db, check_database_exists, get_db_path
+from ...core.database import (
+    init_db, check_database_exists, get_db_path, copy_database, restore_database
+)
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -59,8 +61,8 @@ def backup(output):
 
         click.echo(f"Backing up database to {output}...")
 
-        # Copy database file
-        shutil.copy2(db_path, output)
+        # Snapshot via SQLite (includes committed pages still in the WAL)
+        copy_database(db_path, Path(output))
 
         click.echo(f"✓ Database backed up successfully to {output}")
 
@@ -90,13 +92,13 @@ def restore(input_file):
 
             # Backup current database
             backup_path = f"{db_path}.pre-restore-backup"
-            shutil.copy2(db_path, backup_path)
+            copy_database(db_path, Path(backup_path))
             click.echo(f"Current database backed up to {backup_path}")
 
         click.echo(f"Restoring database from {input_file}...")
 
-        # Copy backup file to database location
-        shutil.copy2(input_file, db_path)
+        # Copy backup file to database location (drops stale WAL sidecars)
+        restore_database(Path(input_file), db_path)
 
         click.echo(f"✓ Database restored successfully from {input_file}")
 
@@ -367,16 +367,9 @@ def export_excel(output, search, tag, date_from, date_to, user_id, sentiment, li
 
         init_db()
 
-        # Import ExcelExportManager from monolithic scrapetui.py
-        import importlib.util
-        from pathlib import Path as PathLib
-
-        scrapetui_path = PathLib(__file__).parent.parent.parent.parent / 'scrapetui.py'
-        spec = importlib.util.spec_from_file_location("scrapetui_monolith", scrapetui_path)
-        scrapetui_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(scrapetui_module)
-
-        ExcelExportManager = scrapetui_module.ExcelExportManager
+        # ExcelExportManager still lives in the monolithic scrapetui.py (explicit opt-in)
+        from ...legacy import load_legacy
+        ExcelExportManager = load_legacy().ExcelExportManager
 
         with click.progressbar(length=3, label='Exporting to Excel') as bar:
             # Step 1: Fetch articles
@@ -481,16 +474,9 @@ def export_pdf(output, search, tag, date_from, date_to, user_id, sentiment, limi
 
         init_db()
 
-        # Import PDFExportManager from monolithic scrapetui.py
-        import importlib.util
-        from pathlib import Path as PathLib
-
-        scrapetui_path = PathLib(__file__).parent.parent.parent.parent / 'scrapetui.py'
-        spec = importlib.util.spec_from_file_location("scrapetui_monolith", scrapetui_path)
-        scrapetui_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(scrapetui_module)
-
-        PDFExportManager = scrapetui_module.PDFExportManager
+        # PDFExportManager still lives in the monolithic scrapetui.py (explicit opt-in)
+        from ...legacy import load_legacy
+        PDFExportManager = load_legacy().PDFExportManager
 
         with click.progressbar(length=3, label='Exporting to PDF') as bar:
             # Step 1: Fetch articles
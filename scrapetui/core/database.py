@@ -1,15 +1,75 @@
 """Database connection and initialization."""
 
+import os
 import sqlite3
+import threading
 from pathlib import Path
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional, Tuple
 
 from ..utils.logging import get_logger
 from ..config import init_config
 
 # Lazy initialization - do not create logger at module level
 
+# Per-connection tuning: fewer fsyncs, mmap'd reads, in-memory temp b-trees
+# and a 64 MiB page cache (negative cache_size is in KiB).
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+)
+
+# One long-lived connection per thread (sqlite3 connections are bound to the
+# thread that created them), reused across get_db_connection() calls.
+_tls = threading.local()
+
+
+def _configure_connection(conn: sqlite3.Connection) -> None:
+    """
+    Apply WAL journaling and performance PRAGMAs to a new connection.
+
+    WAL lets readers (exports, tag lookups) run concurrently with writers
+    (scrape inserts) instead of serializing behind them.
+
+    Args:
+        conn: Freshly opened SQLite connection
+    """
+    conn.execute("PRAGMA journal_mode = WAL")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+
+
+def _db_file_identity(db_path: Path) -> Tuple[str, Optional[int]]:
+    """Path plus inode, so a deleted and re-created database gets a fresh connection."""
+    try:
+        return str(db_path), os.stat(db_path).st_ino
+    except OSError:
+        return str(db_path), None
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open and configure a new SQLite connection."""
+    # Python 3.12+ compatible: no automatic datetime conversion
+    # Datetime values stored as ISO strings, no adapters needed
+    conn = sqlite3.connect(str(db_path), cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    # Enable foreign key constraints (required for v2.0.0 multi-user support)
+    conn.execute("PRAGMA foreign_keys = ON")
+    _configure_connection(conn)
+    return conn
+
+
+def close_thread_connection() -> None:
+    """Close the calling thread's cached connection, if any (e.g. on shutdown)."""
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        conn.close()
+    _tls.conn = None
+    _tls.identity = None
+    _tls.depth = 0
+
 
 def get_db_path() -> Path:
     """Get database path from configuration."""
@@ -22,24 +82,35 @@ def get_db_connection() -> Generator[sqlite3.Connection, None, None]:
     """
     Get database connection with context manager.
 
+    The connection is cached per thread and reused by later calls against the
+    same database file, so open + PRAGMA setup is paid once per thread.
+    Work left uncommitted when the outermost block exits is rolled back,
+    matching the old close-on-exit behaviour.
+
     Yields:
         SQLite connection with row factory enabled
     """
     db_path = get_db_path()
     try:
-        # Python 3.12+ compatible: no automatic datetime conversion
-        # Datetime values stored as ISO strings, no adapters needed
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
-        # Enable foreign key constraints (required for v2.0.0 multi-user support)
-        conn.execute("PRAGMA foreign_keys = ON")
-        yield conn
+        conn = getattr(_tls, "conn", None)
+        if not getattr(_tls, "depth", 0):
+            identity = _db_file_identity(db_path)
+            if conn is None or identity != _tls.identity or identity[1] is None:
+                close_thread_connection()
+                conn = _open_connection(db_path)
+                _tls.conn = conn
+                _tls.identity = _db_file_identity(db_path)
+        _tls.depth = getattr(_tls, "depth", 0) + 1
+        try:
+            yield conn
+        finally:
+            _tls.depth -= 1
+            if not _tls.depth and conn.in_transaction:
+                conn.rollback()
     except sqlite3.Error as e:
         logger = get_logger(__name__)
         logger.critical(f"DB connection error: {e}", exc_info=True)
         raise
-    finally:
-        conn.close()
 
 
 def init_db() -> bool:
@@ -78,6 +149,52 @@ def check_database_exists() -> bool:
     return get_db_path().exists()
 
 
+def copy_database(source: Path, dest: Path) -> None:
+    """
+    Snapshot a database file through SQLite's online backup API.
+
+    Unlike a raw file copy, this includes committed pages that still live in
+    the source's -wal file and never reads a half-written page.
+
+    Args:
+        source: Database file to copy
+        dest: Destination file (overwritten)
+    """
+    src_conn = sqlite3.connect(str(source))
+    try:
+        dest_conn = sqlite3.connect(str(dest))
+        try:
+            src_conn.backup(dest_conn)
+        finally:
+            dest_conn.close()
+    finally:
+        src_conn.close()
+
+
+def restore_database(backup_file: Path, db_path: Optional[Path] = None) -> None:
+    """
+    Replace the database file with a backup.
+
+    The calling thread's cached connection is closed and the -wal/-shm
+    sidecars are removed first; left in place, SQLite would replay the old
+    WAL over the restored file.
+
+    Args:
+        backup_file: Backup to restore from
+        db_path: Database to overwrite (default: configured database)
+    """
+    import shutil
+
+    if db_path is None:
+        db_path = get_db_path()
+    close_thread_connection()
+    for suffix in ("-wal", "-shm"):
+        sidecar = Path(f"{db_path}{suffix}")
+        if sidecar.exists():
+            sidecar.unlink()
+    shutil.copy2(backup_file, db_path)
+
+
 def backup_database(backup_suffix: str = "backup") -> Path:
     """
     Create backup of database.
@@ -88,7 +205,6 @@ def backup_database(backup_suffix: str = "backup") -> Path:
     Returns:
         Path to backup file
     """
-    import shutil
     from datetime import datetime
 
     db_path = get_db_path()
@@ -98,7 +214,7 @@ def backup_database(backup_suffix: str = "backup") -> Path:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = db_path.with_suffix(f".{backup_suffix}-{timestamp}")
 
-    shutil.copy2(db_path, backup_path)
+    copy_database(db_path, backup_path)
     logger = get_logger(__name__)
     logger.info(f"Database backed up to: {backup_path}")
 
@@ -1,13 +1,13 @@
 """Database migration management for WebScrape-TUI."""
 
 import sqlite3
-import shutil
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 from ..utils.logging import get_logger
 from ..core.auth import hash_password
+from ..core.database import copy_database
 
 logger = get_logger(__name__)
 
@@ -48,7 +48,7 @@ def create_backup(db_path: Path, version_label: str = "backup") -> Path:
     backup_path = db_path.parent / f"{db_path.name}.{version_label}-{timestamp}"
 
     logger.info(f"Creating backup: {backup_path}")
-    shutil.copy2(db_path, backup_path)
+    copy_database(db_path, backup_path)
 
     return backup_path
 
@@ -249,6 +249,9 @@ CREATE INDEX IF NOT EXISTS idx_url ON scraped_data (url);
 CREATE INDEX IF NOT EXISTS idx_timestamp ON scraped_data (timestamp);
 CREATE INDEX IF NOT EXISTS idx_title ON scraped_data (title);
 CREATE INDEX IF NOT EXISTS idx_sentiment ON scraped_data (sentiment);
+CREATE INDEX IF NOT EXISTS idx_title_nocase ON scraped_data (title COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_url_nocase ON scraped_data (url COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_sentiment_timestamp ON scraped_data (sentiment, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_scraped_data_user_id ON scraped_data(user_id);
 
 CREATE INDEX IF NOT EXISTS idx_tag_name ON tags (name);
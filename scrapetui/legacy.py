@@ -0,0 +1,26 @@
+"""Explicit opt-in access to the monolithic scrapetui.py application.
+
+Importing the scrapetui package never executes the monolith: it loads
+Textual, scikit-learn, spaCy and friends, configures logging and writes a
+log file into the working directory. Code that still needs a class that only
+lives there (e.g. the Excel/PDF exporters) calls load_legacy() explicitly.
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+_legacy = None
+
+
+def load_legacy():
+    """Execute the root-level scrapetui.py once and return the module."""
+    global _legacy
+    if _legacy is None:
+        root_file = Path(__file__).parent.parent / "scrapetui.py"
+        spec = importlib.util.spec_from_file_location("_scrapetui_legacy", root_file)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["_scrapetui_legacy"] = module
+        spec.loader.exec_module(module)
+        _legacy = module
+    return _legacy
@@ -9,6 +9,8 @@ import pytest
 import json
 from datetime import datetime
 from scrapetui import QuestionAnsweringManager
+from scrapetui.ai import question_answering
+from scrapetui.ai.question_answering import _QA_HISTORY_DDL
 
 
 @pytest.fixture
@@ -73,7 +75,7 @@ class TestSingleArticleQA:
     def test_answer_question_single_article(self, single_article, mocker):
         """Test answering question from single article."""
         # Mock AI provider
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(get_summary=lambda *args,
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(get_summary=lambda *args,
                      ** kwargs: "Climate change is caused primarily by human activities like burning fossil fuels."))
 
         question = "What causes climate change?"
@@ -87,7 +89,7 @@ class TestSingleArticleQA:
 
     def test_source_attribution_single_article(self, single_article, mocker):
         """Test that source is properly attributed."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Renewable energy is a key solution."
         ))
 
@@ -105,7 +107,7 @@ class TestSingleArticleQA:
 
     def test_no_ai_provider(self, single_article, mocker):
         """Test Q&A when AI provider is not configured."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=None)
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=None)
 
         question = "Test question?"
         result = QuestionAnsweringManager.answer_question(question, single_article)
@@ -121,7 +123,7 @@ class TestMultiArticleSynthesis:
     def test_answer_from_multiple_articles(self, sample_articles, mocker):
         """Test synthesizing answer from multiple articles."""
         mocker.patch(
-            'scrapetui.get_ai_provider',
+            'scrapetui.get_ai_provider', create=True,
             return_value=mocker.Mock(
                 get_summary=lambda *args,
                 **kwargs: "Python is used for web development (Django, Flask) and machine learning (scikit-learn, TensorFlow)."))
@@ -146,7 +148,7 @@ class TestMultiArticleSynthesis:
             captured_prompt = prompt
             return "Synthesized answer from multiple sources."
 
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=mock_summary
         ))
 
@@ -168,7 +170,7 @@ class TestMultiArticleSynthesis:
             'url': f'http://example.com/{i}'
         } for i in range(1, 6)]
 
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Answer"
         ))
 
@@ -192,7 +194,7 @@ class TestMultiArticleSynthesis:
             'url': f'http://example.com/{i}'
         } for i in range(1, 20)]
 
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Answer"
         ))
 
@@ -311,13 +313,105 @@ class TestConversationHistoryTracking:
             # Questions should be in reverse order (2, 1, 0)
             assert history[0]['question'] == "Question 2"
 
+    def test_history_table_recreated_with_database(self, tmp_path):
+        """A database re-created at the same path gets its qa_history table again."""
+        import sqlite3
+
+        db_file = tmp_path / "qa.db"
+        for _ in range(2):
+            conn = sqlite3.connect(str(db_file))
+            conn.row_factory = sqlite3.Row
+            assert QuestionAnsweringManager.save_qa_conversation(
+                "Q?", "A.", [1], 0.5, conn=conn
+            )
+            assert len(QuestionAnsweringManager.get_qa_history(conn=conn)) == 1
+            conn.close()
+            db_file.unlink()
+
+    def test_save_conversations_batch(self, tmp_path):
+        """Several conversations are saved together with one commit."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "qa.db"))
+        conn.row_factory = sqlite3.Row
+        conversations = [
+            ("Q1?", "A1.", [1], 0.9),
+            ("Q2?", "A2.", [2, 3], 0.5),
+            ("Q3?", "A3.", [], 0.1),
+        ]
+
+        assert QuestionAnsweringManager.save_qa_conversations(conversations, conn=conn)
+
+        rows = conn.execute(
+            "SELECT question, answer, article_ids, confidence, created_at FROM qa_history ORDER BY id"
+        ).fetchall()
+        assert [(r[0], r[1], json.loads(r[2]), r[3]) for r in rows] == conversations
+        assert len({r['created_at'] for r in rows}) == 1
+        assert not conn.in_transaction
+        conn.close()
+
+    def test_save_conversations_without_commit(self, tmp_path):
+        """With commit=False the caller's rollback discards the whole batch."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "qa.db"))
+        assert QuestionAnsweringManager.save_qa_conversations(
+            [("Q1?", "A1.", [1], 0.9), ("Q2?", "A2.", [2], 0.5)], conn=conn, commit=False
+        )
+        assert conn.in_transaction
+        conn.rollback()
+
+        assert conn.execute("SELECT COUNT(*) FROM qa_history").fetchone()[0] == 0
+        conn.close()
+
+    def test_save_conversations_reports_failure(self, tmp_path):
+        """A database error is logged and reported as False."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "qa.db"))
+        conn.close()
+        assert QuestionAnsweringManager.save_qa_conversations([("Q?", "A.", [1], 0.5)], conn=conn) is False
+
+    def test_iter_history_streams_newest_first(self, tmp_path):
+        """iter_qa_history yields decoded rows lazily, newest first."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "qa.db"))
+        conn.row_factory = sqlite3.Row
+        conn.execute(_QA_HISTORY_DDL)
+        for i in range(5):
+            conn.execute(
+                "INSERT INTO qa_history (question, answer, article_ids, confidence, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (f"Q{i}?", f"A{i}.", json.dumps([i, i + 1]), 0.5, f"2024-01-0{i + 1}T00:00:00")
+            )
+        conn.commit()
+
+        history = QuestionAnsweringManager.iter_qa_history(limit=3, conn=conn)
+        first = next(history)
+        assert first['question'] == "Q4?"
+        assert first['article_ids'] == [4, 5]
+        assert [item['question'] for item in history] == ["Q3?", "Q2?"]
+        conn.close()
+
+    def test_iter_history_raises_database_errors(self, tmp_path):
+        """Unlike get_qa_history, iter_qa_history leaves errors to the caller."""
+        import sqlite3
+
+        conn = sqlite3.connect(str(tmp_path / "qa.db"))
+        conn.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            list(QuestionAnsweringManager.iter_qa_history(conn=conn))
+        assert QuestionAnsweringManager.get_qa_history(conn=conn) == []
+
 
 class TestSourceAttribution:
     """Tests for source citation in answers."""
 
     def test_source_article_ids(self, sample_articles, mocker):
         """Test that source article IDs are tracked."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Python is versatile."
         ))
 
@@ -335,7 +429,7 @@ class TestSourceAttribution:
 
     def test_source_includes_title_and_url(self, sample_articles, mocker):
         """Test that sources include title and URL."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Answer with sources."
         ))
 
@@ -352,7 +446,7 @@ class TestSourceAttribution:
 
     def test_confidence_score(self, sample_articles, mocker):
         """Test that confidence score is included."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Confident answer."
         ))
 
@@ -371,7 +465,7 @@ class TestEdgeCases:
 
     def test_empty_question(self, sample_articles, mocker):
         """Test with empty question."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Response to empty question."
         ))
 
@@ -383,7 +477,7 @@ class TestEdgeCases:
 
     def test_no_articles(self, mocker):
         """Test Q&A with no articles."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "No articles available."
         ))
 
@@ -395,7 +489,7 @@ class TestEdgeCases:
 
     def test_articles_without_content(self, mocker):
         """Test with articles that have no content."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "No content available."
         ))
 
@@ -412,7 +506,7 @@ class TestEdgeCases:
 
     def test_very_long_question(self, sample_articles, mocker):
         """Test with very long question."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Answer to long question."
         ))
 
@@ -424,7 +518,7 @@ class TestEdgeCases:
 
     def test_special_characters_in_question(self, sample_articles, mocker):
         """Test with special characters in question."""
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=lambda *args, **kwargs: "Answer with special chars."
         ))
 
@@ -439,7 +533,7 @@ class TestEdgeCases:
         def failing_summary(*args, **kwargs):
             raise Exception("AI provider error")
 
-        mocker.patch('scrapetui.get_ai_provider', return_value=mocker.Mock(
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
             get_summary=failing_summary
         ))
 
@@ -449,3 +543,94 @@ class TestEdgeCases:
         # Should return error message
         assert 'answer' in result
         assert 'error' in result['answer'].lower() or result['confidence'] == 0
+
+
+class TestAsyncAnswering:
+    """Tests for answer_question_async."""
+
+    @pytest.mark.asyncio
+    async def test_async_matches_sync(self, sample_articles, mocker):
+        """The async variant returns what answer_question returns."""
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
+            get_summary=lambda *args, **kwargs: "Python is a programming language."
+        ))
+
+        question = "What is Python?"
+        result = await QuestionAnsweringManager.answer_question_async(question, sample_articles, top_n=2)
+
+        assert result == QuestionAnsweringManager.answer_question(question, sample_articles, top_n=2)
+
+    @pytest.mark.asyncio
+    async def test_async_runs_off_event_loop(self, sample_articles, mocker):
+        """The provider call runs in a worker thread, not the loop's thread."""
+        import threading
+
+        provider_threads = []
+
+        def get_summary(*args, **kwargs):
+            provider_threads.append(threading.current_thread())
+            return "Answer."
+
+        mocker.patch('scrapetui.get_ai_provider', create=True, return_value=mocker.Mock(
+            get_summary=get_summary
+        ))
+
+        result = await QuestionAnsweringManager.answer_question_async("What is Flask?", sample_articles)
+
+        assert result['answer'] == "Answer."
+        assert provider_threads and provider_threads[0] is not threading.current_thread()
+
+
+class TestRetrievalCache:
+    """Tests for the cached TF-IDF ranking behind answer_question."""
+
+    TEXTS = [
+        "Python is a programming language.",
+        "Tomatoes grow best in full sun.",
+        "Django is a Python web framework.",
+    ]
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        """Start every test with no cached rankings."""
+        monkeypatch.setattr(question_answering, '_retrieval_cache', type(question_answering._retrieval_cache)())
+
+    def test_repeat_question_reuses_ranking(self, monkeypatch):
+        """The same (question, corpus, top_n) returns the cached arrays."""
+        similarities, indices = QuestionAnsweringManager._retrieve("python framework", self.TEXTS, 3)
+        assert [int(i) for i in indices][:2] == [2, 0]
+
+        def no_fit(*args, **kwargs):
+            raise AssertionError("ranking was recomputed")
+
+        monkeypatch.setattr(QuestionAnsweringManager, '_fit_corpus', no_fit)
+        again = QuestionAnsweringManager._retrieve("python framework", list(self.TEXTS), 3)
+
+        assert again[0] is similarities and again[1] is indices
+
+    def test_cached_arrays_read_only(self):
+        """Shared rankings cannot be modified by a caller."""
+        similarities, indices = QuestionAnsweringManager._retrieve("python", self.TEXTS, 3)
+
+        with pytest.raises(ValueError):
+            similarities[0] = 1.0
+        with pytest.raises(ValueError):
+            indices[0] = 1
+
+    def test_cache_keyed_by_question_corpus_and_top_n(self):
+        """A different question, corpus or top_n is ranked afresh."""
+        QuestionAnsweringManager._retrieve("python", self.TEXTS, 3)
+        QuestionAnsweringManager._retrieve("tomatoes", self.TEXTS, 3)
+        QuestionAnsweringManager._retrieve("python", self.TEXTS[:2], 3)
+        QuestionAnsweringManager._retrieve("python", self.TEXTS, 1)
+        QuestionAnsweringManager._retrieve("python", list(self.TEXTS), 3)
+
+        assert len(question_answering._retrieval_cache) == 4
+
+    def test_cache_bounded(self, monkeypatch):
+        """The least recently used ranking is evicted beyond the cache size."""
+        monkeypatch.setattr(question_answering, '_RETRIEVAL_CACHE_SIZE', 2)
+        for question in ("python", "django", "tomatoes"):
+            QuestionAnsweringManager._retrieve(question, self.TEXTS, 3)
+
+        assert [key[0] for key in question_answering._retrieval_cache] == ["django", "tomatoes"]
@@ -5,8 +5,12 @@ Tests ROUGE score calculation, coherence evaluation,
 and quality metrics.
 """
 
+import random
+
+import numpy as np
 import pytest
 from scrapetui import SummaryQualityManager
+from scrapetui.ai.summary_quality import _lcs_dp, _lcs_dp_kernel, _lcs_hunt_szymanski
 
 
 @pytest.fixture
@@ -430,3 +434,111 @@ class TestEdgeCases:
         except Exception:
             # Acceptable if non-English not supported
             pass
+
+
+class TestScoreCaching:
+    """Tests for memoized ROUGE, coherence and readability scoring."""
+
+    def test_keyword_arguments_accepted(self):
+        """Public scoring methods keep accepting keyword arguments."""
+        text = "First sentence here. Second sentence follows."
+
+        assert SummaryQualityManager.assess_coherence(text=text) == \
+            SummaryQualityManager.assess_coherence(text)
+        assert SummaryQualityManager.calculate_rouge_scores(summary=text, reference=text)['rouge1']['fmeasure'] == 1.0
+        assert SummaryQualityManager.calculate_readability(text=text) == \
+            SummaryQualityManager.calculate_readability(text)
+
+    def test_cached_result_reused(self):
+        """Repeat scoring of the same texts returns the memoized result."""
+        SummaryQualityManager.clear_caches()
+        summary, reference = "Cats sleep a lot.", "Cats sleep a lot during the day."
+
+        first = SummaryQualityManager._rouge_scores(summary, reference)
+        assert SummaryQualityManager._rouge_scores(summary, reference) is first
+        # Equal text in a different object hits the same entry
+        assert SummaryQualityManager._rouge_scores("".join(summary), reference[:]) is first
+
+        # Callers get copies, so mutating one cannot poison the cache
+        scores = SummaryQualityManager.calculate_rouge_scores(summary, reference)
+        scores['rouge1']['fmeasure'] = -1.0
+        assert first['rouge1']['fmeasure'] > 0
+
+    def test_clear_caches_empties_caches(self):
+        """clear_caches() drops every memoized result."""
+        text = "One sentence. Another sentence."
+        rouge = SummaryQualityManager._rouge_scores(text, text)
+        readability = SummaryQualityManager._readability(text)
+        SummaryQualityManager._coherence(text)
+
+        SummaryQualityManager.clear_caches()
+
+        assert SummaryQualityManager._rouge_scores(text, text) is not rouge
+        assert SummaryQualityManager._readability(text) is not readability
+        assert SummaryQualityManager._rouge_scores(text, text) == rouge
+
+
+def _naive_lcs(seq1, seq2):
+    """Reference LCS length from the full (m+1) x (n+1) table."""
+    table = [[0] * (len(seq2) + 1) for _ in range(len(seq1) + 1)]
+    for i, x in enumerate(seq1, 1):
+        for j, y in enumerate(seq2, 1):
+            if x == y:
+                table[i][j] = table[i - 1][j - 1] + 1
+            else:
+                table[i][j] = max(table[i - 1][j], table[i][j - 1])
+    return table[-1][-1]
+
+
+def _random_pairs(vocab_size, count=50, seed=7):
+    """Token sequence pairs of varying length over a small vocabulary."""
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(vocab_size)]
+    for _ in range(count):
+        yield ([rng.choice(vocab) for _ in range(rng.randint(0, 40))],
+               [rng.choice(vocab) for _ in range(rng.randint(0, 40))])
+
+
+class TestLCSLength:
+    """Tests for the ROUGE-L longest common subsequence."""
+
+    def test_rolling_row_dp_matches_full_table(self):
+        """The two-row DP agrees with the full-table DP."""
+        for seq1, seq2 in _random_pairs(vocab_size=5):
+            assert _lcs_dp(seq1, seq2) == _naive_lcs(seq1, seq2)
+
+    def test_known_lcs(self):
+        """Classic example: LCS of ABCBDAB and BDCABA has length 4."""
+        assert SummaryQualityManager._lcs_length(list("ABCBDAB"), list("BDCABA")) == 4
+        assert SummaryQualityManager._lcs_length([], ["a"]) == 0
+
+    def test_rouge_l_uses_lcs(self):
+        """ROUGE-L precision and recall are LCS over each side's length."""
+        scores = SummaryQualityManager.calculate_rouge_scores(
+            "the cat sat", "the big cat sat down"
+        )
+        assert scores['rougeL']['precision'] == 1.0
+        assert scores['rougeL']['recall'] == 0.6
+
+    def test_hunt_szymanski_matches_dp(self):
+        """Hunt-Szymanski agrees with the DP on sparse and dense inputs."""
+        for vocab_size in (3, 50):
+            for seq1, seq2 in _random_pairs(vocab_size):
+                positions = {}
+                for j in range(len(seq2) - 1, -1, -1):
+                    positions.setdefault(seq2[j], []).append(j)
+                assert _lcs_hunt_szymanski(seq1, positions) == _naive_lcs(seq1, seq2)
+
+    @pytest.mark.parametrize("vocab_size", [2, 1000])
+    def test_dispatch_matches_dp(self, vocab_size):
+        """_lcs_length is exact on both its DP (dense) and HS (sparse) paths."""
+        for seq1, seq2 in _random_pairs(vocab_size):
+            assert SummaryQualityManager._lcs_length(seq1, seq2) == _naive_lcs(seq1, seq2)
+
+    def test_id_kernel_matches_dp(self):
+        """The int32 kernel (numba-compiled when installed) agrees with the DP."""
+        for seq1, seq2 in _random_pairs(vocab_size=4):
+            vocab = {}
+            ids2 = np.array([vocab.setdefault(t, len(vocab)) for t in seq2], dtype=np.int32)
+            ids1 = np.array([vocab.get(t, -1) for t in seq1], dtype=np.int32)
+            assert int(_lcs_dp_kernel(ids1, ids2)) == _naive_lcs(seq1, seq2)
@@ -1,12 +1,56 @@
 #!/usr/bin/env python3
 """Tests for Duplicate Detection in AI processors."""
 
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from scrapetui.ai import processors
 from scrapetui.ai.processors import (
     detect_duplicates,
     detect_duplicates_from_db
 )
 
 
+def _random_articles(count=60, seed=3):
+    """Articles whose titles and contents often nearly coincide."""
+    rng = random.Random(seed)
+    words = ['market', 'rally', 'storm', 'city', 'vote', 'new', 'rises', 'falls']
+    articles = []
+    for article_id in range(1, count + 1):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(1, 5)))
+        content = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+        articles.append({'id': article_id, 'title': title, 'content': content})
+    return articles
+
+
+def _pairwise_reference(articles, threshold, ratio):
+    """Plain all-pairs scan with the weighted title/content similarity."""
+    found = []
+    for i, first in enumerate(articles):
+        for second in articles[i + 1:]:
+            title_sim = ratio(first['title'], second['title'])
+            if first['content'] and second['content']:
+                similarity = 0.6 * title_sim + 0.4 * ratio(first['content'], second['content'])
+            else:
+                similarity = title_sim
+            if similarity >= threshold:
+                found.append((first['id'], second['id'], similarity))
+    return found
+
+
+def _difflib_ratio(a, b):
+    return SequenceMatcher(None, a, b).ratio()
+
+
+@pytest.fixture
+def no_rapidfuzz(monkeypatch):
+    """Force the difflib fallback."""
+    monkeypatch.setattr(processors, '_rapidfuzz', None)
+    monkeypatch.setattr(processors, '_rapidfuzz_process', None)
+
+
 class TestDuplicateDetection:
     """Test duplicate detection functionality."""
 
@@ -148,6 +192,21 @@ class TestDuplicateDetection:
         for dup in duplicates:
             assert 0.0 <= dup['similarity'] <= 1.0
 
+    def test_min_length_skips_short_articles(self):
+        """Articles shorter than min_length (title + content) are not compared."""
+        articles = [
+            {'id': 1, 'title': 'Hi', 'content': ''},
+            {'id': 2, 'title': 'Hi', 'content': ''},
+            {'id': 3, 'title': 'A longer headline', 'content': 'Body'},
+            {'id': 4, 'title': 'A longer headline', 'content': 'Body'},
+        ]
+
+        assert len(detect_duplicates(articles, threshold=0.9)) == 2
+        for method in ('fuzzy', 'tfidf'):
+            duplicates = detect_duplicates(articles, threshold=0.9, method=method, min_length=10)
+            assert [(d['article1_id'], d['article2_id']) for d in duplicates] == [(3, 4)]
+        assert detect_duplicates(articles, threshold=0.9, min_length=1000) == []
+
     def test_duplicate_pair_structure(self):
         """Test structure of duplicate pair results."""
         articles = [
@@ -167,6 +226,143 @@ class TestDuplicateDetection:
             assert isinstance(dup['similarity'], float)
 
 
+class TestDuplicateSweep:
+    """Test that pruned scans report exactly what a plain pairwise scan would."""
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95])
+    def test_length_sweep_matches_pairwise_scan(self, no_rapidfuzz, threshold):
+        """The title-length sweep loses no pairs and keeps input order."""
+        articles = _random_articles()
+        found = [
+            (d['article1_id'], d['article2_id'], d['similarity'])
+            for d in detect_duplicates(articles, threshold=threshold)
+        ]
+        expected = _pairwise_reference(articles, threshold, _difflib_ratio)
+
+        assert [f[:2] for f in found] == [e[:2] for e in expected]
+        assert [f[2] for f in found] == pytest.approx([e[2] for e in expected])
+
+    @pytest.mark.parametrize("threshold", [0.5, 0.85])
+    def test_rapidfuzz_matches_pairwise_scan(self, threshold):
+        """With rapidfuzz, pairs and scores follow its InDel ratio."""
+        fuzz = pytest.importorskip("rapidfuzz.fuzz")
+        articles = _random_articles()
+        found = [
+            (d['article1_id'], d['article2_id'], d['similarity'])
+            for d in detect_duplicates(articles, threshold=threshold)
+        ]
+        expected = _pairwise_reference(
+            articles, threshold, lambda a, b: fuzz.ratio(a, b) / 100.0
+        )
+
+        assert [f[:2] for f in found] == [e[:2] for e in expected]
+        assert [f[2] for f in found] == pytest.approx([e[2] for e in expected])
+
+    def test_cdist_blocks_match_sweep(self, monkeypatch):
+        """Scoring titles in small cdist blocks agrees with the pairwise sweep."""
+        pytest.importorskip("rapidfuzz")
+        articles = _random_articles()
+        whole = detect_duplicates(articles, threshold=0.6)
+
+        # A few rows per cdist call, so pairs straddle block boundaries
+        monkeypatch.setattr(processors, '_CDIST_BLOCK_CELLS', 200)
+        blocked = detect_duplicates(articles, threshold=0.6)
+        monkeypatch.setattr(processors, '_rapidfuzz_process', None)
+        swept = detect_duplicates(articles, threshold=0.6)
+
+        assert blocked == whole
+        assert [(d['article1_id'], d['article2_id']) for d in swept] == \
+            [(d['article1_id'], d['article2_id']) for d in whole]
+        assert [d['similarity'] for d in swept] == \
+            pytest.approx([d['similarity'] for d in whole])
+
+
+class TestSimilarityBounds:
+    """Test the length bound and the cutoff short-circuit of ratio calls."""
+
+    PAIRS = [
+        ("breaking news", "breaking news today"),
+        ("abc", "xyz"),
+        ("storm hits city", "city storm"),
+        ("", "title"),
+    ]
+
+    def test_length_bound_is_upper_bound(self):
+        """No ratio exceeds 2*min(len)/(len1 + len2)."""
+        fuzz = pytest.importorskip("rapidfuzz.fuzz")
+        for a, b in self.PAIRS:
+            bound = processors._length_bound(len(a), len(b))
+            assert _difflib_ratio(a, b) <= bound + 1e-9
+            assert fuzz.ratio(a, b) / 100.0 <= bound + 1e-9
+        assert processors._length_bound(0, 0) == 1.0
+
+    @pytest.mark.parametrize("use_rapidfuzz", [True, False])
+    def test_cutoff_only_zeroes_low_ratios(self, monkeypatch, use_rapidfuzz):
+        """Ratios at or above the cutoff are exact; those below read 0.0."""
+        if not use_rapidfuzz:
+            monkeypatch.setattr(processors, '_rapidfuzz', None)
+        for a, b in self.PAIRS:
+            exact = processors._text_ratio(a, b)
+            assert processors._text_ratio(a, b, exact) == pytest.approx(exact)
+            if exact > 0:
+                assert processors._text_ratio(a, b, exact + 0.01) == 0.0
+
+
+class TestTfidfDuplicates:
+    """Test method='tfidf' (word n-gram cosine similarity)."""
+
+    ARTICLES = [
+        {'id': 1, 'title': 'Storm hits coastal city',
+         'content': 'Heavy rain and wind flooded streets across the coastal city overnight.'},
+        {'id': 2, 'title': 'Coastal city hit by storm',
+         'content': 'Heavy rain and wind flooded streets across the coastal city overnight.'},
+        {'id': 3, 'title': 'Election results announced',
+         'content': 'Voters elected a new council after a close campaign.'},
+        {'id': 4, 'title': '', 'content': ''},
+    ]
+
+    def test_tfidf_finds_reworded_duplicates(self):
+        """Shared wording scores high regardless of word order."""
+        duplicates = detect_duplicates(self.ARTICLES, threshold=0.7, method='tfidf')
+
+        assert [(d['article1_id'], d['article2_id']) for d in duplicates] == [(1, 2)]
+        assert 0.7 <= duplicates[0]['similarity'] <= 1.0
+
+    def test_tfidf_identical_texts_score_one(self):
+        """Identical texts have cosine similarity 1."""
+        articles = [dict(self.ARTICLES[0], id=1), dict(self.ARTICLES[0], id=2)]
+        duplicates = detect_duplicates(articles, threshold=0.99, method='tfidf')
+
+        assert duplicates[0]['similarity'] == pytest.approx(1.0, abs=1e-5)
+
+    def test_tfidf_matches_dense_cosine(self, monkeypatch):
+        """Blocked sparse products give the same pairs as a dense matrix."""
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        monkeypatch.setattr(processors, '_TFIDF_BLOCK_ROWS', 7)
+
+        articles = _random_articles(count=30)
+        texts = [f"{a['title']} {a['content']}".strip() for a in articles]
+        vectorizer = processors.TfidfVectorizer(
+            analyzer=processors._word_analyzer((1, 2)), sublinear_tf=True
+        )
+        dense = cosine_similarity(vectorizer.fit_transform(texts))
+        expected = [
+            (articles[i]['id'], articles[j]['id'])
+            for i in range(len(articles)) for j in range(i + 1, len(articles))
+            if dense[i, j] >= 0.4 - 1e-6
+        ]
+
+        found = detect_duplicates(articles, threshold=0.4, method='tfidf')
+        assert [(d['article1_id'], d['article2_id']) for d in found] == expected
+
+    def test_tfidf_stop_words_only(self):
+        """An empty vocabulary yields no pairs instead of an error."""
+        articles = [{'id': 1, 'title': 'the and', 'content': ''},
+                    {'id': 2, 'title': 'and the', 'content': ''}]
+        assert detect_duplicates(articles, method='tfidf') == []
+
+
 class TestDuplicateDetectionFromDB:
     """Test duplicate detection from database."""
 
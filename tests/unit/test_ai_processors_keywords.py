@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """Tests for Keyword Extraction in AI processors."""
 
+import sqlite3
+
+import pytest
+
+from scrapetui.ai import processors
 from scrapetui.ai.processors import (
     extract_keywords,
-    extract_keywords_from_articles
+    extract_keywords_corpus,
+    extract_keywords_from_articles,
+    extract_keywords_streaming
 )
 
 
@@ -134,6 +141,137 @@ class TestKeywordExtraction:
         assert all(isinstance(kw['keyword'], str) for kw in keywords)
 
 
+class TestCorpusKeywordExtraction:
+    """Test keyword extraction with one vectorizer fitted across texts."""
+
+    TEXTS = [
+        "Report: python tutorial covers python decorators and generators.",
+        "Report: gardening guide covers tomatoes, compost and watering.",
+        "Report: rust guide covers ownership, borrowing and lifetimes.",
+    ]
+
+    def test_corpus_results_parallel_to_texts(self):
+        """One keyword list per input text, each ranked by score."""
+        results = extract_keywords_corpus(self.TEXTS + [""], top_n=4)
+
+        assert len(results) == 4
+        assert results[3] == []
+        for keywords in results[:3]:
+            assert 0 < len(keywords) <= 4
+            scores = [kw['score'] for kw in keywords]
+            assert scores == sorted(scores, reverse=True)
+
+    def test_corpus_idf_demotes_shared_terms(self):
+        """Terms present in every text rank below terms distinctive to one."""
+        results = extract_keywords_corpus(self.TEXTS, top_n=50, ngram_range=(1, 1))
+        scores = {kw['keyword']: kw['score'] for kw in results[0]}
+
+        assert scores['python'] > scores['report']
+        assert scores['decorators'] > scores['covers']
+
+    def test_corpus_empty(self):
+        """No texts, no results."""
+        assert extract_keywords_corpus([]) == []
+
+
+class TestCorpusVectorizerCache:
+    """Test the persisted (joblib) corpus TF-IDF vectorizer."""
+
+    @pytest.fixture
+    def corpus_conn(self, tmp_path, monkeypatch):
+        """File-backed database with a few articles and an empty cache dir."""
+        monkeypatch.setattr(processors, '_TFIDF_CACHE_DIR', tmp_path / 'cache')
+        monkeypatch.setattr(processors, '_corpus_vectorizer', None)
+        conn = sqlite3.connect(str(tmp_path / 'corpus.db'))
+        conn.execute("CREATE TABLE scraped_data (id INTEGER PRIMARY KEY, title TEXT, content TEXT, summary TEXT)")
+        conn.executemany(
+            "INSERT INTO scraped_data (title, content) VALUES (?, ?)",
+            [("Python", "Python decorators and generators."),
+             ("Garden", "Tomatoes need compost and watering.")]
+        )
+        conn.commit()
+        yield conn
+        conn.close()
+
+    def test_vectorizer_persisted_and_reloaded(self, corpus_conn, monkeypatch):
+        """A new process loads the dumped vectorizer instead of refitting."""
+        signature = processors._corpus_signature(corpus_conn)
+        fitted = processors._get_corpus_vectorizer(corpus_conn, signature)
+        cache_file = processors._tfidf_cache_path(signature[0])
+        assert cache_file.exists()
+        assert [p.name for p in cache_file.parent.iterdir()] == [cache_file.name]
+
+        # Simulate a fresh process: nothing in memory, fitting forbidden
+        monkeypatch.setattr(processors, '_corpus_vectorizer', None)
+
+        def no_fit(self, *args, **kwargs):
+            raise AssertionError("vectorizer was refitted")
+
+        monkeypatch.setattr(processors.TfidfVectorizer, 'fit', no_fit)
+        loaded = processors._get_corpus_vectorizer(corpus_conn, signature)
+
+        assert loaded is not fitted
+        assert list(loaded.get_feature_names_out()) == list(fitted.get_feature_names_out())
+
+    def test_vectorizer_kept_in_memory(self, corpus_conn):
+        """Repeat lookups with the same signature reuse the loaded vectorizer."""
+        signature = processors._corpus_signature(corpus_conn)
+        first = processors._get_corpus_vectorizer(corpus_conn, signature)
+        assert processors._get_corpus_vectorizer(corpus_conn, signature) is first
+
+    def test_vectorizer_refitted_when_corpus_changes(self, corpus_conn):
+        """Adding an article changes the signature and the vocabulary."""
+        signature = processors._corpus_signature(corpus_conn)
+        old = processors._get_corpus_vectorizer(corpus_conn, signature)
+
+        corpus_conn.execute(
+            "INSERT INTO scraped_data (title, content) VALUES ('Rust', 'Ownership and borrowing.')"
+        )
+        corpus_conn.commit()
+        new_signature = processors._corpus_signature(corpus_conn)
+        new = processors._get_corpus_vectorizer(corpus_conn, new_signature)
+
+        assert new_signature != signature
+        assert 'ownership' in new.vocabulary_
+        assert 'ownership' not in old.vocabulary_
+
+
+class TestStreamingKeywordExtraction:
+    """Test hashed, batched keyword extraction."""
+
+    TEXTS = [
+        "Python programming for data science and machine learning.",
+        "Rust programming gives memory safety without garbage collection.",
+        "",
+        "Gardening tips: tomatoes need sun, water and patience.",
+    ]
+
+    def test_streaming_matches_across_batch_sizes(self):
+        """Batching does not change the result."""
+        whole = extract_keywords_streaming(self.TEXTS, top_n=5, batch_size=100)
+        batched = extract_keywords_streaming(self.TEXTS, top_n=5, batch_size=1)
+
+        assert whole == batched
+        assert len(whole) == len(self.TEXTS)
+        assert whole[2] == []
+
+    def test_streaming_names_real_terms(self):
+        """Hashed features are mapped back to the text's own terms."""
+        results = extract_keywords_streaming(self.TEXTS, top_n=3, ngram_range=(1, 1))
+
+        assert {kw['keyword'] for kw in results[3]} <= {
+            'gardening', 'tips', 'tomatoes', 'need', 'sun', 'water', 'patience'}
+
+    def test_streaming_requires_reiterable(self):
+        """A one-shot iterator is rejected, since texts are read twice."""
+        with pytest.raises(TypeError):
+            extract_keywords_streaming(iter(self.TEXTS))
+
+    def test_streaming_empty(self):
+        """No texts, no results."""
+        assert extract_keywords_streaming([]) == []
+
+
 class TestKeywordExtractionFromArticles:
     """Test extracting keywords from database articles."""
 
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Tests for core.database connection handling and backup/restore helpers."""
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from scrapetui.config import reset_config
+from scrapetui.core.database import (
+    close_thread_connection,
+    copy_database,
+    get_db_connection,
+    restore_database
+)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """Point the configured database at a fresh file with one table."""
+    path = tmp_path / "conn.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+
+    monkeypatch.setenv('DATABASE_PATH', str(path))
+    monkeypatch.delenv('SCRAPETUI_DB_PATH', raising=False)
+    reset_config()
+    close_thread_connection()
+
+    yield path
+
+    close_thread_connection()
+    reset_config()
+
+
+def _count(path: Path) -> int:
+    """Row count seen by an independent connection."""
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestConnectionReuse:
+    """Test the thread-local connection cache."""
+
+    def test_same_thread_reuses_connection(self, db_path):
+        """Sequential blocks on one thread get the same connection."""
+        with get_db_connection() as first:
+            pass
+        with get_db_connection() as second:
+            pass
+
+        assert first is second
+
+    def test_connection_is_configured(self, db_path):
+        """Cached connections use WAL and Row results."""
+        with get_db_connection() as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            assert conn.row_factory is sqlite3.Row
+
+    def test_other_thread_gets_own_connection(self, db_path):
+        """Each thread gets its own connection (sqlite3 objects are thread-bound)."""
+        with get_db_connection() as main_conn:
+            pass
+
+        seen = []
+
+        def worker():
+            with get_db_connection() as conn:
+                seen.append(conn)
+                conn.execute("SELECT 1").fetchone()
+            close_thread_connection()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert len(seen) == 1
+        assert seen[0] is not main_conn
+
+    def test_recreated_file_gets_new_connection(self, db_path):
+        """A database deleted and re-created at the same path is reopened."""
+        with get_db_connection() as first:
+            pass
+        close_thread_connection()
+        for suffix in ("", "-wal", "-shm"):
+            sidecar = Path(f"{db_path}{suffix}")
+            if sidecar.exists():
+                sidecar.unlink()
+
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("CREATE TABLE other (id INTEGER PRIMARY KEY)")
+        conn.commit()
+        conn.close()
+
+        with get_db_connection() as second:
+            tables = {row[0] for row in second.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+
+        assert second is not first
+        assert tables == {'other'}
+
+
+class TestTransactionDepth:
+    """Test rollback of uncommitted work on the outermost exit."""
+
+    def test_uncommitted_work_rolled_back(self, db_path):
+        """Leaving the outermost block without commit discards the insert."""
+        with get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('lost')")
+            assert conn.in_transaction
+
+        assert not conn.in_transaction
+        assert _count(db_path) == 0
+
+    def test_committed_work_kept(self, db_path):
+        """Committed rows survive the block exit."""
+        with get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('kept')")
+            conn.commit()
+
+        assert _count(db_path) == 1
+
+    def test_nested_block_shares_transaction(self, db_path):
+        """An inner block neither rolls back nor opens a new connection."""
+        with get_db_connection() as outer:
+            outer.execute("INSERT INTO items (name) VALUES ('a')")
+            with get_db_connection() as inner:
+                assert inner is outer
+                inner.execute("INSERT INTO items (name) VALUES ('b')")
+            # Still pending after the inner exit
+            assert outer.in_transaction
+            outer.commit()
+
+        assert _count(db_path) == 2
+
+    def test_nested_uncommitted_rolled_back_once_outermost_exits(self, db_path):
+        """Work from an inner block is rolled back only when the outer one exits."""
+        with get_db_connection() as outer:
+            with get_db_connection() as inner:
+                inner.execute("INSERT INTO items (name) VALUES ('pending')")
+            assert outer.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+        assert _count(db_path) == 0
+
+    def test_exception_rolls_back_and_resets_depth(self, db_path):
+        """An exception in the block rolls back and leaves the cache usable."""
+        with pytest.raises(RuntimeError):
+            with get_db_connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('boom')")
+                raise RuntimeError("boom")
+
+        assert _count(db_path) == 0
+        with get_db_connection() as again:
+            again.execute("INSERT INTO items (name) VALUES ('ok')")
+            again.commit()
+        assert again is conn
+        assert _count(db_path) == 1
+
+
+class TestBackupRestore:
+    """Test copy_database/restore_database."""
+
+    def test_copy_includes_wal_pages(self, db_path, tmp_path):
+        """Committed rows still in the -wal file are part of the copy."""
+        with get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('in-wal')")
+            conn.commit()
+            backup = tmp_path / "backup.db"
+            copy_database(db_path, backup)
+
+        assert _count(backup) == 1
+
+    def test_restore_drops_wal_sidecars(self, db_path, tmp_path):
+        """Restoring removes the old -wal/-shm so they are not replayed."""
+        backup = tmp_path / "backup.db"
+        copy_database(db_path, backup)
+
+        with get_db_connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('after-backup')")
+            conn.commit()
+        assert os.path.exists(f"{db_path}-wal")
+
+        restore_database(backup, db_path)
+
+        assert not os.path.exists(f"{db_path}-wal")
+        assert not os.path.exists(f"{db_path}-shm")
+        assert _count(db_path) == 0
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Tests for the tag filter, export queries and CSV export of the TUI."""
+
+import asyncio
+import csv
+import gzip
+import os
+import sqlite3
+import stat
+import threading
+import types
+
+import pytest
+
+from scrapetui.legacy import load_legacy
+
+_tui = load_legacy()
+
+# title -> tags
+_ARTICLES = {
+    'Python news': ['python', 'news'],
+    'Python tips': ['python'],
+    'Rust news': ['rust', 'news'],
+    'Untagged': [],
+}
+
+
+@pytest.fixture
+def tagged_db(tmp_path, monkeypatch):
+    """Initialized TUI database with a few tagged articles."""
+    db_path = tmp_path / "tui.db"
+    monkeypatch.setattr(_tui, 'DB_PATH', db_path)
+    assert _tui.init_db()
+
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    for i, (title, tags) in enumerate(_ARTICLES.items()):
+        cur = conn.execute(
+            "INSERT INTO scraped_data (url, title, link, timestamp, user_id) "
+            "VALUES (?, ?, ?, ?, 1)",
+            ('https://example.com', title, f'https://example.com/{i}', f'2024-01-0{i + 1} 12:00:00')
+        )
+        for tag in tags:
+            conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag,))
+            conn.execute(
+                "INSERT INTO article_tags (article_id, tag_id) "
+                "SELECT ?, id FROM tags WHERE name = ?",
+                (cur.lastrowid, tag)
+            )
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _titles_matching(conn, tag_names, match_all):
+    cond, params = _tui.build_tag_filter_condition(tag_names, match_all=match_all)
+    rows = conn.execute(f"SELECT sd.title FROM scraped_data sd WHERE {cond}", params)
+    return {row[0] for row in rows}
+
+
+class TestTagFilter:
+    """Test build_tag_filter_condition's ANY/ALL matching."""
+
+    def test_all_requires_every_tag(self, tagged_db):
+        """AND logic keeps only articles carrying all tags."""
+        assert _titles_matching(tagged_db, ['python', 'news'], True) == {'Python news'}
+
+    def test_any_matches_one_tag(self, tagged_db):
+        """OR logic keeps articles carrying at least one tag."""
+        assert _titles_matching(tagged_db, ['python', 'news'], False) == {
+            'Python news', 'Python tips', 'Rust news'}
+
+    def test_duplicate_tags_ignored(self, tagged_db):
+        """Repeated tag names do not make AND logic unsatisfiable."""
+        assert _titles_matching(tagged_db, ['python', 'python'], True) == {
+            'Python news', 'Python tips'}
+
+    def test_unknown_tag(self, tagged_db):
+        """A tag nobody has matches nothing under either logic."""
+        assert _titles_matching(tagged_db, ['python', 'missing'], True) == set()
+        assert _titles_matching(tagged_db, ['missing'], False) == set()
+
+    def test_sql_independent_of_tag_count(self):
+        """The tag list is bound as one parameter, so the SQL text is shared."""
+        one, _ = _tui.build_tag_filter_condition(['a'], match_all=True)
+        three, params = _tui.build_tag_filter_condition(['a', 'b', 'c'], match_all=True)
+        assert one == three
+        assert params == {'tags': '["a", "b", "c"]'}
+
+
+class TestExportQuery:
+    """Test build_export_query's SQL and parameters."""
+
+    def test_rows_carry_their_tags(self, tagged_db):
+        """Every article is exported once with its comma-joined tags."""
+        sql, params = _tui.build_export_query('', '', '', '', '', 'sd.id ASC')
+        rows = tagged_db.execute(sql, params).fetchall()
+
+        tags = {row[1]: set(row[7].split(',')) if row[7] else set() for row in rows}
+        assert tags == {title: set(names) for title, names in _ARTICLES.items()}
+
+    def test_tag_filter_uses_all_logic(self, tagged_db):
+        """The export tag filter matches articles with every listed tag."""
+        sql, params = _tui.build_export_query('', '', '', 'News, python', '', 'sd.id ASC')
+        rows = tagged_db.execute(sql, params).fetchall()
+
+        assert [row[1] for row in rows] == ['Python news']
+
+    def test_params_only_for_set_filters(self):
+        """Unset filters contribute no parameters."""
+        _, params = _tui.build_export_query('', '', '', '', '', 'sd.id ASC')
+        assert params == {}
+
+        _, params = _tui.build_export_query('py', 'example', '2024-01-01', 'A, b, a', ' positive ',
+                                            'sd.id ASC')
+        assert params == {
+            'tf': '%py%',
+            'uf': '%example%',
+            'df': '2024-01-01',
+            'tags': '["a", "b"]',
+            'sf': '%Positive%',
+        }
+
+    def test_listing_order_uses_index(self, tagged_db):
+        """Sorting by timestamp walks the index rather than a temp b-tree."""
+        sql, params = _tui.build_export_query('', '', '', '', '', 'sd.timestamp DESC')
+        plan = " ".join(row[3] for row in tagged_db.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+        assert 'TEMP B-TREE' not in plan
+
+
+class _ExportHost:
+    """The attributes _export_csv_worker reads from the app."""
+
+    SORT_OPTIONS = [("sd.id ASC", "ID Asc")]
+    current_sort_index = 0
+    title_filter = url_filter = date_filter = tags_filter = sentiment_filter = ""
+    _current_export_cancel = None
+
+    def __init__(self):
+        self.notices = []
+
+    def _toggle_loading(self, loading):
+        pass
+
+    def notify(self, message, **kwargs):
+        self.notices.append(message)
+
+
+def _run_csv_export(filename):
+    host = _ExportHost()
+    asyncio.run(_tui.WebScraperApp._export_csv_worker(host, str(filename)))
+    return host
+
+
+class TestCsvExport:
+    """Test the CSV export worker's file handling."""
+
+    def test_export_writes_rows_with_tags(self, tagged_db, tmp_path):
+        """All rows land in the target file, with no temp file left behind."""
+        target = tmp_path / "out.csv"
+        _run_csv_export(target)
+
+        with open(target, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert rows[0][-1] == 'Tags'
+        assert [row[1] for row in rows[1:]] == list(_ARTICLES)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+
+    def test_gzip_export(self, tagged_db, tmp_path):
+        """A .gz filename produces a gzip-compressed CSV."""
+        target = tmp_path / "out.csv.gz"
+        _run_csv_export(target)
+
+        with gzip.open(target, 'rt', newline='', encoding='utf-8') as f:
+            assert len(list(csv.reader(f))) == len(_ARTICLES) + 1
+
+    def test_new_file_follows_umask(self, tagged_db, tmp_path):
+        """A new export gets the mode open() would give it, not 0600."""
+        old_umask = os.umask(0o022)
+        try:
+            target = tmp_path / "out.csv"
+            _run_csv_export(target)
+        finally:
+            os.umask(old_umask)
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+    def test_overwrite_keeps_existing_mode(self, tagged_db, tmp_path):
+        """Re-exporting over a file keeps that file's permissions."""
+        target = tmp_path / "out.csv"
+        target.write_text("old")
+        target.chmod(0o640)
+
+        _run_csv_export(target)
+
+        assert stat.S_IMODE(target.stat().st_mode) == 0o640
+        assert target.read_text(encoding='utf-8').startswith('ID,')
+
+    def test_cancelled_export_leaves_no_file(self, tagged_db, tmp_path, monkeypatch):
+        """A cancelled export removes its temp file and tells the user."""
+        class _SetEvent(threading.Event):
+            def __init__(self):
+                super().__init__()
+                self.set()
+
+        monkeypatch.setattr(_tui, 'threading', types.SimpleNamespace(Event=_SetEvent))
+        target = tmp_path / "out.csv"
+
+        host = _run_csv_export(target)
+
+        assert not target.exists()
+        assert not [name for name in os.listdir(tmp_path) if name.endswith('.tmp')]
+        assert any('cancelled' in notice for notice in host.notices)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Tests for the scrapetui package's lazily resolved exports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import scrapetui
+
+_REPO_ROOT = Path(__file__).parent.parent.parent
+
+
+def _run(code: str) -> str:
+    """Run code in a fresh interpreter (so nothing is preloaded) and return stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=_REPO_ROOT, capture_output=True, text=True, timeout=300
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip().splitlines()[-1]
+
+
+class TestPackageExports:
+    """Test that no export is a silent None placeholder."""
+
+    def test_import_does_not_load_monolith(self):
+        """Importing the package leaves the TUI and its dependencies unloaded."""
+        out = _run(
+            "import sys, scrapetui; "
+            "print('_scrapetui_legacy' in sys.modules, 'textual' in sys.modules)"
+        )
+        assert out == "False False"
+
+    def test_legacy_names_resolve_to_real_objects(self):
+        """Names still living in scrapetui.py resolve to the monolith's objects."""
+        out = _run(
+            "from scrapetui import AITaggingManager, get_ai_provider; "
+            "print(AITaggingManager.__module__, callable(get_ai_provider))"
+        )
+        assert out == "_scrapetui_legacy True"
+
+    def test_no_none_exports(self):
+        """No name listed in __all__ is a None placeholder."""
+        for name in scrapetui.__all__:
+            assert getattr(scrapetui, name) is not None, name
+
+    def test_unknown_name_raises(self):
+        """Unknown attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            scrapetui.NoSuchManager